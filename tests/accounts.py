@@ -0,0 +1,113 @@
+"""
+Account Pool for RavenCode Frontend Test Suite
+Registers disposable accounts through the API in parallel before a run and hands each
+one to a single test, across threads and worker processes, through claim files. Each
+run seeds its own pool directory, so concurrent runs on one checkout never share one
+"""
+
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from api_client import ApiError, register
+from test_data.users import generate_test_user
+from config import ACCOUNTS_DIR, ACCOUNT_POOL_SIZE, ACCOUNT_SEED_CONCURRENCY
+
+
+# Environment variable naming the run's pool directory (inherited by worker processes)
+POOL_DIR_VARIABLE = 'ACCOUNT_POOL_DIR'
+POOL_FILE = 'pool.jsonl'
+CLAIMS_SUBDIR = 'claims'
+
+
+def register_account():
+    """Register one fresh account through the API; returns (user, error message or None)"""
+    user = generate_test_user()
+    try:
+        register(user)
+    except ApiError as e:
+        return user, str(e)
+    return user, None
+
+
+def current_pool_dir():
+    """This run's pool directory, or None when the run seeded no pool"""
+    return os.environ.get(POOL_DIR_VARIABLE) or None
+
+
+def remove_pool(directory):
+    """Delete a run's pool and claims once the run is over (a pool only lives for the run that seeded it)"""
+    shutil.rmtree(directory, ignore_errors=True)
+    if current_pool_dir() == directory:
+        del os.environ[POOL_DIR_VARIABLE]
+
+
+def seed_accounts(logger, count=None, concurrency=None, run_name=None):
+    """Register count accounts in parallel into a pool of this run's own; returns the pool directory
+
+    The directory (under ACCOUNTS_DIR, named after run_name) is published to worker processes
+    through ACCOUNT_POOL_DIR.
+    """
+    count = ACCOUNT_POOL_SIZE if count is None else count
+    concurrency = max(1, min(concurrency or ACCOUNT_SEED_CONCURRENCY, count or 1))
+    directory = os.path.join(ACCOUNTS_DIR, run_name or f"accounts_{os.getpid()}")
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(os.path.join(directory, CLAIMS_SUBDIR))
+
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(lambda _: register_account(), range(count)))
+    elapsed = time.time() - start_time
+
+    created = [user for user, error in outcomes if error is None]
+    errors = [error for _, error in outcomes if error is not None]
+    with open(os.path.join(directory, POOL_FILE), 'w', encoding='utf-8') as stream:
+        for user in created:
+            stream.write(json.dumps(user, ensure_ascii=False) + "\n")
+    os.environ[POOL_DIR_VARIABLE] = directory
+
+    logger.add_log(
+        f"Account pool: {len(created)}/{count} accounts registered through the API in {elapsed:.2f}s "
+        f"({concurrency} at a time)",
+        "WARN" if errors else "INFO"
+    )
+    if errors:
+        logger.add_log(f"Account seeding failed for {len(errors)} accounts (first error: {errors[0]})", "WARN")
+    return directory
+
+
+def _claim(directory, email, purpose):
+    """Atomically mark a pooled account as taken; False when another test got there first"""
+    try:
+        descriptor = os.open(
+            os.path.join(directory, CLAIMS_SUBDIR, f"{email}.claim"), os.O_CREAT | os.O_EXCL | os.O_WRONLY
+        )
+    except FileExistsError:
+        return False
+    with os.fdopen(descriptor, 'w', encoding='utf-8') as stream:
+        stream.write(f"{os.getpid()} {purpose or ''}\n")
+    return True
+
+
+def claim_account(purpose=None):
+    """An account no other test of the run uses: (user, pooled)
+
+    Draws from the seeded pool and registers through the API once the pool is spent
+    (or was never seeded); raises ApiError when that registration fails.
+    """
+    directory = current_pool_dir()
+    pool_path = os.path.join(directory, POOL_FILE) if directory else None
+    if pool_path and os.path.exists(pool_path):
+        os.makedirs(os.path.join(directory, CLAIMS_SUBDIR), exist_ok=True)
+        with open(pool_path, encoding='utf-8') as stream:
+            for line in stream:
+                user = json.loads(line)
+                if _claim(directory, user['email'], purpose):
+                    return user, True
+
+    user, error = register_account()
+    if error is not None:
+        raise ApiError(f"Could not register an account for {purpose or 'a test'}: {error}")
+    return user, False
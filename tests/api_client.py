@@ -0,0 +1,65 @@
+"""
+Backend API Client for RavenCode Frontend Test Suite
+Calls the user API directly, with the same request shapes as src/services/authService.ts
+"""
+
+import json
+import urllib.error
+import urllib.request
+
+from config import USER_API_URL, API_TIMEOUT
+
+
+# Fields Register.tsx sends to authService.register
+REGISTER_FIELDS = ['nombre', 'email', 'password', 'fecha_de_nacimiento', 'institucion_educativa', 'grado_academico']
+
+class ApiError(Exception):
+    """Raised when a backend call fails or returns an error status"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def request_json(method, url, payload=None, token=None, timeout=None):
+    """Send a JSON request and return the decoded JSON body"""
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f"Bearer {token}"
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+
+    request = urllib.request.Request(url, data=data, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout or API_TIMEOUT) as response:
+            body = response.read()
+    except urllib.error.HTTPError as e:
+        try:
+            detail = json.loads(e.read() or b'{}').get('detail')
+        except ValueError:
+            detail = None
+        raise ApiError(f"{method} {url} failed: {detail or e.reason}", status=e.code)
+    except (urllib.error.URLError, OSError) as e:
+        raise ApiError(f"{method} {url} failed: {str(e)}")
+
+    return json.loads(body) if body else {}
+
+
+def login(email, password):
+    """POST /auth/login, returning the token payload (access_token, refresh_token)"""
+    token = request_json('POST', f"{USER_API_URL}/auth/login", {'email': email, 'password': password})
+    if not token.get('access_token'):
+        raise ApiError("Login response did not include an access token")
+    return token
+
+
+def register(user):
+    """POST /auth/register with the fields Register.tsx sends"""
+    return request_json('POST', f"{USER_API_URL}/auth/register", {field: user[field] for field in REGISTER_FIELDS})
+
+
+def get_current_user(access_token):
+    """GET /users/me, unwrapped the way userService.handleResponse does"""
+    result = request_json('GET', f"{USER_API_URL}/users/me", token=access_token)
+    if isinstance(result, dict) and 'data' in result:
+        return result['data']
+    return result
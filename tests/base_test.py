@@ -3,125 +3,266 @@ Base Test Class for RavenCode Frontend Test Suite
 Contains common utilities and setup for all tests
 """
 
-import time
-import os
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+import json
+from urllib.parse import urlsplit
 from test_logger import TestLogger
+from waits import PageWaiter
+from timing import step_span, timed_test, current_test
+from screenshots import screenshot_writer
+from network import capture_enabled, enable_performance_log, log_page_network
+from api_client import ApiError, login as api_login, get_current_user
+from accounts import claim_account, current_pool_dir
 from config import (
     BASE_URL, DEFAULT_TIMEOUT, HEADLESS, WINDOW_WIDTH, WINDOW_HEIGHT,
-    SCREENSHOTS_DIR, UI_ELEMENTS, SUCCESS_MESSAGES, ERROR_MESSAGES
+    UI_ELEMENTS, SUCCESS_MESSAGES, ERROR_MESSAGES,
+    FAST_LOGIN, TOKEN_STORAGE_KEYS, STORAGE_SEED_PATH
 )
 
 
+_chromedriver_path = None
+
+# Evaluates a list of [type, value] locators in the page and returns one boolean per locator
+ELEMENTS_PRESENT_SCRIPT = """
+return arguments[0].map(function (locator) {
+    var type = locator[0], value = locator[1];
+    if (type === 'id') { return document.getElementById(value) !== null; }
+    if (type === 'class') { return document.getElementsByClassName(value).length > 0; }
+    return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+        .singleNodeValue !== null;
+});
+"""
+
+
+def create_chrome_driver(headless=None):
+    """Launch a configured Chrome WebDriver, resolving chromedriver only once per process"""
+    global _chromedriver_path
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+    
+    options = Options()
+    if HEADLESS if headless is None else headless:
+        options.add_argument('--headless')
+    options.add_argument(f'--window-size={WINDOW_WIDTH},{WINDOW_HEIGHT}')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    network_capture = capture_enabled()
+    if network_capture:
+        enable_performance_log(options)
+    
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    service = Service(_chromedriver_path)
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.set_window_size(WINDOW_WIDTH, WINDOW_HEIGHT)
+    if network_capture:
+        driver.execute_cdp_cmd('Network.enable', {})
+    driver.network_capture = network_capture
+    return driver
+
+
+def reset_browser_context(driver):
+    """Wipe cookies, the app origin's storage, the HTTP cache and service workers, then park on about:blank"""
+    from selenium.common.exceptions import WebDriverException
+    
+    base_url = urlsplit(BASE_URL)
+    origin = f"{base_url.scheme}://{base_url.netloc}"
+    # sessionStorage belongs to the tab, not the origin's storage: clear it before leaving the app
+    driver.execute_script("if (window.location.origin === arguments[0]) { window.sessionStorage.clear(); }", origin)
+    try:
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+    except (AttributeError, WebDriverException):
+        # Not a Chromium session: cookies and web storage of the current page only
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    driver.get("about:blank")
+
+
 class BaseTest:
     """Base test class with common functionality"""
     
-    def __init__(self, logger=None):
+    # Log in through the API instead of the /login form (suites testing the form opt out)
+    use_fast_login = FAST_LOGIN
+    
+    def __init_subclass__(cls, **kwargs):
+        """Time every test_* method of a suite as a top-level span"""
+        super().__init_subclass__(**kwargs)
+        for name, member in list(vars(cls).items()):
+            if name.startswith('test_') and callable(member):
+                setattr(cls, name, timed_test(f"{cls.__name__}.{name}", member))
+        
+    def __init__(self, logger=None, driver_pool=None):
         self.logger = logger or TestLogger()
+        self.driver_pool = driver_pool
         self.driver = None
         self.wait = None
+        self._waiter = None
         
     def setup_driver(self):
-        """Setup Chrome WebDriver"""
-        options = Options()
-        if HEADLESS:
-            options.add_argument('--headless')
-        options.add_argument(f'--window-size={WINDOW_WIDTH},{WINDOW_HEIGHT}')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--disable-extensions')
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
-        self.driver.set_window_size(WINDOW_WIDTH, WINDOW_HEIGHT)
+        """Setup Chrome WebDriver (leased from the driver pool when one is provided)"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        if self.driver_pool:
+            self.attach_driver(self.driver_pool.acquire())
+            self.logger.add_log("WebDriver leased from pool", "INFO")
+            return
+            
+        self.driver = create_chrome_driver()
         self.wait = WebDriverWait(self.driver, DEFAULT_TIMEOUT)
         
         self.logger.add_log("WebDriver setup completed", "INFO")
         
+    def attach_driver(self, driver):
+        """Reuse a WebDriver owned by someone else (e.g. a parallel worker)"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        self.driver = driver
+        self.wait = WebDriverWait(self.driver, DEFAULT_TIMEOUT)
+        
     def teardown_driver(self):
-        """Cleanup WebDriver"""
-        if self.driver:
+        """Cleanup WebDriver (returned to the driver pool when one is provided)"""
+        if not self.driver:
+            return
+            
+        if self.driver_pool:
+            self.driver_pool.release(self.driver)
+            self.logger.add_log("WebDriver returned to pool", "INFO")
+        else:
             self.driver.quit()
             self.logger.add_log("WebDriver closed", "INFO")
+        self.driver = None
             
+    def reset_context(self):
+        """Give the next test a clean browser context on the same Chrome session (a new session if the reset fails)"""
+        try:
+            with step_span(self.logger, 'reset'):
+                reset_browser_context(self.driver)
+            return True
+        except Exception as e:
+            self.logger.add_log(f"Browser context reset failed, replacing the session: {str(e)}", "WARN")
+            self.teardown_driver()
+            self.setup_driver()
+            return False
+            
+    @property
+    def waiter(self):
+        """Readiness waits bound to the current driver"""
+        if self._waiter is None or self._waiter.driver is not self.driver:
+            self._waiter = PageWaiter(self.driver)
+        return self._waiter
+        
+    def wait_until_ready(self, previous_url=None, timeout=None, react_idle=True):
+        """Wait for route change (if previous_url given), document ready, network and React idle
+
+        react_idle=False skips the DOM quiet period on pages that re-render forever.
+        """
+        with step_span(self.logger, 'wait_ready'):
+            ready = self.waiter.wait_until_ready(previous_url=previous_url, timeout=timeout, react_idle=react_idle)
+        if not ready:
+            self.logger.add_log(f"Page not fully settled after readiness timeout ({self.driver.current_url})", "WARN")
+        return ready
+        
+    def click_and_wait(self, element, expect_route_change=False, timeout=None, label=None):
+        """Click an element and wait for the page to settle instead of sleeping"""
+        with step_span(self.logger, 'click', label=label):
+            previous_url = self.driver.current_url if expect_route_change else None
+            element.click()
+            return self.wait_until_ready(previous_url=previous_url, timeout=timeout)
+        
     def navigate_to(self, path):
-        """Navigate to a specific path"""
+        """Navigate to a specific path (recording its requests when network capture is on)"""
         url = f"{BASE_URL}{path}"
-        self.driver.get(url)
-        time.sleep(1)  # Allow page to load
+        network_capture = getattr(self.driver, 'network_capture', False)
+        if network_capture:
+            # Reading the performance log clears it: drop traffic from before this navigation
+            self.driver.get_log('performance')
+        with step_span(self.logger, 'navigate', path=path):
+            self.driver.get(url)
+            self.wait_until_ready()
         self.logger.add_log(f"Navigated to {url}", "INFO")
+        if network_capture:
+            log_page_network(self.logger, path, self.driver.get_log('performance'), current_test())
         
     def take_screenshot(self, name):
-        """Take a screenshot"""
+        """Take a screenshot; encoding and storage happen on the screenshot writer thread"""
         if not self.driver:
             return None
             
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{name}_{timestamp}.png"
-        filepath = os.path.join(SCREENSHOTS_DIR, filename)
-        
         try:
-            self.driver.save_screenshot(filepath)
-            self.logger.add_log(f"Screenshot saved: {filename}", "INFO")
-            return filepath
+            png = self.driver.get_screenshot_as_png()
         except Exception as e:
             self.logger.add_log(f"Failed to take screenshot: {str(e)}", "FAIL")
             return None
+        
+        test = current_test()
+        capture_id = screenshot_writer().submit(png, name, test)
+        self.logger.add_record({'kind': 'screenshot', 'id': capture_id, 'name': name, 'test': test})
+        self.logger.add_log(f"Screenshot captured: {name}", "INFO")
+        return capture_id
             
     def wait_for_element(self, locator_type, locator_value, timeout=None):
         """Wait for element to be present"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         timeout = timeout or DEFAULT_TIMEOUT
-        try:
-            if locator_type == "id":
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.ID, locator_value))
-                )
-            elif locator_type == "xpath":
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.XPATH, locator_value))
-                )
-            elif locator_type == "class":
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, locator_value))
-                )
-            else:
-                raise ValueError(f"Unsupported locator type: {locator_type}")
+        with step_span(self.logger, 'wait_for_element', locator=locator_type):
+            try:
+                if locator_type == "id":
+                    element = WebDriverWait(self.driver, timeout).until(
+                        EC.presence_of_element_located((By.ID, locator_value))
+                    )
+                elif locator_type == "xpath":
+                    element = WebDriverWait(self.driver, timeout).until(
+                        EC.presence_of_element_located((By.XPATH, locator_value))
+                    )
+                elif locator_type == "class":
+                    element = WebDriverWait(self.driver, timeout).until(
+                        EC.presence_of_element_located((By.CLASS_NAME, locator_value))
+                    )
+                else:
+                    raise ValueError(f"Unsupported locator type: {locator_type}")
                 
-            return element
-        except Exception as e:
-            self.logger.add_log(f"Element not found: {locator_type}='{locator_value}' - {str(e)}", "FAIL")
-            return None
+                return element
+            except Exception as e:
+                self.logger.add_log(f"Element not found: {locator_type}='{locator_value}' - {str(e)}", "FAIL")
+                return None
             
     def wait_for_clickable(self, locator_type, locator_value, timeout=None):
         """Wait for element to be clickable"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         timeout = timeout or DEFAULT_TIMEOUT
-        try:
-            if locator_type == "id":
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.element_to_be_clickable((By.ID, locator_value))
-                )
-            elif locator_type == "xpath":
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.element_to_be_clickable((By.XPATH, locator_value))
-                )
-            else:
-                raise ValueError(f"Unsupported locator type: {locator_type}")
+        with step_span(self.logger, 'wait_for_clickable', locator=locator_type):
+            try:
+                if locator_type == "id":
+                    element = WebDriverWait(self.driver, timeout).until(
+                        EC.element_to_be_clickable((By.ID, locator_value))
+                    )
+                elif locator_type == "xpath":
+                    element = WebDriverWait(self.driver, timeout).until(
+                        EC.element_to_be_clickable((By.XPATH, locator_value))
+                    )
+                else:
+                    raise ValueError(f"Unsupported locator type: {locator_type}")
                 
-            return element
-        except Exception as e:
-            self.logger.add_log(f"Element not clickable: {locator_type}='{locator_value}' - {str(e)}", "FAIL")
-            return None
+                return element
+            except Exception as e:
+                self.logger.add_log(f"Element not clickable: {locator_type}='{locator_value}' - {str(e)}", "FAIL")
+                return None
             
     def find_element_safely(self, locator_type, locator_value):
         """Find element without throwing exception"""
+        from selenium.webdriver.common.by import By
+        
         try:
             if locator_type == "id":
                 return self.driver.find_element(By.ID, locator_value)
@@ -134,31 +275,69 @@ class BaseTest:
         except Exception:
             return None
             
+    def check_elements_present(self, locators, timeout=0, minimum=None):
+        """Check many (locator_type, locator_value) pairs in one browser round trip
+        
+        Returns a presence map keyed by locator. With a timeout, polls until at least
+        `minimum` locators (default: all) are present or the timeout expires.
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        locators = [tuple(locator) for locator in locators]
+        for locator_type, _ in locators:
+            if locator_type not in ("id", "xpath", "class"):
+                raise ValueError(f"Unsupported locator type: {locator_type}")
+        minimum = len(locators) if minimum is None else minimum
+        
+        def probe():
+            try:
+                found = self.driver.execute_script(ELEMENTS_PRESENT_SCRIPT, [list(locator) for locator in locators])
+            except Exception as e:
+                self.logger.add_log(f"Batched element check failed: {str(e)}", "WARN")
+                found = [False] * len(locators)
+            return dict(zip(locators, found))
+        
+        presence = probe()
+        if timeout and sum(presence.values()) < minimum:
+            def enough(driver):
+                presence.update(probe())
+                return sum(presence.values()) >= minimum
+            try:
+                WebDriverWait(self.driver, timeout).until(enough)
+            except Exception:
+                pass
+        return presence
+        
     def scroll_to_element(self, element):
         """Scroll to element"""
         try:
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # Allow scroll to complete
+            self.waiter.wait_for_scroll_settled(element)
         except Exception as e:
             self.logger.add_log(f"Failed to scroll to element: {str(e)}", "WARN")
             
     def wait_for_toast_message(self, expected_message=None, timeout=10):
         """Wait for toast notification"""
-        try:
-            toast_element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((By.XPATH, "//*[contains(@class, 'react-hot-toast') or contains(@class, 'toaster')]"))
-            )
-            
-            if expected_message:
-                message_element = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.XPATH, f"//*[contains(text(), '{expected_message}')]"))
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        with step_span(self.logger, 'wait_for_toast'):
+            try:
+                toast_element = WebDriverWait(self.driver, timeout).until(
+                    EC.presence_of_element_located((By.XPATH, "//*[contains(@class, 'react-hot-toast') or contains(@class, 'toaster')]"))
                 )
-                return message_element.text
             
-            return toast_element.text
-        except Exception as e:
-            self.logger.add_log(f"Toast message not found: {str(e)}", "FAIL")
-            return None
+                if expected_message:
+                    message_element = WebDriverWait(self.driver, timeout).until(
+                        EC.presence_of_element_located((By.XPATH, f"//*[contains(text(), '{expected_message}')]"))
+                    )
+                    return message_element.text
+            
+                return toast_element.text
+            except Exception as e:
+                self.logger.add_log(f"Toast message not found: {str(e)}", "FAIL")
+                return None
             
     def check_page_load(self, expected_element_xpath, page_name):
         """Check if page loaded correctly"""
@@ -171,8 +350,64 @@ class BaseTest:
             self.take_screenshot(f"page_load_fail_{page_name}")
             return False
             
+    def get_test_account(self, purpose, fallback):
+        """A registered account for this test alone when the run seeded a pool, else the static fallback user
+
+        Once a seeded pool is spent, accounts are registered through the API; runs without
+        a pool never register accounts of their own.
+        """
+        if current_pool_dir() is None:
+            self.logger.add_log(f"No account pool seeded, using static account {fallback['email']} for {purpose}", "INFO")
+            return fallback
+        try:
+            account, pooled = claim_account(purpose)
+        except ApiError as e:
+            self.logger.add_log(str(e), "FAIL")
+            return None
+        source = "pooled" if pooled else "API-registered"
+        self.logger.add_log(f"Using {source} account {account['email']} for {purpose}", "INFO")
+        return account
+        
     def login_user(self, email, password, expect_success=True):
-        """Generic login function"""
+        """Generic login function (programmatic when fast login is enabled)"""
+        if expect_success and self.use_fast_login:
+            with step_span(self.logger, 'login', mode='api'):
+                logged_in = self.login_via_api(email, password)
+            if logged_in:
+                return True
+            self.logger.add_log("Programmatic login failed, falling back to the login form", "WARN")
+        with step_span(self.logger, 'login', mode='form'):
+            return self.login_via_form(email, password, expect_success)
+        
+    def login_via_api(self, email, password):
+        """Log in through /auth/login and inject the session the way TokenManager stores it"""
+        try:
+            token = api_login(email, password)
+            user_data = get_current_user(token['access_token'])
+        except ApiError as e:
+            self.logger.add_log(f"API login failed for {email}: {str(e)}", "WARN")
+            return False
+            
+        # localStorage is per-origin: open a static file on the app origin without booting React
+        self.driver.get(f"{BASE_URL}{STORAGE_SEED_PATH}")
+        self.driver.execute_script(
+            "localStorage.setItem(arguments[0], arguments[1]);"
+            "localStorage.setItem(arguments[2], arguments[3]);"
+            "localStorage.setItem(arguments[4], arguments[5]);",
+            TOKEN_STORAGE_KEYS['access_token'], token['access_token'],
+            TOKEN_STORAGE_KEYS['refresh_token'], token.get('refresh_token', ''),
+            TOKEN_STORAGE_KEYS['user_data'], json.dumps(user_data)
+        )
+        
+        self.navigate_to("/dashboard")
+        if self.wait_for_element("xpath", "//h2[contains(., 'Bienvenido')]", timeout=10):
+            self.logger.add_log(f"Login successful for {email} (programmatic)", "PASS")
+            return True
+        self.logger.add_log(f"Programmatic login for {email} did not reach the dashboard", "WARN")
+        return False
+        
+    def login_via_form(self, email, password, expect_success=True):
+        """Log in by driving the /login form"""
         self.navigate_to("/login")
         
         try:
@@ -198,10 +433,9 @@ class BaseTest:
             if not login_button:
                 return False
                 
-            login_button.click()
-            time.sleep(2)
-            
             if expect_success:
+                self.click_and_wait(login_button, expect_route_change=True)
+                
                 # Check for successful login (dashboard)
                 success = self.wait_for_element("xpath", "//h2[contains(., 'Bienvenido')]", timeout=10)
                 if success:
@@ -211,8 +445,8 @@ class BaseTest:
                     self.logger.add_log(f"Login failed for {email} - Dashboard not reached", "FAIL")
                     return False
             else:
-                # For invalid login, we expect to stay on login page
-                time.sleep(2)
+                # For invalid login, we expect to stay on login page once the request settles
+                self.click_and_wait(login_button)
                 if "login" in self.driver.current_url.lower():
                     self.logger.add_log(f"Invalid login correctly rejected for {email}", "PASS")
                     return True
@@ -231,14 +465,12 @@ class BaseTest:
             # Look for user menu/profile dropdown
             profile_button = self.find_element_safely("xpath", "//button[contains(@class, 'profile') or contains(@aria-label, 'profile')]")
             if profile_button:
-                profile_button.click()
-                time.sleep(1)
+                self.click_and_wait(profile_button)
                 
             # Look for logout button/link
             logout_element = self.wait_for_clickable("xpath", "//button[contains(., 'Cerrar sesión')] | //a[contains(., 'Cerrar sesión')]")
             if logout_element:
-                logout_element.click()
-                time.sleep(2)
+                self.click_and_wait(logout_element, expect_route_change=True)
                 
                 # Verify we're back to login page
                 if "login" in self.driver.current_url.lower():
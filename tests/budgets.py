@@ -0,0 +1,76 @@
+"""
+Performance Budgets for RavenCode Frontend Test Suite
+Checks every measured page load of a run against the per-route limits in
+PERFORMANCE_BUDGETS and reports breaches as failures
+"""
+
+from config import NAVIGATION_PATHS, PERFORMANCE_BUDGETS
+
+
+# Budget limit -> (metric in perf records, metric in network summaries, label, unit)
+BUDGET_METRICS = {
+    'lcp_ms': ('lcp', None, 'LCP', 'ms'),
+    'js_bytes': ('js_bytes', 'js_bytes', 'JS', 'bytes'),
+    'api_requests': ('api_requests', 'api_requests', 'API requests', ''),
+    'marker_ms': ('marker_ms', None, 'time to marker', 'ms')
+}
+
+
+def measured_loads(records):
+    """(route, metrics) per measured page load: benchmark visits that rendered the route, and captured navigations"""
+    routes_by_path = {path: route for route, path in NAVIGATION_PATHS.items()}
+    for record in records:
+        if record.get('kind') == 'perf':
+            # Anonymous visits of protected routes end on /login; that load is not the route's
+            if record['route'] in PERFORMANCE_BUDGETS and record.get('final_path') == record['path']:
+                yield record['route'], {
+                    limit: record['metrics'].get(perf_metric) for limit, (perf_metric, _, _, _) in BUDGET_METRICS.items()
+                }
+        elif record.get('kind') == 'network' and routes_by_path.get(record['page']) in PERFORMANCE_BUDGETS:
+            yield routes_by_path[record['page']], {
+                limit: record['summary'].get(network_metric) if network_metric else None
+                for limit, (_, network_metric, _, _) in BUDGET_METRICS.items()
+            }
+
+
+def check_budgets(records):
+    """{(route, limit): {'limit', 'loads', 'breaches'}} over every measured load with a limit set"""
+    checks = {}
+    for route, metrics in measured_loads(records):
+        budget = PERFORMANCE_BUDGETS[route]
+        for limit, value in metrics.items():
+            if value is None or budget.get(limit) is None:
+                continue
+            check = checks.setdefault((route, limit), {'limit': budget[limit], 'loads': 0, 'breaches': []})
+            check['loads'] += 1
+            if value > budget[limit]:
+                check['breaches'].append(value)
+    return checks
+
+
+def _format(value, unit):
+    if unit == 'bytes':
+        return f"{value / 1024:.0f} KB"
+    return f"{value:.0f}{unit}"
+
+
+def log_budget_results(logger, checks):
+    """Log one PASS/FAIL line per route and limit; returns pass/fail keyed '<route>_<limit>'"""
+    results = {}
+    for (route, limit), check in sorted(checks.items()):
+        _, _, label, unit = BUDGET_METRICS[limit]
+        breaches = check['breaches']
+        if breaches:
+            logger.add_log(
+                f"Budget breached: {NAVIGATION_PATHS[route]} {label} over {_format(check['limit'], unit)} in "
+                f"{len(breaches)}/{check['loads']} loads (worst {_format(max(breaches), unit)})",
+                "FAIL"
+            )
+        else:
+            logger.add_log(
+                f"Budget met: {NAVIGATION_PATHS[route]} {label} within {_format(check['limit'], unit)} "
+                f"({check['loads']} loads)",
+                "PASS"
+            )
+        results[f"{route}_{limit}"] = not breaches
+    return results
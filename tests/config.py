@@ -8,17 +8,72 @@ import os
 # Application Configuration
 BASE_URL = os.getenv('RAVENCODE_BASE_URL', 'http://localhost:3000')
 
+# Backend APIs (mirror src/config/env.ts)
+USER_API_URL = os.getenv('RAVENCODE_USER_API_URL', 'http://localhost:8001')
+LEARNING_API_URL = os.getenv('RAVENCODE_LEARNING_API_URL', 'http://localhost:8003')
+# judgeService.ts hard-codes the judge URL rather than reading env.ts
+JUDGE_API_URL = os.getenv('RAVENCODE_JUDGE_API_URL', 'http://localhost:8000')
+# The assessment pages post grades and responses straight to this service (hard-coded in the pages)
+GRADES_API_URL = os.getenv('RAVENCODE_GRADES_API_URL', 'http://localhost:8002')
+API_TIMEOUT = int(os.getenv('API_TIMEOUT', '10'))
+
+# Local stub backend: simulated judge processing time per submission (seconds)
+STUB_JUDGE_PROCESSING_TIME = float(os.getenv('STUB_JUDGE_PROCESSING_TIME', '0.5'))
+# Extra random processing time per submission, uniform in [0, jitter] (seconds)
+STUB_JUDGE_PROCESSING_JITTER = float(os.getenv('STUB_JUDGE_PROCESSING_JITTER', '0'))
+
+# Judge benchmark: judgeService.waitForSubmissionResult polls every second for up to 30s
+JUDGE_POLL_INTERVAL = float(os.getenv('JUDGE_POLL_INTERVAL', '1.0'))
+JUDGE_MAX_WAIT = float(os.getenv('JUDGE_MAX_WAIT', '30'))
+JUDGE_BENCH_BATCH_SIZE = int(os.getenv('JUDGE_BENCH_BATCH_SIZE', '10'))
+JUDGE_BENCH_BATCHES = int(os.getenv('JUDGE_BENCH_BATCHES', '3'))
+# Judge account and problem used by the assessment pages
+JUDGE_CREDENTIALS = {'username': 'admin', 'password': 'admin123'}
+JUDGE_PROBLEM_TITLE = 'Cálculo de Promedio'
+
+# Programmatic login: tests other than the authentication suite skip the /login form
+FAST_LOGIN = os.getenv('FAST_LOGIN', 'True').lower() == 'true'
+
+# localStorage keys read by src/utils/tokenManager.ts
+TOKEN_STORAGE_KEYS = {
+    'access_token': 'token',
+    'refresh_token': 'refresh_token',
+    'user_data': 'user_data'
+}
+
+# Lightweight same-origin static file used to open the app origin without booting React
+STORAGE_SEED_PATH = os.getenv('STORAGE_SEED_PATH', '/vite.svg')
+
 # Selenium Configuration
 DEFAULT_TIMEOUT = int(os.getenv('TEST_TIMEOUT', '10'))
 IMPLICIT_WAIT = int(os.getenv('IMPLICIT_WAIT', '5'))
 PAGE_LOAD_TIMEOUT = int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
 
+# Readiness waits (replace fixed sleeps): upper bound, required quiet window and poll rate
+READY_TIMEOUT = float(os.getenv('READY_TIMEOUT', '5'))
+READY_QUIET_PERIOD_MS = int(os.getenv('READY_QUIET_PERIOD_MS', '150'))
+READY_POLL_INTERVAL = float(os.getenv('READY_POLL_INTERVAL', '0.05'))
+
 # Browser Configuration
 HEADLESS = os.getenv('HEADLESS', 'False').lower() == 'true'
 WINDOW_SIZE = os.getenv('WINDOW_SIZE', '1920,1080').split(',')
 WINDOW_WIDTH = int(WINDOW_SIZE[0])
 WINDOW_HEIGHT = int(WINDOW_SIZE[1])
 
+# Number of warm Chrome sessions kept by the driver pool
+DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '1'))
+
+# Load mode (--load N): virtual students start over the ramp-up, then repeat the
+# Module 1 journey until the duration ends (seconds); runs above the error rate fail
+LOAD_STUDENTS = int(os.getenv('LOAD_STUDENTS', '5'))
+LOAD_RAMP_UP = float(os.getenv('LOAD_RAMP_UP', '30'))
+LOAD_DURATION = float(os.getenv('LOAD_DURATION', '300'))
+LOAD_MAX_ERROR_RATE = float(os.getenv('LOAD_MAX_ERROR_RATE', '0.05'))
+
+# Auth endpoint load (--auth-load C): requests per endpoint and latency histogram buckets (ms)
+AUTH_LOAD_REQUESTS = int(os.getenv('AUTH_LOAD_REQUESTS', '1000'))
+AUTH_LOAD_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
 # Test Data Configuration
 TEST_USERS = {
     'valid_admin': {
@@ -86,10 +141,69 @@ MODULE_TEST_CONFIG = {
 # File Paths
 SCREENSHOTS_DIR = os.path.join(os.path.dirname(__file__), 'screenshots')
 REPORTS_DIR = os.path.join(os.path.dirname(__file__), 'reports')
+LOGS_DIR = os.path.join(REPORTS_DIR, 'logs')
+SHARDS_DIR = os.path.join(REPORTS_DIR, 'shards')
+# --shard i/n splits on these per-test durations (JSON {test name: seconds}, written with
+# --write-durations) rather than each node's own history, so every node computes the same split
+SHARD_DURATIONS_PATH = os.getenv('SHARD_DURATIONS_PATH', os.path.join(os.path.dirname(__file__), 'shard_durations.json'))
+
+# Screenshots: encoded off the test thread as SCREENSHOT_FORMAT; captures of the same name
+# within SCREENSHOT_DEDUPE_DISTANCE bits of perceptual hash share one stored file
+SCREENSHOT_FORMAT = os.getenv('SCREENSHOT_FORMAT', 'WEBP')
+SCREENSHOT_QUALITY = int(os.getenv('SCREENSHOT_QUALITY', '80'))
+SCREENSHOT_DEDUPE_DISTANCE = int(os.getenv('SCREENSHOT_DEDUPE_DISTANCE', '4'))
+SCREENSHOT_MANIFEST = os.path.join(SCREENSHOTS_DIR, 'manifest.jsonl')
+
+# Network capture (NETWORK_CAPTURE=true or --network-capture): one HAR file per run, and the
+# slowest requests of each navigation in the report's waterfall
+NETWORK_DIR = os.path.join(REPORTS_DIR, 'network')
+NETWORK_WATERFALL_ROWS = int(os.getenv('NETWORK_WATERFALL_ROWS', '12'))
+
+# Visual regression (--suite visual): stored baselines and the diff images of failed checks
+VISUAL_BASELINES_DIR = os.path.join(os.path.dirname(__file__), 'visual_baselines')
+VISUAL_DIFF_DIR = os.path.join(REPORTS_DIR, 'visual')
+# A pixel differs when any channel moves more than VISUAL_PIXEL_THRESHOLD (0-255); a check
+# fails when more than VISUAL_TILE_TOLERANCE of the pixels in any VISUAL_TILE_SIZE tile differ
+VISUAL_PIXEL_THRESHOLD = int(os.getenv('VISUAL_PIXEL_THRESHOLD', '24'))
+VISUAL_TILE_SIZE = int(os.getenv('VISUAL_TILE_SIZE', '32'))
+VISUAL_TILE_TOLERANCE = float(os.getenv('VISUAL_TILE_TOLERANCE', '0.02'))
+# Re-record every baseline from this run instead of comparing
+VISUAL_UPDATE_BASELINES = os.getenv('VISUAL_UPDATE_BASELINES', 'False').lower() == 'true'
+
+# Account pool (--seed-accounts N): accounts registered through the API in parallel before the
+# run; tests that need an existing or disposable account claim one (one claim file per account,
+# so parallel workers never share) and register one through the API when the pool is empty.
+# Each run seeds its own directory under ACCOUNTS_DIR and removes it when it ends
+ACCOUNTS_DIR = os.path.join(REPORTS_DIR, 'accounts')
+ACCOUNT_POOL_SIZE = int(os.getenv('ACCOUNT_POOL_SIZE', '8'))
+ACCOUNT_SEED_CONCURRENCY = int(os.getenv('ACCOUNT_SEED_CONCURRENCY', '8'))
+
+# Run history (SQLite): per-test wall time, outcome and step timings of every run.
+# Expected durations (median of the last HISTORY_WINDOW runs) order parallel dispatch
+# longest-first; tests without history count as the median test
+HISTORY_DB_PATH = os.getenv('HISTORY_DB_PATH', os.path.join(REPORTS_DIR, 'test_history.sqlite3'))
+HISTORY_WINDOW = int(os.getenv('HISTORY_WINDOW', '5'))
+DEFAULT_TEST_DURATION = float(os.getenv('DEFAULT_TEST_DURATION', '30'))
+# Until history exists, the full module workflows are assumed to be the slowest tests (seconds)
+SEED_TEST_DURATIONS = {
+    'test_module1_workflow': 120,
+    'test_legacy_module1_workflow': 120,
+    'test_module2_workflow': 90
+}
+
+# Logging: entries stream to a JSONL file; only the most recent ones stay in memory
+LOG_HISTORY_LIMIT = int(os.getenv('LOG_HISTORY_LIMIT', '2000'))
+LOG_FLUSH_INTERVAL = float(os.getenv('LOG_FLUSH_INTERVAL', '0.5'))
 
 # Create directories if they don't exist
 os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
 os.makedirs(REPORTS_DIR, exist_ok=True)
+os.makedirs(LOGS_DIR, exist_ok=True)
+os.makedirs(SHARDS_DIR, exist_ok=True)
+os.makedirs(VISUAL_BASELINES_DIR, exist_ok=True)
+os.makedirs(VISUAL_DIFF_DIR, exist_ok=True)
+os.makedirs(NETWORK_DIR, exist_ok=True)
+os.makedirs(ACCOUNTS_DIR, exist_ok=True)
 
 # Test Categories
 TEST_CATEGORIES = {
@@ -148,6 +262,32 @@ UI_ELEMENTS = {
     }
 }
 
+# Visual regression pages, keyed like NAVIGATION_PATHS: the UI_ELEMENTS marker to wait for
+# and the regions to ignore, as XPaths of elements or (x, y, width, height) in screenshot pixels
+VISUAL_PAGES = {
+    'dashboard': {
+        'marker': UI_ELEMENTS['dashboard']['welcome_message'],
+        # Greeting carries the user's name; progress moves as workflows run
+        'ignore': [
+            UI_ELEMENTS['dashboard']['welcome_message'],
+            UI_ELEMENTS['dashboard']['progress_card'] + "/ancestor::div[contains(@class, 'rounded-xl')][1]"
+        ]
+    },
+    'courses': {
+        'marker': UI_ELEMENTS['courses_page']['courses_heading'],
+        'ignore': []
+    },
+    'settings': {
+        'marker': UI_ELEMENTS['settings_page']['settings_heading'],
+        # Profile fields show whatever the settings test last saved
+        'ignore': ["//form//input", "//form//select"]
+    },
+    'admin': {
+        'marker': UI_ELEMENTS['admin_dashboard']['admin_heading'],
+        'ignore': []
+    }
+}
+
 # Success Messages
 SUCCESS_MESSAGES = {
     'login_success': "Bienvenido",
@@ -182,4 +322,65 @@ NAVIGATION_PATHS = {
     'admin_achievements': '/admin/achievements',
     'module1_intro': '/module1/introduction',
     'module2_intro': '/module2/introduction'
-} 
\ No newline at end of file
+} 
+
+# Performance budgets, keyed like NAVIGATION_PATHS: every measured load of a route (page-load
+# benchmark, network capture) is checked and breaches fail the run. 'marker' is the UI_ELEMENTS
+# locator whose first appearance marker_ms limits; None leaves a limit unchecked
+PERFORMANCE_BUDGET_DEFAULTS = {
+    'lcp_ms': 2500,             # Largest Contentful Paint
+    'js_bytes': 2_500_000,      # JavaScript transferred by the page load
+    'api_requests': 12,         # fetch / XHR calls made by the page load
+    'marker_ms': 3000,          # navigation start to the marker element being in the DOM
+    'marker': None
+}
+PERFORMANCE_BUDGETS = {
+    route: dict(PERFORMANCE_BUDGET_DEFAULTS, **overrides) for route, overrides in {
+        'login': {'marker': UI_ELEMENTS['login_page']['login_button'], 'api_requests': 2},
+        'register': {'marker': UI_ELEMENTS['register_page']['register_button'], 'api_requests': 2},
+        'dashboard': {'marker': UI_ELEMENTS['dashboard']['welcome_message']},
+        'courses': {'marker': UI_ELEMENTS['courses_page']['courses_heading']},
+        'achievements': {},
+        'settings': {'marker': UI_ELEMENTS['settings_page']['settings_heading']},
+        'forgot_password': {'api_requests': 2},
+        'admin': {'marker': UI_ELEMENTS['admin_dashboard']['admin_heading']},
+        'admin_users': {},
+        'admin_courses': {},
+        'admin_achievements': {},
+        'module1_intro': {},
+        'module2_intro': {}
+    }.items()
+}
+
+# Change-impact selection (--changed-since): route tags for pages tests reach by clicking
+# rather than through NAVIGATION_PATHS, as App.tsx route paths
+ROUTE_TAGS = {
+    'module1': ['/introduction', '/lesson1', '/lesson2', '/lesson3', '/lesson4', '/lesson5',
+                '/Assesment1', '/AssessmentJudge1'],
+    'module2': ['/introduction-module2', '/lesson1-module2', '/lesson2-module2', '/lesson3-module2',
+                '/lesson4-module2', '/assessment2', '/AssessmentJudge2']
+}
+FRONTEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Modules that mount the router; a change reaching them outside a routed page runs everything
+FRONTEND_ENTRY_POINTS = ['src/main.tsx', 'src/App.tsx']
+# Changed files that cannot affect the UI under test (fnmatch patterns, relative to FRONTEND_DIR)
+IMPACT_IGNORED_FILES = ['*.md', '.gitignore', 'tests/screenshots/*', 'tests/reports/*']
+
+# Managed frontend server (--serve-build): the production build of FRONTEND_DIR served from
+# dist/ on BASE_URL's port. FRONTEND_BUILD_COMMAND runs only when a build input is newer than
+# the last build or the VITE_* environment (baked into the bundle, e.g. the API URLs) differs
+# from the one recorded in dist/ at build time; text assets of at least
+# FRONTEND_PRECOMPRESS_MIN_BYTES get .gz (and .br with the brotli package) siblings served to
+# clients that accept them
+FRONTEND_DIST_DIR = os.getenv('FRONTEND_DIST_DIR', os.path.join(FRONTEND_DIR, 'dist'))
+FRONTEND_BUILD_COMMAND = os.getenv('FRONTEND_BUILD_COMMAND', 'npm run build')
+FRONTEND_BUILD_INPUTS = ['src', 'public', 'index.html', 'package.json', 'package-lock.json', 'vite.config.js',
+                         'tailwind.config.js', 'postcss.config.js', 'tsconfig.json',
+                         '.env', '.env.local', '.env.production', '.env.production.local']
+FRONTEND_PRECOMPRESS_MIN_BYTES = int(os.getenv('FRONTEND_PRECOMPRESS_MIN_BYTES', '1024'))
+FRONTEND_READY_TIMEOUT = float(os.getenv('FRONTEND_READY_TIMEOUT', '30'))
+
+# Page-load benchmark (--suite perf): visits per route and session state
+PERF_ITERATIONS = int(os.getenv('PERF_ITERATIONS', '5'))
+# How long LCP / layout-shift observers get to deliver buffered entries (milliseconds)
+PERF_OBSERVER_SETTLE_MS = int(os.getenv('PERF_OBSERVER_SETTLE_MS', '100'))
@@ -0,0 +1,176 @@
+"""
+WebDriver Session Pool for RavenCode Frontend Test Suite
+Keeps warm Chrome sessions, leases them to tests and shuts them down once per run
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from config import DRIVER_POOL_SIZE
+
+
+class DriverPool:
+    """Pool of reusable Chrome sessions"""
+
+    def __init__(self, size=None, logger=None, headless=None):
+        self.size = max(1, size or DRIVER_POOL_SIZE)
+        self.logger = logger
+        self.headless = headless
+        self._idle = []
+        self._drivers = []
+        self._launching = 0
+        self._condition = threading.Condition()
+        self.launches = 0
+        self.leases = 0
+        self.launch_seconds = 0.0
+
+    def _log(self, message, log_type="INFO"):
+        if self.logger:
+            self.logger.add_log(message, log_type)
+
+    def _launch(self):
+        """Start a new Chrome session (slot already reserved) and record how long it took"""
+        # Selenium loads with the first session, not when the runner imports the pool
+        from base_test import create_chrome_driver
+
+        start_time = time.time()
+        try:
+            driver = create_chrome_driver(self.headless)
+        except Exception:
+            with self._condition:
+                self._launching -= 1
+                self._condition.notify()
+            raise
+        elapsed = time.time() - start_time
+
+        with self._condition:
+            self._launching -= 1
+            self._drivers.append(driver)
+            self.launches += 1
+            self.launch_seconds += elapsed
+        self._log(f"Driver pool launched Chrome session in {elapsed:.2f}s", "INFO")
+        return driver
+
+    def prewarm(self, count=None):
+        """Launch sessions up front so the first tests don't pay for startup"""
+        with self._condition:
+            count = min(count or self.size, self.size) - len(self._drivers) - self._launching
+            self._launching += max(0, count)
+        threads = [threading.Thread(target=self._prewarm_one) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _prewarm_one(self):
+        try:
+            driver = self._launch()
+        except Exception as e:
+            self._log(f"Driver pool failed to prewarm a session: {str(e)}", "WARN")
+            return
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def acquire(self):
+        """Lease a warm session, launching one if the pool is not yet full"""
+        with self._condition:
+            while not self._idle and len(self._drivers) + self._launching >= self.size:
+                self._condition.wait()
+            self.leases += 1
+            if self._idle:
+                return self._idle.pop()
+            self._launching += 1
+
+        return self._launch()
+
+    def release(self, driver):
+        """Reset a session and return it to the pool; broken sessions are discarded"""
+        try:
+            self.reset(driver)
+        except Exception as e:
+            self._log(f"Driver pool discarding session that failed to reset: {str(e)}", "WARN")
+            self._discard(driver)
+            return
+
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def _discard(self, driver):
+        with self._condition:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._condition.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def reset(driver):
+        """Clear cookies, storage, cache and service workers, then park the session on a blank page"""
+        from base_test import reset_browser_context
+
+        reset_browser_context(driver)
+
+    @contextmanager
+    def lease(self):
+        """Context manager that acquires a session and always releases it"""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def stats(self):
+        """Launch/lease counters for this pool"""
+        return {
+            'launches': self.launches,
+            'leases': self.leases,
+            'launch_seconds': self.launch_seconds
+        }
+
+    def shutdown(self):
+        """Quit every session the pool started"""
+        with self._condition:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+            self._idle.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        if drivers:
+            self._log(f"Driver pool shut down {len(drivers)} Chrome session(s)", "INFO")
+
+
+def startup_savings(stats_list):
+    """Aggregate pool stats into the startup time saved by reusing sessions"""
+    launches = sum(stats['launches'] for stats in stats_list)
+    leases = sum(stats['leases'] for stats in stats_list)
+    launch_seconds = sum(stats['launch_seconds'] for stats in stats_list)
+
+    average_launch = launch_seconds / launches if launches else 0.0
+    reused = max(0, leases - launches)
+    return {
+        'launches': launches,
+        'leases': leases,
+        'average_launch_seconds': average_launch,
+        'seconds_saved': reused * average_launch
+    }
+
+
+def log_startup_savings(logger, stats_list):
+    """Log the per-run 'startup time saved' metric"""
+    savings = startup_savings(stats_list)
+    if not savings['leases']:
+        return savings
+    logger.add_log(
+        f"DRIVER POOL: {savings['leases']} leases served by {savings['launches']} Chrome launches "
+        f"(avg startup {savings['average_launch_seconds']:.2f}s, ~{savings['seconds_saved']:.2f}s saved)",
+        "INFO"
+    )
+    return savings
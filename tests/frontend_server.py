@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Managed Frontend Server for RavenCode Frontend Test Suite
+Builds the app for production when its sources changed, precompresses the bundle and
+serves dist/ on BASE_URL with SPA fallback, so timings reflect what users download
+"""
+
+import argparse
+import gzip
+import json
+import mimetypes
+import os
+import posixpath
+import shlex
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+from config import (
+    BASE_URL, FRONTEND_DIR, FRONTEND_DIST_DIR, FRONTEND_BUILD_COMMAND, FRONTEND_BUILD_INPUTS,
+    FRONTEND_PRECOMPRESS_MIN_BYTES, FRONTEND_READY_TIMEOUT, READY_POLL_INTERVAL
+)
+
+
+# Build outputs worth compressing (images and fonts are already compressed)
+COMPRESSIBLE_SUFFIXES = ('.html', '.js', '.mjs', '.css', '.svg', '.json', '.map', '.txt', '.xml', '.wasm')
+
+# Precompressed siblings in order of preference, with the Content-Encoding they are served as
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+# Vite fingerprints everything under assets/, so those files never change under the same name
+IMMUTABLE_PREFIX = '/assets/'
+
+# Written into dist/ after each build: the command and the VITE_* environment it was built with
+BUILD_STAMP = '.ravencode-build.json'
+
+
+def _latest_mtime(path):
+    """Newest modification time of a file or of any file below a directory"""
+    if not os.path.isdir(path):
+        return os.path.getmtime(path) if os.path.exists(path) else 0
+    latest = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            latest = max(latest, os.path.getmtime(os.path.join(dirpath, filename)))
+    return latest
+
+
+def build_stamp():
+    """What a build bakes in besides its input files: the build command and the VITE_* environment"""
+    return {
+        'command': FRONTEND_BUILD_COMMAND,
+        'env': {name: value for name, value in sorted(os.environ.items()) if name.startswith('VITE_')}
+    }
+
+
+def _read_build_stamp(dist_dir):
+    try:
+        with open(os.path.join(dist_dir, BUILD_STAMP), encoding='utf-8') as stream:
+            return json.load(stream)
+    except (OSError, ValueError):
+        return None
+
+
+def build_is_stale(dist_dir=None):
+    """Whether any build input changed after the last build wrote dist/index.html, or the build environment differs"""
+    dist_dir = dist_dir or FRONTEND_DIST_DIR
+    index = os.path.join(dist_dir, 'index.html')
+    if not os.path.exists(index) or _read_build_stamp(dist_dir) != build_stamp():
+        return True
+    built = os.path.getmtime(index)
+    return any(_latest_mtime(os.path.join(FRONTEND_DIR, source)) > built for source in FRONTEND_BUILD_INPUTS)
+
+
+def build_frontend(logger=None, force=False):
+    """Run the production build unless dist/ is up to date; returns whether a build ran"""
+    if not force and not build_is_stale():
+        if logger:
+            logger.add_log(f"Frontend build is up to date ({FRONTEND_DIST_DIR})", "INFO")
+        return False
+
+    start_time = time.time()
+    result = subprocess.run(
+        shlex.split(FRONTEND_BUILD_COMMAND), cwd=FRONTEND_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        output = (result.stderr or result.stdout).strip().splitlines()
+        raise RuntimeError(f"'{FRONTEND_BUILD_COMMAND}' failed: {' / '.join(output[-5:]) or result.returncode}")
+    with open(os.path.join(FRONTEND_DIST_DIR, BUILD_STAMP), 'w', encoding='utf-8') as stream:
+        json.dump(build_stamp(), stream, indent=2)
+    if logger:
+        logger.add_log(f"Frontend built with '{FRONTEND_BUILD_COMMAND}' in {time.time() - start_time:.1f}s", "INFO")
+    return True
+
+
+def precompress(root=None, min_bytes=None):
+    """Write .gz (and .br when the brotli package is installed) next to each compressible build file"""
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+    root = root or FRONTEND_DIST_DIR
+    min_bytes = FRONTEND_PRECOMPRESS_MIN_BYTES if min_bytes is None else min_bytes
+    written = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if not filename.endswith(COMPRESSIBLE_SUFFIXES) or os.path.getsize(path) < min_bytes:
+                continue
+            with open(path, 'rb') as stream:
+                data = stream.read()
+            variants = [('.gz', gzip.compress)] + ([('.br', brotli.compress)] if brotli else [])
+            for suffix, compress in variants:
+                target = path + suffix
+                if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+                    continue
+                with open(target, 'wb') as stream:
+                    stream.write(compress(data))
+                written += 1
+    return written
+
+
+class FrontendRequestHandler(BaseHTTPRequestHandler):
+    """Static file handler for a single-page app build"""
+
+    protocol_version = 'HTTP/1.1'
+    root = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def _resolve(self, url_path):
+        """File for a URL path: the file itself, a directory's index.html, or index.html for app routes"""
+        path = posixpath.normpath(unquote(url_path))
+        candidate = os.path.realpath(os.path.join(self.root, path.lstrip('/')))
+        if candidate != self.root and not candidate.startswith(self.root + os.sep):
+            return None
+        if os.path.isdir(candidate):
+            candidate = os.path.join(candidate, 'index.html')
+        if os.path.isfile(candidate):
+            return candidate
+        # Client-side routes (/dashboard, /module1/introduction) have no extension; missing assets do
+        if not posixpath.splitext(path)[1]:
+            return os.path.join(self.root, 'index.html')
+        return None
+
+    def _accepted_encodings(self):
+        """Content codings the client accepts (q=0 excluded)"""
+        accepted = set()
+        for part in self.headers.get('Accept-Encoding', '').split(','):
+            coding, _, params = part.strip().partition(';')
+            if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+                accepted.add(coding.strip().lower())
+        return accepted
+
+    def _serve(self, send_body):
+        url_path = urlparse(self.path).path
+        path = self._resolve(url_path)
+        if path is None:
+            body = b'Not Found'
+            self.send_response(404)
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+            return
+
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json'):
+            content_type += '; charset=utf-8'
+
+        accepted = self._accepted_encodings()
+        served, encoding, variants = path, None, False
+        for coding, suffix in ENCODINGS:
+            if os.path.exists(path + suffix):
+                variants = True
+                if encoding is None and coding in accepted:
+                    served, encoding = path + suffix, coding
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(os.path.getsize(served)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if variants:
+            self.send_header('Vary', 'Accept-Encoding')
+        if url_path.startswith(IMMUTABLE_PREFIX) and path != os.path.join(self.root, 'index.html'):
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+        else:
+            self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        if send_body:
+            with open(served, 'rb') as stream:
+                shutil.copyfileobj(stream, self.wfile)
+
+
+class FrontendServer:
+    """Serves a production build on BASE_URL's host and port from a background thread"""
+
+    def __init__(self, logger=None, root=None, url=None):
+        self.logger = logger
+        self.root = os.path.realpath(root or FRONTEND_DIST_DIR)
+        self.url = url or BASE_URL
+        self.server = None
+
+    def start(self):
+        """Bind the server and serve from a daemon thread"""
+        if not os.path.isfile(os.path.join(self.root, 'index.html')):
+            raise RuntimeError(f"No build to serve: {self.root}/index.html is missing")
+        parsed = urlparse(self.url)
+        handler = type(FrontendRequestHandler.__name__, (FrontendRequestHandler,), {'root': self.root})
+        try:
+            self.server = ThreadingHTTPServer((parsed.hostname, parsed.port or 80), handler)
+        except OSError as e:
+            raise RuntimeError(f"Cannot serve the build on {self.url} ({str(e)}); is a dev server still running?")
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        if self.logger:
+            self.logger.add_log(f"Serving {self.root} on {self.url}", "INFO")
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def wait_until_serving(url=None, timeout=None):
+    """Poll url until it answers 200 (bounded by timeout); returns whether it did"""
+    url = url or BASE_URL
+    deadline = time.time() + (FRONTEND_READY_TIMEOUT if timeout is None else timeout)
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=READY_POLL_INTERVAL * 20) as response:
+                if response.status == 200:
+                    return True
+        except (urllib.error.URLError, OSError):
+            pass
+        if time.time() >= deadline:
+            return False
+        time.sleep(READY_POLL_INTERVAL)
+
+
+def start_frontend(logger=None, build=True):
+    """Build if needed, precompress, serve and wait for readiness: the single startup step for a run"""
+    start_time = time.time()
+    if build:
+        build_frontend(logger)
+    written = precompress()
+    server = FrontendServer(logger).start()
+    if not wait_until_serving(server.url):
+        server.stop()
+        raise RuntimeError(f"Frontend server on {server.url} did not answer within {FRONTEND_READY_TIMEOUT:.0f}s")
+    if logger:
+        logger.add_log(
+            f"Frontend ready on {server.url} in {time.time() - start_time:.2f}s "
+            f"({written} precompressed files written)",
+            "INFO"
+        )
+    return server
+
+
+def main():
+    """Build and serve the frontend until interrupted"""
+    parser = argparse.ArgumentParser(description='Serve the RavenCode production build')
+    parser.add_argument('--no-build', action='store_true', help='Serve the existing dist/ without rebuilding')
+    args = parser.parse_args()
+
+    try:
+        server = start_frontend(build=not args.no_build)
+    except RuntimeError as e:
+        print(str(e))
+        sys.exit(1)
+    print(f"Serving {server.root} on {server.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Run History for RavenCode Frontend Test Suite
+SQLite store of every run's per-test wall time, outcome and step timings, used to
+schedule long tests first and to balance shards
+"""
+
+import sqlite3
+import statistics
+from contextlib import closing
+
+from stats import summarize
+from config import HISTORY_DB_PATH, HISTORY_WINDOW, DEFAULT_TEST_DURATION, SEED_TEST_DURATIONS
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT,
+    finished_at TEXT,
+    arguments TEXT,
+    workers INTEGER
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    suite TEXT NOT NULL,
+    result_key TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    wall_time REAL
+);
+CREATE INDEX IF NOT EXISTS test_results_by_name ON test_results (name, run_id);
+CREATE TABLE IF NOT EXISTS step_timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    step TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    total REAL NOT NULL,
+    p50 REAL,
+    p95 REAL,
+    max REAL
+);
+"""
+
+
+def connect(path=None):
+    """Open the history database, creating the schema on first use"""
+    connection = sqlite3.connect(path or HISTORY_DB_PATH, timeout=30)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def record_run(plan, results, durations, spans, started_at, finished_at, arguments, workers, path=None):
+    """Store one run: an outcome and wall time per test, and its step timings
+
+    results is the runner's {suite: {key: bool}} map, durations the measured time per
+    planned test name, spans the run's SpanTable (for tests timed only by their spans).
+    Only outcomes of planned tests are stored; budget checks, load and benchmark results
+    are not tests that --last-failed or --shard could schedule.
+    """
+    by_key = {(planned.suite, planned.key): planned for planned in plan}
+    by_name = {planned.name: planned for planned in plan}
+    by_span_name = {f"{planned.cls}.{planned.method}": planned.name for planned in plan}
+
+    rows = []
+    for suite, suite_results in results.items():
+        if not isinstance(suite_results, dict):
+            # run_specific_test stores a single outcome under the test name
+            planned = by_name.get(suite)
+            if planned and isinstance(suite_results, bool):
+                rows.append([planned.name, planned.suite, planned.key,
+                             'passed' if suite_results else 'failed', durations.get(planned.name)])
+            continue
+        for key, outcome in suite_results.items():
+            planned = by_key.get((suite, key))
+            if planned and isinstance(outcome, bool):
+                rows.append([planned.name, suite, key, 'passed' if outcome else 'failed', durations.get(planned.name)])
+
+    # Tests run inside a whole suite have no dispatch timing; fall back to their 'test' span
+    span_times = {by_span_name.get(test, test): sum(values) for test, values in spans.by_test.items()}
+    for row in rows:
+        if row[4] is None:
+            row[4] = span_times.get(row[0])
+
+    with closing(connect(path)) as connection, connection:
+        run_id = connection.execute(
+            "INSERT INTO runs (started_at, finished_at, arguments, workers) VALUES (?, ?, ?, ?)",
+            (started_at.isoformat() if started_at else None, finished_at.isoformat() if finished_at else None,
+             arguments, workers)
+        ).lastrowid
+        connection.executemany(
+            "INSERT INTO test_results (run_id, name, suite, result_key, outcome, wall_time) VALUES (?, ?, ?, ?, ?, ?)",
+            [[run_id] + row for row in rows]
+        )
+        step_rows = []
+        for test, steps in spans.by_test_step.items():
+            for step, values in steps.items():
+                summary = summarize(values)
+                step_rows.append((run_id, by_span_name.get(test, test), step, summary['count'], summary['total'],
+                                  summary['p50'], summary['p95'], summary['max']))
+        connection.executemany(
+            "INSERT INTO step_timings (run_id, name, step, count, total, p50, p95, max) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            step_rows
+        )
+    return run_id
+
+
+def load_durations(path=None, window=None):
+    """Expected wall time per test: the median of its last `window` recorded runs"""
+    window = window or HISTORY_WINDOW
+    recent = {}
+    with closing(connect(path)) as connection:
+        for name, wall_time in connection.execute(
+            "SELECT name, wall_time FROM test_results WHERE wall_time IS NOT NULL ORDER BY run_id DESC"
+        ):
+            times = recent.setdefault(name, [])
+            if len(times) < window:
+                times.append(wall_time)
+    return {name: statistics.median(times) for name, times in recent.items()}
+
+
+def load_failed(path=None):
+    """Names of the tests whose most recent recorded outcome is a failure"""
+    latest = {}
+    with closing(connect(path)) as connection:
+        for name, outcome in connection.execute("SELECT name, outcome FROM test_results ORDER BY run_id DESC"):
+            latest.setdefault(name, outcome)
+    return {name for name, outcome in latest.items() if outcome == 'failed'}
+
+
+def duration_estimator(plan, durations):
+    """Expected duration per planned test; tests without history count as the median known test"""
+    known = [durations[planned.name] for planned in plan if planned.name in durations]
+    fallback = statistics.median(known) if known else DEFAULT_TEST_DURATION
+    durations = dict(SEED_TEST_DURATIONS, **durations)
+    return lambda planned: durations.get(planned.name, fallback)
+
+
+def longest_first(plan, durations=None, first=()):
+    """Order planned tests so the slowest are dispatched first (plan order among equals)
+
+    Tests named in `first` go ahead of all others, still slowest first among themselves.
+    """
+    estimate = duration_estimator(plan, load_durations() if durations is None else durations)
+    return sorted(plan, key=lambda planned: (planned.name not in first, -estimate(planned)))
@@ -0,0 +1,302 @@
+"""
+Auth Endpoint Load Driver for RavenCode Frontend Test Suite
+asyncio HTTP client with a keep-alive connection pool that replays the request
+shapes of src/services/authService.ts at a fixed concurrency
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import Counter
+from urllib.parse import urlencode, urlparse
+
+from stats import summarize, percentile, histogram
+from api_client import REGISTER_FIELDS
+from test_data.users import STATIC_USERS, generate_test_user
+from config import USER_API_URL, API_TIMEOUT, AUTH_LOAD_REQUESTS, AUTH_LOAD_BUCKETS_MS
+
+# Network failures that count as errors rather than aborting the run
+CONNECTION_ERRORS = (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError)
+
+
+async def _read_response(reader):
+    """Read one HTTP/1.1 response: (status, body bytes, whether the connection can be reused)"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Connection closed by server")
+    status = int(status_line.split()[1])
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                await reader.readline()
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b''.join(chunks)
+    else:
+        body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+    return status, body, headers.get('connection', '').lower() != 'close'
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections to one origin, at most `size` in use at once"""
+
+    def __init__(self, base_url, size, timeout=None):
+        parsed = urlparse(base_url)
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        self.ssl = parsed.scheme == 'https'
+        self.prefix = parsed.path.rstrip('/')
+        self.timeout = timeout or API_TIMEOUT
+        self._idle = []
+        self._slots = asyncio.Semaphore(size)
+        self.opened = 0
+
+    async def _open(self):
+        self.opened += 1
+        return await asyncio.wait_for(asyncio.open_connection(self.host, self.port, ssl=self.ssl), self.timeout)
+
+    async def request(self, method, path, payload=None, token=None, form=None):
+        """Send a JSON (or form-encoded) request on a pooled connection and return (status, decoded body)"""
+        if form is not None:
+            body, content_type = urlencode(form).encode('utf-8'), 'application/x-www-form-urlencoded'
+        else:
+            body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+            content_type = 'application/json'
+        authorization = f"Authorization: Bearer {token}\r\n" if token else ""
+        head = (
+            f"{method} {self.prefix}{path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"{authorization}"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode('latin-1')
+
+        async with self._slots:
+            reused = bool(self._idle)
+            reader, writer = self._idle.pop() if reused else await self._open()
+            try:
+                writer.write(head + body)
+                await writer.drain()
+                status, raw, keep_alive = await asyncio.wait_for(_read_response(reader), self.timeout)
+            except CONNECTION_ERRORS:
+                writer.close()
+                if not reused:
+                    raise
+                # The server dropped an idle connection; retry once on a fresh one
+                reader, writer = await self._open()
+                try:
+                    writer.write(head + body)
+                    await writer.drain()
+                    status, raw, keep_alive = await asyncio.wait_for(_read_response(reader), self.timeout)
+                except CONNECTION_ERRORS:
+                    writer.close()
+                    raise
+
+            if keep_alive:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+
+        return status, json.loads(raw) if raw else {}
+
+    async def close(self):
+        """Close every idle connection"""
+        for _, writer in self._idle:
+            writer.close()
+        self._idle = []
+
+
+class AuthScenarios:
+    """One request per call, shaped like the matching authService method"""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def login(self, client):
+        user = client['user']
+        return await self.pool.request('POST', '/auth/login', {'email': user['email'], 'password': user['password']})
+
+    async def register(self, client):
+        user = generate_test_user()
+        return await self.pool.request('POST', '/auth/register', {field: user[field] for field in REGISTER_FIELDS})
+
+    async def refresh(self, client):
+        status, body = await self.pool.request('POST', '/auth/refresh', {'refresh_token': client['refresh_token']})
+        if status == 200 and body.get('refresh_token'):
+            # Follow rotation, as TokenManager does
+            client['refresh_token'] = body['refresh_token']
+        return status, body
+
+    async def recovery(self, client):
+        return await self.pool.request('POST', '/auth/recovery/request', {'email': client['user']['email']})
+
+
+ENDPOINTS = {
+    'login': '/auth/login',
+    'register': '/auth/register',
+    'refresh': '/auth/refresh',
+    'recovery': '/auth/recovery/request',
+}
+
+
+async def run_endpoint(endpoint, concurrency, requests, duration=None, base_url=None):
+    """Drive one endpoint with `concurrency` clients until `requests` are sent (or duration passes)"""
+    pool = ConnectionPool(base_url or USER_API_URL, concurrency)
+    scenarios = AuthScenarios(pool)
+    scenario = getattr(scenarios, endpoint)
+    users = list(STATIC_USERS.values())
+    clients = [{'user': users[index % len(users)], 'refresh_token': None} for index in range(concurrency)]
+
+    if endpoint == 'refresh':
+        # Each client needs its own session to refresh
+        for client, (status, body) in zip(clients, await asyncio.gather(*(scenarios.login(c) for c in clients))):
+            client['refresh_token'] = body.get('refresh_token') if status == 200 else None
+
+    latencies = []
+    statuses = Counter()
+    remaining = requests
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def client_loop(client):
+        nonlocal remaining
+        while remaining > 0 and (deadline is None or time.perf_counter() < deadline):
+            remaining -= 1
+            start_time = time.perf_counter()
+            try:
+                status, _ = await scenario(client)
+            except CONNECTION_ERRORS as e:
+                statuses[type(e).__name__] += 1
+                continue
+            latencies.append((time.perf_counter() - start_time) * 1000)
+            statuses[status] += 1
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(client_loop(client) for client in clients))
+    elapsed = time.perf_counter() - start_time
+    await pool.close()
+
+    sent = sum(statuses.values())
+    errors = sum(count for status, count in statuses.items() if not (isinstance(status, int) and status < 400))
+    return {
+        'endpoint': endpoint,
+        'concurrency': concurrency,
+        'requests': sent,
+        'errors': errors,
+        'elapsed': elapsed,
+        'throughput': sent / elapsed if elapsed > 0 else 0.0,
+        'connections': pool.opened,
+        'statuses': {str(status): count for status, count in statuses.items()},
+        'latency': dict(summarize(latencies), p99=percentile(latencies, 99)),
+        'buckets': AUTH_LOAD_BUCKETS_MS,
+        'histogram': histogram(latencies, AUTH_LOAD_BUCKETS_MS)
+    }
+
+
+def log_endpoint_result(logger, result):
+    """Log throughput, latency percentiles and the histogram, and stream the result for the report"""
+    latency = result['latency']
+    logger.add_log(
+        f"{ENDPOINTS[result['endpoint']]}: {result['requests']} requests at concurrency {result['concurrency']} "
+        f"in {result['elapsed']:.2f}s ({result['throughput']:.1f} req/s, {result['errors']} errors, "
+        f"{result['connections']} connections)",
+        "PASS" if result['requests'] and not result['errors'] else "FAIL"
+    )
+    if latency['count']:
+        logger.add_log(
+            f"  latency p50 {latency['p50']:.1f}ms / p95 {latency['p95']:.1f}ms / "
+            f"p99 {latency['p99']:.1f}ms / max {latency['max']:.1f}ms",
+            "INFO"
+        )
+    labels = [f"<={bound}ms" for bound in AUTH_LOAD_BUCKETS_MS] + [f">{AUTH_LOAD_BUCKETS_MS[-1]}ms"]
+    logger.add_log(
+        "  histogram: " + ", ".join(f"{label} {count}" for label, count in zip(labels, result['histogram']) if count),
+        "INFO"
+    )
+    logger.add_record(dict(result, kind='http_load'))
+
+
+def run_auth_load(logger, concurrency, endpoints=None, requests=None, duration=None):
+    """Load each auth endpoint in turn; returns pass/fail per endpoint (no errors)"""
+    endpoints = endpoints or list(ENDPOINTS)
+    requests = requests or AUTH_LOAD_REQUESTS
+    results = {}
+    for endpoint in endpoints:
+        logger.add_log(f"Loading {ENDPOINTS[endpoint]} with {concurrency} concurrent clients", "INFO")
+        result = asyncio.run(run_endpoint(endpoint, concurrency, requests, duration))
+        log_endpoint_result(logger, result)
+        results[endpoint] = bool(result['requests']) and not result['errors']
+    return results
+
+
+def self_check(concurrency=4, requests=40):
+    """Drive every endpoint against an in-process StubBackend; returns the problems found (empty when clean)
+
+    Checks the driver itself: each endpoint must send all its requests without an error
+    and reuse its pooled connections rather than opening one per request.
+    """
+    from stub_backend import StubBackend
+
+    problems = []
+    with StubBackend():
+        for endpoint in ENDPOINTS:
+            result = asyncio.run(run_endpoint(endpoint, concurrency, requests))
+            if result['requests'] != requests:
+                problems.append(f"{endpoint}: {result['requests']}/{requests} requests sent")
+            if result['errors']:
+                problems.append(f"{endpoint}: {result['errors']} errors ({result['statuses']})")
+            if result['connections'] > concurrency * 2:
+                problems.append(f"{endpoint}: {result['connections']} connections opened for {concurrency} clients")
+    return problems
+
+
+def main():
+    """Load the auth endpoints from the command line (optionally against the local stub)"""
+    from test_logger import TestLogger
+    from stub_backend import StubBackend
+
+    parser = argparse.ArgumentParser(description='RavenCode auth endpoint load driver')
+    parser.add_argument('--concurrency', type=int, default=20, help='Concurrent clients (and pooled connections)')
+    parser.add_argument('--requests', type=int, help='Requests per endpoint (default: AUTH_LOAD_REQUESTS)')
+    parser.add_argument('--duration', type=float, help='Stop each endpoint after this many seconds')
+    parser.add_argument('--endpoint', action='append', choices=list(ENDPOINTS),
+                        help='Endpoint to load (repeatable; default: all)')
+    parser.add_argument('--stub-backend', action='store_true', help='Run against the in-process stub user API')
+    parser.add_argument('--self-check', action='store_true',
+                        help='Check the driver against the stub user API (no errors, pooled connections), then exit')
+    args = parser.parse_args()
+
+    if args.self_check:
+        problems = self_check()
+        for problem in problems:
+            print(f"FAIL {problem}")
+        print("Auth load driver self-check " + ("failed" if problems else "passed"))
+        sys.exit(1 if problems else 0)
+
+    logger = TestLogger("RavenCode Auth Load", stream=False)
+    backend = StubBackend(logger).start() if args.stub_backend else None
+    try:
+        results = run_auth_load(logger, args.concurrency, args.endpoint, args.requests, args.duration)
+    finally:
+        if backend:
+            backend.stop()
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
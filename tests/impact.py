@@ -0,0 +1,144 @@
+"""
+Change-Impact Selection for RavenCode Frontend Test Suite
+Maps files changed since a git ref to the App routes that render them (through the
+src/ import graph and App.tsx) and picks the planned tests whose route tags cover them
+"""
+
+import fnmatch
+import os
+import re
+import subprocess
+from collections import namedtuple
+
+from config import FRONTEND_DIR, FRONTEND_ENTRY_POINTS, IMPACT_IGNORED_FILES, NAVIGATION_PATHS, ROUTE_TAGS
+
+
+SOURCE_EXTENSIONS = ('.tsx', '.ts', '.jsx', '.js')
+
+# import x from '...', import '...', export ... from '...', import('...')
+IMPORT_PATTERN = re.compile(r"""(?:\bimport|\bexport)\s+(?:[^'";]*?\s+from\s+)?['"]([^'"]+)['"]|\bimport\(\s*['"]([^'"]+)['"]\s*\)""")
+DEFAULT_IMPORT_PATTERN = re.compile(r"""\bimport\s+(\w+)\s+from\s+['"](\.[^'"]+)['"]""")
+ROUTE_PATTERN = re.compile(r"""<Route\s+path="([^"]+)"\s+element=\{(.*?)\}\s*/>""", re.DOTALL)
+COMPONENT_PATTERN = re.compile(r"<([A-Z]\w*)")
+
+# What a change run selected: the tests to run, the routes behind them, and why it fell
+# back to the full plan (None when the selection is narrowed)
+Impact = namedtuple('Impact', ['tests', 'routes', 'uncovered_routes', 'full_run'])
+
+
+def changed_files(ref):
+    """Files changed since `ref` (committed, staged, unstaged and untracked), relative to FRONTEND_DIR"""
+    try:
+        diff = subprocess.run(['git', 'diff', '--name-only', '--relative', ref], cwd=FRONTEND_DIR,
+                              capture_output=True, text=True, check=True).stdout
+        untracked = subprocess.run(['git', 'ls-files', '--others', '--exclude-standard'], cwd=FRONTEND_DIR,
+                                   capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError) as e:
+        detail = e.stderr.strip() if isinstance(e, subprocess.CalledProcessError) else str(e)
+        raise ValueError(f"Could not diff against '{ref}': {detail}")
+    return sorted(set(diff.splitlines()) | set(untracked.splitlines()))
+
+
+def _resolve(importer, specifier):
+    """Path (relative to FRONTEND_DIR) a relative import points at, or None for packages"""
+    if not specifier.startswith('.'):
+        return None
+    base = os.path.normpath(os.path.join(os.path.dirname(importer), specifier))
+    candidates = [base] + [base + ext for ext in SOURCE_EXTENSIONS] + \
+                 [os.path.join(base, 'index' + ext) for ext in SOURCE_EXTENSIONS]
+    for candidate in candidates:
+        if os.path.isfile(os.path.join(FRONTEND_DIR, candidate)):
+            return candidate.replace(os.sep, '/')
+    return None
+
+
+def _read(path):
+    with open(os.path.join(FRONTEND_DIR, path), encoding='utf-8') as stream:
+        return stream.read()
+
+
+def build_import_graph(src_dir='src'):
+    """{file: set of files importing it} over every source module under src_dir"""
+    importers = {}
+    for root, _, files in os.walk(os.path.join(FRONTEND_DIR, src_dir)):
+        for filename in files:
+            if not filename.endswith(SOURCE_EXTENSIONS):
+                continue
+            path = os.path.relpath(os.path.join(root, filename), FRONTEND_DIR).replace(os.sep, '/')
+            for match in IMPORT_PATTERN.finditer(_read(path)):
+                target = _resolve(path, match.group(1) or match.group(2))
+                if target:
+                    importers.setdefault(target, set()).add(path)
+    return importers
+
+
+def parse_routes(app_path='src/App.tsx'):
+    """{page file: set of route paths} from the <Route> elements in App.tsx"""
+    source = _read(app_path)
+    components = {name: _resolve(app_path, specifier) for name, specifier in DEFAULT_IMPORT_PATTERN.findall(source)}
+
+    pages = {}
+    for path, element in ROUTE_PATTERN.findall(source):
+        for name in COMPONENT_PATTERN.findall(element):
+            page = components.get(name)
+            # Wrappers (ProtectedRoute, Layout) serve many routes and count as shared
+            if page and page.startswith('src/pages/'):
+                pages.setdefault(page, set()).add(path)
+    return pages
+
+
+def affected_routes(path, importers, pages):
+    """Routes rendering `path`, or None if it reaches an entry point outside any routed page"""
+    routes = set()
+    seen = {path}
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        if current in FRONTEND_ENTRY_POINTS:
+            return None
+        if current in pages:
+            routes |= pages[current]
+        for importer in importers.get(current, ()):
+            # A page is mounted by App.tsx; that import does not make the page shared
+            if importer in seen or (current in pages and importer in FRONTEND_ENTRY_POINTS):
+                continue
+            seen.add(importer)
+            pending.append(importer)
+    return routes
+
+
+def route_paths(planned):
+    """App route paths behind a planned test's route tags"""
+    paths = set()
+    for tag in planned.routes:
+        paths.update(ROUTE_TAGS[tag] if tag in ROUTE_TAGS else [NAVIGATION_PATHS[tag]])
+    return paths
+
+
+def select_tests(plan, changed):
+    """Narrow the plan to the tests covering the changed files (or keep it whole when unsafe)"""
+    routes = set()
+    modules = set()
+    importers = None
+    for path in changed:
+        if any(fnmatch.fnmatch(path, pattern) for pattern in IMPACT_IGNORED_FILES):
+            continue
+        if path.startswith('tests/'):
+            module = os.path.splitext(path[len('tests/'):])[0].replace('/', '.')
+            if not any(planned.module == module for planned in plan):
+                return Impact(plan, routes, set(), f"{path} is shared test code")
+            modules.add(module)
+            continue
+        if not path.startswith('src/'):
+            return Impact(plan, routes, set(), f"{path} is outside src/")
+
+        if importers is None:
+            importers, pages = build_import_graph(), parse_routes()
+        path_routes = affected_routes(path, importers, pages)
+        if path_routes is None:
+            return Impact(plan, routes, set(), f"{path} is shared by every route")
+        routes |= path_routes
+
+    tests = [planned for planned in plan if planned.module in modules or route_paths(planned) & routes]
+    covered = set().union(*(route_paths(planned) for planned in plan))
+    return Impact(tests, routes, routes - covered, None)
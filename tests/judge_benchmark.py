@@ -0,0 +1,215 @@
+"""
+Judge Submission Benchmark for RavenCode Frontend Test Suite
+Submits batches of solutions concurrently and polls for verdicts the way
+judgeService.waitForSubmissionResult does, measuring submit-to-verdict latency
+and how much of it is spent waiting for the next poll
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from urllib.parse import quote
+
+from stats import summarize
+from http_load import ConnectionPool, CONNECTION_ERRORS
+from test_data.users import STATIC_USERS
+from config import (
+    JUDGE_API_URL, JUDGE_POLL_INTERVAL, JUDGE_MAX_WAIT, JUDGE_CREDENTIALS, JUDGE_PROBLEM_TITLE,
+    JUDGE_BENCH_BATCH_SIZE, JUDGE_BENCH_BATCHES
+)
+
+
+# A correct solution to the Module 1 assessment problem
+SOLUTION_CODE = """n = int(input())
+numeros = [float(input()) for _ in range(n)]
+print(f"{sum(numeros) / n:.2f}")
+"""
+
+# Statuses judgeService keeps polling on
+IN_PROGRESS_STATUSES = ('pending', 'running')
+
+
+class JudgeClient:
+    """The judgeService.ts calls the assessment pages make, over a pooled connection"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.token = None
+
+    async def login(self):
+        status, body = await self.pool.request('POST', '/api/v1/auth/login', form=JUDGE_CREDENTIALS)
+        if status != 200 or not body.get('access_token'):
+            raise ConnectionError(f"Judge login failed with status {status}")
+        self.token = body['access_token']
+
+    async def find_problem(self, title):
+        """Problem id looked up by title, as assessment_judge1.tsx does"""
+        status, problems = await self.pool.request('GET', '/api/v1/problems/', token=self.token)
+        for problem in problems if status == 200 else []:
+            if problem.get('title') == title:
+                return problem.get('_id') or problem.get('id')
+        raise LookupError(f"Judge problem not found: {title}")
+
+    async def create_submission(self, problem_id, code, email):
+        return await self.pool.request('POST', '/api/v1/submissions/', {
+            'problem_id': problem_id, 'code': code, 'language': 'python', 'email': email
+        }, token=self.token)
+
+    async def get_submission(self, submission_id, email):
+        return await self.pool.request(
+            'GET', f"/api/v1/submissions/{submission_id}?email={quote(email)}", token=self.token
+        )
+
+
+async def submit_and_wait(client, problem_id, email, poll_interval, max_wait=None):
+    """Submit once, then poll until a verdict; returns one timing sample"""
+    max_wait = max_wait or JUDGE_MAX_WAIT
+    submitted_at = time.time()
+    try:
+        status, submission = await client.create_submission(problem_id, SOLUTION_CODE, email)
+    except CONNECTION_ERRORS as e:
+        return {'verdict': None, 'error': f"submit failed: {str(e)}"}
+    submission_id = submission.get('_id') or submission.get('id')
+    if status >= 400 or not submission_id:
+        return {'verdict': None, 'error': f"submit returned {status}"}
+
+    polls = 0
+    last_poll = None
+    while time.time() - submitted_at < max_wait:
+        polled_at = time.time()
+        polls += 1
+        try:
+            status, submission = await client.get_submission(submission_id, email)
+        except CONNECTION_ERRORS:
+            status = None
+        if status == 200 and submission.get('status') not in IN_PROGRESS_STATUSES:
+            observed_at = time.time()
+            completed_at = submission.get('completed_at')
+            if isinstance(completed_at, (int, float)):
+                poll_delay = max(0.0, observed_at - completed_at)
+            else:
+                # Without a completion time the verdict landed somewhere since the previous poll
+                poll_delay = (observed_at - last_poll) / 2 if last_poll else 0.0
+            return {
+                'verdict': submission.get('status'),
+                'latency': observed_at - submitted_at,
+                'poll_delay': poll_delay,
+                'polls': polls,
+                'exact': isinstance(completed_at, (int, float))
+            }
+        last_poll = polled_at
+        await asyncio.sleep(poll_interval)
+
+    return {'verdict': None, 'error': 'timed out', 'polls': polls}
+
+
+async def run_interval(poll_interval, batch_size, batches, base_url=None):
+    """Run `batches` rounds of `batch_size` concurrent submissions at one polling interval"""
+    pool = ConnectionPool(base_url or JUDGE_API_URL, batch_size)
+    client = JudgeClient(pool)
+    try:
+        await client.login()
+        problem_id = await client.find_problem(JUDGE_PROBLEM_TITLE)
+        emails = [user['email'] for user in STATIC_USERS.values()]
+
+        samples = []
+        for _ in range(batches):
+            samples.extend(await asyncio.gather(*(
+                submit_and_wait(client, problem_id, emails[index % len(emails)], poll_interval)
+                for index in range(batch_size)
+            )))
+    finally:
+        await pool.close()
+    return samples
+
+
+def summarize_interval(poll_interval, samples):
+    """Latency, poll-delay share and polling cost for one interval"""
+    verdicts = [sample for sample in samples if sample['verdict']]
+    latencies = [sample['latency'] for sample in verdicts]
+    poll_delays = [sample['poll_delay'] for sample in verdicts]
+    return {
+        'poll_interval': poll_interval,
+        'submissions': len(samples),
+        'verdicts': len(verdicts),
+        'failures': len(samples) - len(verdicts),
+        'latency': summarize(latencies),
+        'poll_delay': summarize(poll_delays),
+        'poll_delay_share': sum(poll_delays) / sum(latencies) if latencies else None,
+        'polls_per_submission': sum(sample.get('polls', 0) for sample in samples) / len(samples) if samples else 0,
+        'exact': all(sample['exact'] for sample in verdicts)
+    }
+
+
+def log_interval_result(logger, result):
+    """Log one interval's summary and stream it for the report"""
+    latency, poll_delay = result['latency'], result['poll_delay']
+    if not latency['count']:
+        logger.add_log(f"Poll every {result['poll_interval']}s: no verdicts received", "FAIL")
+    else:
+        logger.add_log(
+            f"Poll every {result['poll_interval']}s: {result['verdicts']}/{result['submissions']} verdicts, "
+            f"submit-to-verdict p50 {latency['p50']:.2f}s / p95 {latency['p95']:.2f}s, "
+            f"poll delay p50 {poll_delay['p50']:.2f}s ({result['poll_delay_share'] * 100:.0f}% of latency"
+            f"{'' if result['exact'] else ', estimated'}), {result['polls_per_submission']:.1f} polls/submission",
+            "PASS" if not result['failures'] else "WARN"
+        )
+    logger.add_record(dict(result, kind='judge_benchmark'))
+
+
+def run_judge_benchmark(logger, intervals=None, batch_size=None, batches=None):
+    """Benchmark each polling interval in turn; returns pass/fail per interval (all verdicts received)"""
+    intervals = intervals or [JUDGE_POLL_INTERVAL]
+    batch_size = batch_size or JUDGE_BENCH_BATCH_SIZE
+    batches = batches or JUDGE_BENCH_BATCHES
+    results = {}
+    for poll_interval in intervals:
+        logger.add_log(
+            f"Judge benchmark: {batches} batches of {batch_size} concurrent submissions, polling every {poll_interval}s",
+            "INFO"
+        )
+        try:
+            samples = asyncio.run(run_interval(poll_interval, batch_size, batches))
+        except (LookupError, *CONNECTION_ERRORS) as e:
+            logger.add_log(f"Judge benchmark could not run: {str(e)}", "FAIL")
+            results[f"poll_{poll_interval}s"] = False
+            continue
+        result = summarize_interval(poll_interval, samples)
+        log_interval_result(logger, result)
+        results[f"poll_{poll_interval}s"] = result['verdicts'] > 0 and not result['failures']
+    return results
+
+
+def main():
+    """Benchmark the judge from the command line (optionally against the local stub)"""
+    from test_logger import TestLogger
+    from stub_backend import StubBackend
+
+    parser = argparse.ArgumentParser(description='RavenCode judge submission benchmark')
+    parser.add_argument('--intervals', default=str(JUDGE_POLL_INTERVAL),
+                        help='Comma-separated polling intervals to compare, in seconds (e.g. 1,0.5,0.25)')
+    parser.add_argument('--batch-size', type=int, help='Concurrent submissions per batch (default: JUDGE_BENCH_BATCH_SIZE)')
+    parser.add_argument('--batches', type=int, help='Batches per polling interval (default: JUDGE_BENCH_BATCHES)')
+    parser.add_argument('--stub-backend', action='store_true', help='Run against the in-process stub judge')
+    parser.add_argument('--processing-time', type=float, help='Stub judge seconds per submission')
+    parser.add_argument('--processing-jitter', type=float, help='Stub judge extra random seconds per submission')
+    args = parser.parse_args()
+
+    logger = TestLogger("RavenCode Judge Benchmark", stream=False)
+    backend = None
+    if args.stub_backend:
+        backend = StubBackend(
+            logger, judge_processing_time=args.processing_time, judge_processing_jitter=args.processing_jitter
+        ).start()
+    try:
+        intervals = [float(interval) for interval in args.intervals.split(',')]
+        results = run_judge_benchmark(logger, intervals, args.batch_size, args.batches)
+    finally:
+        if backend:
+            backend.stop()
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
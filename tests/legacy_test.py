@@ -3,15 +3,17 @@ Legacy Integration Test for RavenCode Frontend
 Converted from the original monolithic test file
 """
 
-import time
 import random
 from base_test import BaseTest
+from registry import register_suite, register_test
 from test_data.users import get_admin_user, get_student_user, generate_test_user
 
 
+@register_suite('legacy_integration')
 class LegacyIntegrationTest(BaseTest):
     """Legacy integration test suite"""
     
+    @register_test('test_legacy_valid_login', 'valid_login', routes=('login', 'dashboard'), tags=('login', 'student'))
     def test_login_valid_user(self):
         """Test login with valid user credentials"""
         self.logger.add_log("Testing valid user login", "INFO")
@@ -35,6 +37,7 @@ class LegacyIntegrationTest(BaseTest):
         
         return success
     
+    @register_test('test_legacy_invalid_login', 'invalid_login', routes=('login',), tags=('login', 'negative'))
     def test_login_invalid_user(self):
         """Test login with invalid user credentials"""
         self.logger.add_log("Testing invalid user login", "INFO")
@@ -48,6 +51,7 @@ class LegacyIntegrationTest(BaseTest):
         
         return success
     
+    @register_test('test_legacy_registration', 'new_user_registration', routes=('register',), tags=('registration', 'form'))
     def test_register_new_user(self):
         """Test registration of a new user"""
         self.logger.add_log("Testing registration of a new user", "INFO")
@@ -85,8 +89,7 @@ class LegacyIntegrationTest(BaseTest):
             # Click register button
             register_button = self.wait_for_clickable("xpath", "//button[contains(., 'Crear cuenta')]")
             if register_button:
-                register_button.click()
-                time.sleep(2)
+                self.click_and_wait(register_button)
                 
                 # Check for successful registration (redirect to login)
                 if "login" in self.driver.current_url.lower():
@@ -103,12 +106,16 @@ class LegacyIntegrationTest(BaseTest):
             self.logger.add_log(f"New user registration: FAIL ({str(e)})", "FAIL")
             return None
     
+    @register_test('test_legacy_duplicate_registration', 'duplicate_registration', routes=('register',), tags=('registration', 'negative'), args=(None,))
     def test_register_existing_user(self, email):
         """Test registration of an existing user"""
         self.logger.add_log("Testing registration of an existing user", "INFO")
         
         if not email:
-            email = get_student_user()['email']
+            account = self.get_test_account("existing-user registration", get_student_user())
+            if not account:
+                return False
+            email = account['email']
         
         self.navigate_to("/register")
         
@@ -141,8 +148,7 @@ class LegacyIntegrationTest(BaseTest):
             # Submit
             register_button = self.wait_for_clickable("xpath", "//button[contains(., 'Crear cuenta')]")
             if register_button:
-                register_button.click()
-                time.sleep(2)
+                self.click_and_wait(register_button)
                 
                 # Should show error or stay on registration page
                 error_toast = self.wait_for_toast_message("Email already registered", timeout=5)
@@ -157,6 +163,7 @@ class LegacyIntegrationTest(BaseTest):
             self.logger.add_log(f"Existing user registration: FAIL ({str(e)})", "FAIL")
             return False
     
+    @register_test('test_legacy_forgot_password', 'forgot_password', routes=('forgot_password',), tags=('form',))
     def test_forgot_password_request(self, test_email=None):
         """Test forgot password request"""
         self.logger.add_log("Testing forgot password request", "INFO")
@@ -189,6 +196,7 @@ class LegacyIntegrationTest(BaseTest):
             self.logger.add_log(f"Forgot password request: FAIL ({str(e)})", "FAIL")
             return False
     
+    @register_test('test_legacy_dashboard', 'dashboard', routes=('dashboard',), tags=('smoke', 'admin'))
     def test_dashboard(self, user_email=None, user_password=None, expected_name="Usuario"):
         """Test dashboard page"""
         self.logger.add_log("Testing dashboard page", "INFO")
@@ -216,15 +224,13 @@ class LegacyIntegrationTest(BaseTest):
             
             # Check for key dashboard elements
             elements_to_check = [
-                "//*[contains(text(), 'Continúa Tu Aventura')]",
-                "//*[contains(text(), 'Fundamentos de Python')]",
-                "//*[contains(text(), 'Logros')]"
+                ("xpath", "//*[contains(text(), 'Continúa Tu Aventura')]"),
+                ("xpath", "//*[contains(text(), 'Fundamentos de Python')]"),
+                ("xpath", "//*[contains(text(), 'Logros')]")
             ]
             
-            found_elements = 0
-            for element_xpath in elements_to_check:
-                if self.wait_for_element("xpath", element_xpath, timeout=5):
-                    found_elements += 1
+            presence = self.check_elements_present(elements_to_check, timeout=5)
+            found_elements = sum(presence.values())
             
             if found_elements >= 2:
                 self.logger.add_log("Dashboard page: PASS (all key elements found)", "PASS")
@@ -237,15 +243,19 @@ class LegacyIntegrationTest(BaseTest):
             self.logger.add_log(f"Dashboard page: FAIL ({str(e)})", "FAIL")
             return False
     
+    @register_test('test_legacy_settings_update', 'settings_update', routes=('dashboard', 'settings'), tags=('form', 'student'))
     def test_settings_update(self, user_email=None, user_password=None, new_name="Updated Name", 
                            new_school="Updated School", new_grade="Updated Grade"):
         """Test settings page update"""
         self.logger.add_log("Testing settings page update", "INFO")
         
         if not user_email or not user_password:
-            student_user = get_student_user()
-            user_email = student_user['email']
-            user_password = student_user['password']
+            # A pooled account when the run seeded one, so the static users keep their profiles
+            account = self.get_test_account("settings update", get_student_user())
+            if not account:
+                return False
+            user_email = account['email']
+            user_password = account['password']
         
         # Login first
         if not self.login_user(user_email, user_password):
@@ -296,6 +306,7 @@ class LegacyIntegrationTest(BaseTest):
             self.logger.add_log(f"Settings page update: FAIL ({str(e)})", "FAIL")
             return False
     
+    @register_test('test_legacy_module1_workflow', 'module1_workflow', routes=('dashboard', 'courses', 'module1'), tags=('workflow', 'slow', 'admin'))
     def test_module1_full_workflow(self, user_email=None, user_password=None):
         """Test Module1 full workflow"""
         self.logger.add_log("Testing Module1 full workflow", "INFO")
@@ -326,8 +337,7 @@ class LegacyIntegrationTest(BaseTest):
             ver_contenidos_btn = self.wait_for_clickable("xpath", "//button[contains(., 'Ver contenidos')]")
             if ver_contenidos_btn:
                 self.scroll_to_element(ver_contenidos_btn)
-                ver_contenidos_btn.click()
-                time.sleep(2)
+                self.click_and_wait(ver_contenidos_btn)
             else:
                 self.logger.add_log("Ver contenidos button not found", "FAIL")
                 return False
@@ -336,8 +346,7 @@ class LegacyIntegrationTest(BaseTest):
             ver_leccion_btn = self.wait_for_clickable("xpath", "//button[contains(., 'Ver lección')][ancestor::*[contains(., 'Introducción')]]")
             if ver_leccion_btn:
                 self.scroll_to_element(ver_leccion_btn)
-                ver_leccion_btn.click()
-                time.sleep(2)
+                self.click_and_wait(ver_leccion_btn)
             else:
                 self.logger.add_log("Introduction Ver lección button not found", "FAIL")
                 return False
@@ -346,8 +355,7 @@ class LegacyIntegrationTest(BaseTest):
             inicia_btn = self.wait_for_clickable("xpath", "//button[contains(., 'Inicia tu aprendizaje')]")
             if inicia_btn:
                 self.scroll_to_element(inicia_btn)
-                inicia_btn.click()
-                time.sleep(2)
+                self.click_and_wait(inicia_btn)
             else:
                 self.logger.add_log("Inicia tu aprendizaje button not found", "FAIL")
                 return False
@@ -361,8 +369,7 @@ class LegacyIntegrationTest(BaseTest):
                 siguiente_btn = self.wait_for_clickable("xpath", "//button[contains(., 'Siguiente')]")
                 if siguiente_btn:
                     self.scroll_to_element(siguiente_btn)
-                    siguiente_btn.click()
-                    time.sleep(2)
+                    self.click_and_wait(siguiente_btn)
                 else:
                     self.logger.add_log(f"Siguiente button not found on lesson {lesson_num}", "FAIL")
                     return False
@@ -371,8 +378,7 @@ class LegacyIntegrationTest(BaseTest):
             reto_btn = self.wait_for_clickable("xpath", "//button[contains(., 'Reto')]")
             if reto_btn:
                 self.scroll_to_element(reto_btn)
-                reto_btn.click()
-                time.sleep(2)
+                self.click_and_wait(reto_btn)
             else:
                 self.logger.add_log("Reto button not found", "FAIL")
                 return False
@@ -398,27 +404,28 @@ class LegacyIntegrationTest(BaseTest):
         try:
             self.setup_driver()
             
-            # Run tests in sequence
+            # Run tests in sequence, each from a fresh browser context
             results['valid_login'] = self.test_login_valid_user()
-            self.logout_user()
+            self.reset_context()
             
             results['invalid_login'] = self.test_login_invalid_user()
+            self.reset_context()
             
-            new_email = self.test_register_new_user()
-            results['new_user_registration'] = bool(new_email)
+            results['new_user_registration'] = bool(self.test_register_new_user())
+            self.reset_context()
             
-            if new_email:
-                results['duplicate_registration'] = self.test_register_existing_user(new_email)
-            else:
-                results['duplicate_registration'] = self.test_register_existing_user(None)
+            results['duplicate_registration'] = self.test_register_existing_user(None)
+            self.reset_context()
             
             results['forgot_password'] = self.test_forgot_password_request()
+            self.reset_context()
             
             admin_user = get_admin_user()
             results['dashboard'] = self.test_dashboard(admin_user['email'], admin_user['password'], admin_user['name'])
+            self.reset_context()
             
-            student_user = get_student_user()
-            results['settings_update'] = self.test_settings_update(student_user['email'], student_user['password'])
+            results['settings_update'] = self.test_settings_update()
+            self.reset_context()
             
             results['module1_workflow'] = self.test_module1_full_workflow(admin_user['email'], admin_user['password'])
             
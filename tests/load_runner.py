@@ -0,0 +1,166 @@
+"""
+Load Runner for RavenCode Frontend Test Suite
+Runs N headless virtual students through the Module 1 journey at once, with a ramp-up
+and a fixed duration, and reports journeys per minute, step latencies and error rate
+"""
+
+import multiprocessing
+import queue
+import time
+
+from stats import summarize
+from test_logger import TestLogger
+from parallel_runner import drain_logs
+from screenshots import close_screenshot_writer
+from test_data.users import STATIC_USERS
+from config import LOAD_STUDENTS, LOAD_RAMP_UP, LOAD_DURATION, LOAD_MAX_ERROR_RATE
+
+
+# How long the coordinator waits on the result queue before checking student health
+RESULT_POLL_INTERVAL = 5
+
+
+def journey_step_name(record):
+    """Name a top-level span of the Module 1 journey, or None if it is not a journey step"""
+    if record.get('kind') != 'span' or record['depth'] > 1:
+        return None
+    step, tags = record['step'], record.get('tags', {})
+    if step == 'test':
+        return 'journey'
+    if step == 'login':
+        return f"login ({tags.get('mode')})"
+    if step == 'navigate':
+        return f"navigate {tags.get('path')}"
+    if step == 'click' and tags.get('label'):
+        return f"click {tags['label']}"
+    return None
+
+
+def _student_main(student_id, user, start_at, stop_at, result_queue):
+    """Virtual student: wait for its ramp-up slot, then repeat the journey until stop_at"""
+    from driver_pool import DriverPool
+    from test_suites.test_modules import ModuleTests
+
+    logger = TestLogger(f"RavenCode Virtual Student {student_id}", stream=False, history_limit=None)
+    driver_pool = DriverPool(size=1, headless=True)
+
+    try:
+        # Ramp-up: students join one after another rather than all at once
+        time.sleep(max(0, start_at - time.time()))
+        while time.time() < stop_at:
+            suite = ModuleTests(logger, driver_pool=driver_pool)
+            start_time = time.time()
+            try:
+                suite.setup_driver()
+                completed = bool(suite.test_module1_complete_workflow(user))
+            except Exception as e:
+                logger.add_log(f"[student {student_id}] Journey raised an unexpected error: {str(e)}", "FAIL")
+                completed = False
+            finally:
+                suite.teardown_driver()
+
+            result_queue.put((student_id, completed, time.time() - start_time, drain_logs(logger)))
+    finally:
+        driver_pool.shutdown()
+        close_screenshot_writer()
+        result_queue.put((student_id, None, 0, drain_logs(logger)))
+
+
+def run_load(logger, students=None, ramp_up=None, duration=None):
+    """Run the virtual-student load and log its summary; returns pass/fail per load criterion"""
+    students = max(1, students or LOAD_STUDENTS)
+    ramp_up = LOAD_RAMP_UP if ramp_up is None else ramp_up
+    duration = duration or LOAD_DURATION
+    users = list(STATIC_USERS.values())
+
+    logger.add_log(
+        f"Starting load: {students} virtual students, {ramp_up:.0f}s ramp-up, {duration:.0f}s duration", "INFO"
+    )
+
+    result_queue = multiprocessing.Queue()
+    load_start = time.time()
+    stop_at = load_start + duration
+    processes = [
+        multiprocessing.Process(
+            target=_student_main,
+            args=(student_id, users[(student_id - 1) % len(users)],
+                  load_start + ramp_up * (student_id - 1) / students, stop_at, result_queue),
+            daemon=True
+        )
+        for student_id in range(1, students + 1)
+    ]
+    for process in processes:
+        process.start()
+
+    journeys = 0
+    failures = 0
+    step_durations = {}
+    finished_students = 0
+    while finished_students < students:
+        try:
+            student_id, completed, _, entries = result_queue.get(timeout=RESULT_POLL_INTERVAL)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                logger.add_log("All virtual students exited before reporting back", "FAIL")
+                break
+            continue
+
+        logger.merge_logs(entries)
+        if completed is None:
+            finished_students += 1
+            continue
+
+        journeys += 1
+        failures += 0 if completed else 1
+        for record in entries:
+            name = journey_step_name(record)
+            if name:
+                step_durations.setdefault(name, []).append(record['duration'])
+
+    elapsed = time.time() - load_start
+    for process in processes:
+        process.join(timeout=RESULT_POLL_INTERVAL)
+
+    return log_load_summary(logger, students, ramp_up, elapsed, journeys, failures, step_durations)
+
+
+def log_load_summary(logger, students, ramp_up, elapsed, journeys, failures, step_durations):
+    """Log journeys per minute, error rate and per-step percentiles, and stream them for the report"""
+    completed = journeys - failures
+    error_rate = failures / journeys if journeys else 1.0
+    journeys_per_minute = completed / (elapsed / 60) if elapsed > 0 else 0.0
+    steps = sorted(
+        ((name, summarize(values)) for name, values in step_durations.items()),
+        key=lambda row: row[1]['total'], reverse=True
+    )
+
+    logger.add_log("=" * 60, "INFO")
+    logger.add_log(
+        f"LOAD RESULTS: {completed}/{journeys} journeys completed in {elapsed:.0f}s by {students} students "
+        f"({journeys_per_minute:.2f} journeys/min, {error_rate * 100:.1f}% errors)",
+        "PASS" if journeys and error_rate <= LOAD_MAX_ERROR_RATE else "FAIL"
+    )
+    for name, summary in steps:
+        logger.add_log(
+            f"  {name}: n={summary['count']} p50 {summary['p50']:.2f}s / p95 {summary['p95']:.2f}s / "
+            f"max {summary['max']:.2f}s",
+            "INFO"
+        )
+    logger.add_log("=" * 60, "INFO")
+
+    logger.add_record({
+        'kind': 'load',
+        'students': students,
+        'ramp_up': ramp_up,
+        'elapsed': elapsed,
+        'journeys': journeys,
+        'failures': failures,
+        'journeys_per_minute': journeys_per_minute,
+        'error_rate': error_rate,
+        'steps': [[name, summary['count'], summary['p50'], summary['p95'], summary['max']] for name, summary in steps]
+    })
+
+    return {
+        'journeys_completed': completed > 0,
+        'error_rate': bool(journeys) and error_rate <= LOAD_MAX_ERROR_RATE
+    }
@@ -0,0 +1,213 @@
+"""
+Network Capture for RavenCode Frontend Test Suite
+Opt-in recording of every request a page makes, from Chrome performance logs (CDP
+Network events): a waterfall summary per navigation and a HAR file per run
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+
+from stats import summarize
+from config import NETWORK_DIR, NETWORK_WATERFALL_ROWS
+
+
+# CDP resource types that are calls to the backends rather than page assets
+API_RESOURCE_TYPES = ('XHR', 'Fetch')
+
+
+def capture_enabled():
+    """Whether new drivers record network traffic (read at launch so worker processes follow --network-capture)"""
+    return os.getenv('NETWORK_CAPTURE', 'False').lower() == 'true'
+
+
+def enable_performance_log(options):
+    """Ask chromedriver for CDP Network events in the 'performance' log"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+
+def _timings(response, duration):
+    """HAR timings (ms, -1 when not applicable) from a CDP ResourceTiming"""
+    timing = response.get('timing') or {}
+    if not timing:
+        return {'blocked': -1, 'dns': -1, 'connect': -1, 'ssl': -1, 'send': 0, 'wait': duration, 'receive': 0}
+
+    def phase(start, end):
+        return timing[end] - timing[start] if timing.get(start, -1) >= 0 else -1
+
+    wait = timing['receiveHeadersEnd'] - timing['sendEnd']
+    return {
+        'blocked': -1,
+        'dns': phase('dnsStart', 'dnsEnd'),
+        'connect': phase('connectStart', 'connectEnd'),
+        'ssl': phase('sslStart', 'sslEnd'),
+        'send': timing['sendEnd'] - timing['sendStart'],
+        'wait': wait,
+        'receive': max(0.0, duration - timing['receiveHeadersEnd'])
+    }
+
+
+def parse_performance_log(log_entries):
+    """Requests (in start order) from chromedriver 'performance' log entries"""
+    pending = {}
+    finished = []
+    for log_entry in log_entries:
+        message = json.loads(log_entry['message'])['message']
+        method, params = message.get('method'), message.get('params', {})
+
+        if method == 'Network.requestWillBeSent':
+            request_id = params['requestId']
+            if request_id in pending and params.get('redirectResponse'):
+                # The previous hop of a redirect chain ends here
+                hop = pending.pop(request_id)
+                hop['response'] = params['redirectResponse']
+                hop['end'] = params['timestamp']
+                finished.append(hop)
+            pending[request_id] = {
+                'url': params['request']['url'],
+                'method': params['request']['method'],
+                'type': params.get('type', 'Other'),
+                'start': params['timestamp'],
+                'wall_time': params.get('wallTime'),
+                'response': {},
+                'bytes': 0
+            }
+        elif method == 'Network.responseReceived' and params.get('requestId') in pending:
+            pending[params['requestId']]['response'] = params['response']
+            pending[params['requestId']]['type'] = params.get('type', pending[params['requestId']]['type'])
+        elif method in ('Network.loadingFinished', 'Network.loadingFailed') and params.get('requestId') in pending:
+            request = pending.pop(params['requestId'])
+            request['end'] = params['timestamp']
+            request['bytes'] = params.get('encodedDataLength', 0)
+            request['error'] = params.get('errorText')
+            finished.append(request)
+
+    # Still in flight when the page settled: long polls, streams, beacons
+    finished.extend(pending.values())
+    if not finished:
+        return []
+
+    origin = min(request['start'] for request in finished)
+    entries = []
+    for request in sorted(finished, key=lambda request: request['start']):
+        response = request['response']
+        duration = (request['end'] - request['start']) * 1000 if 'end' in request else None
+        entries.append({
+            'url': request['url'],
+            'method': request['method'],
+            'type': request['type'],
+            'status': response.get('status'),
+            'mime_type': response.get('mimeType'),
+            'protocol': response.get('protocol'),
+            'from_cache': bool(response.get('fromDiskCache') or response.get('fromServiceWorker')),
+            'start_ms': (request['start'] - origin) * 1000,
+            'duration_ms': duration,
+            'bytes': request['bytes'],
+            'wall_time': request['wall_time'],
+            'error': request.get('error'),
+            'timings': _timings(response, duration or 0)
+        })
+    return entries
+
+
+def summarize_page(entries):
+    """Request count, bytes by resource type, API calls and overall span of one navigation"""
+    bytes_by_type = {}
+    for entry in entries:
+        bytes_by_type[entry['type']] = bytes_by_type.get(entry['type'], 0) + entry['bytes']
+    ends = [entry['start_ms'] + entry['duration_ms'] for entry in entries if entry['duration_ms'] is not None]
+    return {
+        'requests': len(entries),
+        'api_requests': sum(1 for entry in entries if entry['type'] in API_RESOURCE_TYPES),
+        'failed': sum(1 for entry in entries if entry['error'] or (entry['status'] or 0) >= 400),
+        'bytes': sum(bytes_by_type.values()),
+        'js_bytes': bytes_by_type.get('Script', 0),
+        'bytes_by_type': bytes_by_type,
+        'elapsed_ms': max(ends) if ends else 0.0,
+        'duration': summarize([entry['duration_ms'] for entry in entries if entry['duration_ms'] is not None])
+    }
+
+
+def waterfall(entries, rows=None):
+    """The slowest requests of a navigation, back in start order"""
+    rows = rows or NETWORK_WATERFALL_ROWS
+    slowest = sorted(entries, key=lambda entry: -(entry['duration_ms'] or 0))[:rows]
+    return sorted(slowest, key=lambda entry: entry['start_ms'])
+
+
+def log_page_network(logger, path, log_entries, test=None):
+    """Log one navigation's network summary and stream its requests for the report and HAR"""
+    entries = parse_performance_log(log_entries)
+    summary = summarize_page(entries)
+    slowest = max(entries, key=lambda entry: entry['duration_ms'] or 0, default=None)
+    logger.add_log(
+        f"Network {path}: {summary['requests']} requests ({summary['api_requests']} API, {summary['failed']} failed), "
+        f"{summary['bytes'] / 1024:.0f} KB ({summary['js_bytes'] / 1024:.0f} KB JS) in {summary['elapsed_ms']:.0f}ms"
+        + (f"; slowest {slowest['method']} {slowest['url']} {slowest['duration_ms'] or 0:.0f}ms" if slowest else ""),
+        "WARN" if summary['failed'] else "INFO"
+    )
+    logger.add_record({
+        'kind': 'network',
+        'page': path,
+        'test': test,
+        'started': datetime.now(timezone.utc).isoformat(),
+        'summary': summary,
+        'entries': entries
+    })
+    return summary
+
+
+def har_path(log_path=None):
+    """Where this run's HAR file goes (named after its log stream)"""
+    stem = os.path.splitext(os.path.basename(log_path))[0] if log_path else datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(NETWORK_DIR, f"{stem.replace('test_log', 'network')}.har")
+
+
+def write_har(records, path):
+    """Write the run's 'network' records as a HAR 1.2 file (one page per navigation); returns the entry count"""
+    pages = []
+    har_entries = []
+    for record in records:
+        if record.get('kind') != 'network':
+            continue
+        page_id = f"page_{len(pages) + 1}"
+        pages.append({
+            'id': page_id,
+            'title': f"{record['page']} ({record['test']})" if record.get('test') else record['page'],
+            'startedDateTime': record['started'],
+            'pageTimings': {'onLoad': record['summary']['elapsed_ms']}
+        })
+        for entry in record['entries']:
+            started = datetime.fromtimestamp(entry['wall_time'], timezone.utc).isoformat() \
+                if entry['wall_time'] else record['started']
+            har_entries.append({
+                'pageref': page_id,
+                'startedDateTime': started,
+                'time': entry['duration_ms'] or 0,
+                'request': {
+                    'method': entry['method'], 'url': entry['url'], 'httpVersion': entry['protocol'] or '',
+                    'cookies': [], 'headers': [], 'queryString': [], 'headersSize': -1, 'bodySize': -1
+                },
+                'response': {
+                    'status': entry['status'] or 0, 'statusText': entry['error'] or '',
+                    'httpVersion': entry['protocol'] or '', 'cookies': [], 'headers': [],
+                    'content': {'size': entry['bytes'], 'mimeType': entry['mime_type'] or ''},
+                    'redirectURL': '', 'headersSize': -1, 'bodySize': entry['bytes']
+                },
+                'cache': {},
+                'timings': entry['timings'],
+                '_resourceType': entry['type'],
+                '_fromCache': entry['from_cache']
+            })
+
+    if not pages:
+        return 0
+    with open(path, 'w', encoding='utf-8') as stream:
+        json.dump({'log': {
+            'version': '1.2',
+            'creator': {'name': 'RavenCode Frontend Test Suite', 'version': '1.0'},
+            'pages': pages,
+            'entries': har_entries
+        }}, stream, indent=1)
+    return len(har_entries)
@@ -0,0 +1,140 @@
+"""
+Parallel Test Runner for RavenCode Frontend Test Suite
+Dispatches individual tests to a pool of worker processes, each owning its own browser
+"""
+
+import importlib
+import multiprocessing
+import queue
+import time
+
+from history import longest_first
+from screenshots import close_screenshot_writer
+from test_logger import TestLogger
+
+
+# How long the coordinator waits on the result queue before checking worker health
+RESULT_POLL_INTERVAL = 5
+
+
+def drain_logs(logger):
+    """Take the entries collected so far off a worker logger"""
+    entries = list(logger.logs)
+    logger.logs.clear()
+    return entries
+
+
+def run_planned_test(planned, driver_pool, logger):
+    """Run one planned test on a session leased from the worker's pool, returning its outcome"""
+    suite_class = getattr(importlib.import_module(planned.module), planned.cls)
+    suite = suite_class(logger, driver_pool=driver_pool)
+    try:
+        suite.setup_driver()
+    except Exception as e:
+        logger.add_log(f"{planned.name} could not get a WebDriver: {str(e)}", "FAIL")
+        return False
+    
+    try:
+        return bool(getattr(suite, planned.method)(*planned.args))
+    except Exception as e:
+        logger.add_log(f"{planned.name} raised an unexpected error: {str(e)}", "FAIL")
+        suite.take_screenshot(f"{planned.name}_error")
+        return False
+    finally:
+        suite.teardown_driver()
+
+
+def _worker_main(worker_id, task_queue, result_queue):
+    """Worker loop: own one warm browser and run tests until the sentinel arrives"""
+    from driver_pool import DriverPool
+
+    # Entries go back to the coordinator's logger, which streams them to disk
+    logger = TestLogger(f"RavenCode Worker {worker_id}", stream=False, history_limit=None)
+    driver_pool = DriverPool(size=1)
+
+    try:
+        while True:
+            planned = task_queue.get()
+            if planned is None:
+                break
+
+            start_time = time.time()
+            logger.add_log(f"[worker {worker_id}] Running {planned.name}", "INFO")
+            result = run_planned_test(planned, driver_pool, logger)
+            duration = time.time() - start_time
+
+            result_queue.put((planned, result, duration, drain_logs(logger)))
+    finally:
+        driver_pool.shutdown()
+        close_screenshot_writer()
+        result_queue.put((None, driver_pool.stats(), 0, drain_logs(logger)))
+
+
+def run_sequential(plan, driver_pool, logger):
+    """Run planned tests one after another in this process, timing each like run_parallel"""
+    logger.add_log(f"Running {len(plan)} planned tests on one browser", "INFO")
+    results = {}
+    durations = {}
+    for planned in plan:
+        start_time = time.time()
+        logger.add_log(f"Running {planned.name}", "INFO")
+        results.setdefault(planned.suite, {})[planned.key] = run_planned_test(planned, driver_pool, logger)
+        durations[planned.name] = time.time() - start_time
+    return results, durations
+
+
+def run_parallel(plan, workers, logger, first=()):
+    """Run planned tests across worker processes and merge results into suite dicts
+
+    Tests named in `first` are dispatched before the rest (e.g. last run's failures).
+    """
+    workers = max(1, min(workers, len(plan)))
+    logger.add_log(f"Dispatching {len(plan)} tests to {workers} browser workers", "INFO")
+
+    task_queue = multiprocessing.Queue()
+    result_queue = multiprocessing.Queue()
+    # Longest first, so a slow workflow never starts last and stretches the run
+    for planned in longest_first(plan, first=first):
+        task_queue.put(planned)
+    for _ in range(workers):
+        task_queue.put(None)
+
+    processes = [
+        multiprocessing.Process(target=_worker_main, args=(worker_id, task_queue, result_queue), daemon=True)
+        for worker_id in range(1, workers + 1)
+    ]
+    for process in processes:
+        process.start()
+
+    results = {}
+    durations = {}
+    pool_stats = []
+    finished_workers = 0
+    while finished_workers < workers:
+        try:
+            planned, result, duration, entries = result_queue.get(timeout=RESULT_POLL_INTERVAL)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                logger.add_log("All browser workers exited before reporting back", "FAIL")
+                break
+            continue
+
+        logger.merge_logs(entries)
+        if planned is None:
+            pool_stats.append(result)
+            finished_workers += 1
+            continue
+
+        results.setdefault(planned.suite, {})[planned.key] = result
+        durations[planned.name] = duration
+
+    for process in processes:
+        process.join(timeout=RESULT_POLL_INTERVAL)
+
+    # Tests lost to a crashed worker count as failures rather than vanishing
+    for planned in plan:
+        if planned.name not in durations:
+            logger.add_log(f"{planned.name} did not report a result", "FAIL")
+            results.setdefault(planned.suite, {})[planned.key] = False
+
+    return results, durations, pool_stats
@@ -0,0 +1,92 @@
+"""
+Test Registry for RavenCode Frontend Test Suite
+Suites register their tests with decorators as their modules are imported; discover()
+imports the SUITE_MODULES to collect them. Suite modules import Selenium only inside
+the code that drives a browser, so listing and planning a run stays cheap.
+"""
+
+import importlib
+from collections import namedtuple
+
+
+# A single schedulable test: where it reports (suite/key), how to call it, the route
+# tags (NAVIGATION_PATHS / ROUTE_TAGS keys) of the pages it exercises and its selection tags
+PlannedTest = namedtuple(
+    'PlannedTest', ['name', 'suite', 'key', 'module', 'cls', 'method', 'args', 'routes', 'tags'],
+    defaults=((), ())
+)
+
+# Modules holding registered suites, in run order
+SUITE_MODULES = [
+    'test_suites.test_authentication',
+    'test_suites.test_modules',
+    'legacy_test',
+    'test_suites.test_visual'
+]
+
+# Registered tests by defining module, filled in as suite modules are imported
+_registry = {}
+_registered = None
+
+
+def register_suite(name):
+    """Class decorator: register the class's @register_test methods under a suite name (result dict)"""
+    def decorate(cls):
+        cls.suite_name = name
+        planned = []
+        for method_name, member in vars(cls).items():
+            registration = getattr(member, 'registration', None)
+            if registration is None:
+                continue
+            planned.append(PlannedTest(
+                registration['name'], name, registration['key'], cls.__module__, cls.__name__, method_name,
+                tuple(registration['args']), tuple(registration['routes']), tuple(registration['tags'])
+            ))
+        _registry.setdefault(cls.__module__, []).extend(planned)
+        return cls
+    return decorate
+
+
+def register_test(name, key, routes=(), tags=(), args=()):
+    """Method decorator: make a suite method a schedulable test (registered by its @register_suite class)"""
+    def decorate(method):
+        method.registration = {'name': name, 'key': key, 'routes': routes, 'tags': tags, 'args': args}
+        return method
+    return decorate
+
+
+def discover():
+    """Every registered test, collected once per process by importing the SUITE_MODULES"""
+    global _registered
+    if _registered is None:
+        registered = []
+        for module in SUITE_MODULES:
+            importlib.import_module(module)
+            registered.extend(_registry.get(module, []))
+
+        names = [planned.name for planned in registered]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Tests registered more than once: {', '.join(duplicates)}")
+        _registered = registered
+    return list(_registered)
+
+
+def get_plan(suites=None, tags=None):
+    """Return the registered tests, optionally restricted to some suites and to tests carrying any of some tags"""
+    plan = discover()
+    if suites:
+        plan = [planned for planned in plan if planned.suite in suites]
+    if tags:
+        plan = [planned for planned in plan if set(planned.tags) & set(tags)]
+    return plan
+
+
+def find_planned(name):
+    """The test registered under a name, or None"""
+    return next((planned for planned in discover() if planned.name == name), None)
+
+
+def all_tags():
+    """Every tag in use, sorted"""
+    return sorted({tag for planned in discover() for tag in planned.tags})
@@ -4,29 +4,58 @@ Main Test Runner for RavenCode Frontend Test Suite
 Orchestrates and executes all test suites with comprehensive reporting
 """
 
+import os
 import sys
 import argparse
+import sqlite3
 import time
 from datetime import datetime
 
-# Import test suites
+# Test suites (and Selenium with them) are imported only when a run selects them
 from test_logger import TestLogger
-from test_suites.test_authentication import AuthenticationTests
-from test_suites.test_modules import ModuleTests
-
-# Import the original monolithic test (converted from your provided file)
-from legacy_test import LegacyIntegrationTest
+from driver_pool import DriverPool, log_startup_savings
+from timing import SpanTable, log_step_timings
+from history import record_run, load_failed, longest_first, load_durations, duration_estimator
+from screenshots import close_screenshot_writer
+from network import capture_enabled, har_path, write_har
+from budgets import check_budgets, log_budget_results
+from accounts import seed_accounts, remove_pool
+from impact import changed_files, select_tests
+from registry import get_plan, find_planned, all_tags
+from parallel_runner import run_parallel, run_sequential, run_planned_test
+from sharding import (
+    parse_shard, load_split_durations, write_split_durations, split_fingerprint, balance_shards,
+    write_shard_result, read_shard_results, check_shards, iter_shard_logs, merge_shard_results
+)
+from load_runner import run_load
+from http_load import ENDPOINTS, run_auth_load
+from judge_benchmark import run_judge_benchmark
+from stub_backend import StubBackend
+from frontend_server import start_frontend
+from config import ACCOUNT_POOL_SIZE
 
 
 class RavenCodeTestRunner:
     """Main test runner for RavenCode frontend tests"""
     
-    def __init__(self, verbose=False, headless=False, timeout=10):
+    def __init__(self, verbose=False, headless=False, timeout=10, workers=1, perf_iterations=None):
         self.verbose = verbose
         self.headless = headless
         self.timeout = timeout
+        self.workers = workers
+        self.perf_iterations = perf_iterations
         self.logger = TestLogger("RavenCode Frontend Test Suite")
         self.all_results = {}
+        self.test_durations = {}
+        self.driver_pool = DriverPool(logger=self.logger)
+        self.pool_stats = []
+        self.stub_backend = None
+        self.frontend_server = None
+        self.account_pool_dir = None
+        self.merged_end_time = None
+        self.shard_split = None
+        self.budgets_met = None
+        self.span_table = None
         
     def run_authentication_tests(self):
         """Run authentication test suite"""
@@ -34,7 +63,8 @@ class RavenCodeTestRunner:
         self.logger.add_log("STARTING AUTHENTICATION TESTS", "INFO")
         self.logger.add_log("=" * 60, "INFO")
         
-        auth_tests = AuthenticationTests(self.logger)
+        from test_suites.test_authentication import AuthenticationTests
+        auth_tests = AuthenticationTests(self.logger, driver_pool=self.driver_pool)
         results = auth_tests.run_all_tests()
         self.all_results['authentication'] = results
         return results
@@ -45,7 +75,8 @@ class RavenCodeTestRunner:
         self.logger.add_log("STARTING MODULE WORKFLOW TESTS", "INFO")
         self.logger.add_log("=" * 60, "INFO")
         
-        module_tests = ModuleTests(self.logger)
+        from test_suites.test_modules import ModuleTests
+        module_tests = ModuleTests(self.logger, driver_pool=self.driver_pool)
         results = module_tests.run_all_tests()
         self.all_results['modules'] = results
         return results
@@ -56,50 +87,310 @@ class RavenCodeTestRunner:
         self.logger.add_log("STARTING LEGACY INTEGRATION TEST", "INFO")
         self.logger.add_log("=" * 60, "INFO")
         
-        legacy_test = LegacyIntegrationTest(self.logger)
+        from legacy_test import LegacyIntegrationTest
+        legacy_test = LegacyIntegrationTest(self.logger, driver_pool=self.driver_pool)
         results = legacy_test.run_all_tests()
         self.all_results['legacy_integration'] = results
         return results
     
+    def run_visual_tests(self):
+        """Run visual regression checks against the stored baselines"""
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log("STARTING VISUAL REGRESSION TESTS", "INFO")
+        self.logger.add_log("=" * 60, "INFO")
+        
+        from test_suites.test_visual import VisualTests
+        visual_tests = VisualTests(self.logger, driver_pool=self.driver_pool)
+        results = visual_tests.run_all_tests()
+        self.all_results['visual'] = results
+        return results
+    
+    def run_performance_tests(self):
+        """Run the page-load benchmark over NAVIGATION_PATHS"""
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log("STARTING PAGE-LOAD BENCHMARK", "INFO")
+        self.logger.add_log("=" * 60, "INFO")
+        
+        from test_suites.test_performance import PerformanceTests
+        perf_tests = PerformanceTests(self.logger, driver_pool=self.driver_pool, iterations=self.perf_iterations)
+        results = perf_tests.run_all_tests()
+        self.all_results['performance'] = results
+        return results
+    
+    def run_load_test(self, students, ramp_up=None, duration=None):
+        """Run virtual students through the Module 1 journey concurrently"""
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log(f"STARTING LOAD TEST ({students} VIRTUAL STUDENTS)", "INFO")
+        self.logger.add_log("=" * 60, "INFO")
+        
+        results = run_load(self.logger, students=students, ramp_up=ramp_up, duration=duration)
+        self.all_results['load'] = results
+        return results
+    
+    def run_auth_load_test(self, concurrency, endpoints=None, requests=None, duration=None):
+        """Load the auth endpoints with the asyncio HTTP driver (no browser)"""
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log(f"STARTING AUTH ENDPOINT LOAD ({concurrency} CLIENTS)", "INFO")
+        self.logger.add_log("=" * 60, "INFO")
+        
+        results = run_auth_load(self.logger, concurrency, endpoints=endpoints, requests=requests, duration=duration)
+        self.all_results['auth_load'] = results
+        return results
+    
+    def run_judge_benchmark(self, intervals):
+        """Benchmark judge submit-to-verdict latency at each polling interval"""
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log("STARTING JUDGE SUBMISSION BENCHMARK", "INFO")
+        self.logger.add_log("=" * 60, "INFO")
+        
+        results = run_judge_benchmark(self.logger, intervals)
+        self.all_results['judge_benchmark'] = results
+        return results
+    
+    def run_parallel_tests(self, suites=None, tags=None):
+        """Run individual tests from the selected suites on a pool of browser workers"""
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log(f"STARTING PARALLEL EXECUTION ({self.workers} WORKERS)", "INFO")
+        self.logger.add_log("=" * 60, "INFO")
+        
+        results, durations, pool_stats = run_parallel(get_plan(suites, tags), self.workers, self.logger)
+        self.all_results.update(results)
+        self.test_durations.update(durations)
+        self.pool_stats.extend(pool_stats)
+        return results
+    
+    def run_shard(self, index, count, suites=None, tags=None, durations_path=None):
+        """Run shard index of count, split from the plan by the shared per-test durations"""
+        full_plan = get_plan(suites, tags)
+        durations, source = load_split_durations(durations_path)
+        shards, totals = balance_shards(full_plan, count, durations)
+        plan = shards[index - 1]
+        self.shard_split = {
+            'fingerprint': split_fingerprint(full_plan, count, durations),
+            'durations_file': os.path.basename(source) if source else None,
+            'plan': [planned.name for planned in full_plan],
+            'planned': [planned.name for planned in plan]
+        }
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log(
+            f"STARTING SHARD {index}/{count}: {len(plan)} tests, ~{totals[index - 1]:.0f}s estimated "
+            f"(shard estimates: {', '.join(f'{total:.0f}s' for total in totals)})",
+            "INFO"
+        )
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log(
+            f"Split {self.shard_split['fingerprint']} computed from "
+            f"{source or 'SEED_TEST_DURATIONS (no durations file)'}",
+            "INFO" if source else "WARN"
+        )
+        if not plan:
+            self.logger.add_log(f"Shard {index}/{count} has no tests to run", "INFO")
+            return {}
+        return self.run_plan(plan)
+    
+    def run_changed_tests(self, ref, suites=None, tags=None):
+        """Run only the planned tests covering the files changed since a git ref"""
+        changed = changed_files(ref)
+        impact = select_tests(get_plan(suites, tags), changed)
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log(f"STARTING CHANGE-IMPACT RUN: {len(changed)} files changed since {ref}", "INFO")
+        self.logger.add_log("=" * 60, "INFO")
+        
+        if impact.full_run:
+            self.logger.add_log(f"Running the full plan: {impact.full_run}", "WARN")
+        else:
+            self.logger.add_log(
+                f"Selected {len(impact.tests)} tests for {len(impact.routes)} affected routes: "
+                f"{', '.join(sorted(impact.routes)) or 'none'}",
+                "INFO"
+            )
+            if impact.uncovered_routes:
+                self.logger.add_log(
+                    f"Affected routes no test covers: {', '.join(sorted(impact.uncovered_routes))}", "WARN"
+                )
+        if not impact.tests:
+            self.logger.add_log("No planned test covers the changed files", "INFO")
+            return {}
+        return self.run_plan(impact.tests)
+    
+    def run_failed_tests(self, failed_first=False, suites=None, tags=None):
+        """Rerun the tests whose latest recorded outcome is a failure, alone or ahead of the rest"""
+        plan = get_plan(suites, tags)
+        failed = load_failed()
+        failed_plan = [planned for planned in plan if planned.name in failed]
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log(f"STARTING {'FAILED-FIRST' if failed_first else 'LAST-FAILED'} RUN", "INFO")
+        self.logger.add_log("=" * 60, "INFO")
+        
+        if failed_plan:
+            self.logger.add_log(
+                f"{len(failed_plan)} tests failed on their last recorded run: "
+                f"{', '.join(planned.name for planned in failed_plan)}",
+                "INFO"
+            )
+        else:
+            self.logger.add_log("No recorded failures in the selected suites", "INFO")
+        unplanned = sorted(name for name in failed if not find_planned(name))
+        if unplanned:
+            self.logger.add_log(f"Recorded failures with no planned test (not rerun): {', '.join(unplanned)}", "WARN")
+        
+        if failed_first:
+            plan = failed_plan + [planned for planned in plan if planned.name not in failed]
+        elif not failed_plan:
+            return {}
+        else:
+            plan = failed_plan
+        return self.run_plan(plan, first=failed)
+    
+    def run_tagged_tests(self, tags, suites=None):
+        """Run the registered tests carrying any of the given tags"""
+        plan = get_plan(suites, tags)
+        self.logger.add_log("=" * 60, "INFO")
+        self.logger.add_log(f"STARTING TAGGED RUN ({', '.join(tags)}): {len(plan)} tests", "INFO")
+        self.logger.add_log("=" * 60, "INFO")
+        
+        if not plan:
+            self.logger.add_log(f"No registered test is tagged {', '.join(tags)}", "FAIL")
+            return {}
+        return self.run_plan(plan)
+    
+    def run_plan(self, plan, first=()):
+        """Run a list of planned tests (on the workers if there are several) and summarize"""
+        start_time = time.time()
+        if self.workers > 1:
+            results, durations, pool_stats = run_parallel(plan, self.workers, self.logger, first=first)
+            self.pool_stats.extend(pool_stats)
+        else:
+            results, durations = run_sequential(plan, self.driver_pool, self.logger)
+        self.all_results.update(results)
+        self.test_durations.update(durations)
+        
+        self.generate_final_summary(time.time() - start_time)
+        return results
+    
+    def merge_shards(self, paths):
+        """Combine shard partial result files into one summary (the report follows from the merged log)
+
+        Returns the merged results and the reasons the shards do not make up one complete
+        run of one split (missing shards, different splits, tests run twice or never).
+        """
+        shards, missing = read_shard_results(paths)
+        self.logger.add_log(f"Merging {len(shards)} shard result files", "INFO")
+        for shard in shards:
+            self.logger.merge_logs(iter_shard_logs(shard))
+        
+        results, durations, start_time, end_time = merge_shard_results(shards)
+        problems = check_shards(shards, missing)
+        for problem in problems:
+            self.logger.add_log(problem, "FAIL")
+        self.all_results.update(results)
+        self.test_durations.update(durations)
+        
+        if start_time:
+            self.logger.start_time = start_time
+        self.merged_end_time = end_time
+        total_time = (end_time - start_time).total_seconds() if start_time and end_time else 0
+        self.generate_final_summary(total_time)
+        return results, problems
+    
+    def start_stub_backend(self):
+        """Serve the user, learning and judge APIs from the in-process stub backend"""
+        self.stub_backend = StubBackend(self.logger).start()
+    
+    def start_frontend_server(self):
+        """Build the app if its sources changed and serve dist/ on BASE_URL until shutdown"""
+        self.frontend_server = start_frontend(self.logger)
+    
+    def prepare_accounts(self, count=None):
+        """Seed this run's own account pool through the API (count accounts); without one, tests register on demand"""
+        if count is None:
+            return None
+        stem = os.path.splitext(os.path.basename(self.logger.log_path or ''))[0]
+        run_name = stem.replace('test_log', 'accounts') if stem else None
+        self.account_pool_dir = seed_accounts(self.logger, count, run_name=run_name)
+        return self.account_pool_dir
+    
+    def shutdown(self):
+        """Close pooled browser sessions, store pending screenshots, report timings and network traffic, stop the servers and drop the account pool"""
+        self.driver_pool.shutdown()
+        close_screenshot_writer()
+        log_startup_savings(self.logger, self.pool_stats + [self.driver_pool.stats()])
+        self.span_table = log_step_timings(self.logger)
+        if capture_enabled():
+            self.write_network_har()
+        if self.stub_backend:
+            self.stub_backend.stop()
+            self.stub_backend = None
+        if self.frontend_server:
+            self.frontend_server.stop()
+            self.frontend_server = None
+        if self.account_pool_dir:
+            remove_pool(self.account_pool_dir)
+            self.account_pool_dir = None
+    
+    def write_network_har(self):
+        """Write every navigation's captured requests to this run's HAR file"""
+        path = har_path(self.logger.log_path)
+        count = write_har(self.logger.iter_logs(), path)
+        if count:
+            self.logger.add_log(f"Network capture: {count} requests written to {os.path.basename(path)}", "INFO")
+        else:
+            self.logger.add_log("Network capture was on but no navigation recorded any requests", "WARN")
+    
+    def check_performance_budgets(self):
+        """Check every measured page load against PERFORMANCE_BUDGETS once; False when any budget was breached
+
+        The final summary runs the check so breaches count in its totals; runs that end
+        without a summary are checked on exit.
+        """
+        if self.budgets_met is not None:
+            return self.budgets_met
+        checks = check_budgets(self.logger.iter_logs())
+        if not checks:
+            self.budgets_met = True
+            return True
+        results = log_budget_results(self.logger, checks)
+        self.all_results['budgets'] = results
+        breached = sum(1 for result in results.values() if not result)
+        self.logger.add_log(
+            f"Performance budgets: {len(results) - breached}/{len(results)} met",
+            "FAIL" if breached else "PASS"
+        )
+        self.budgets_met = not breached
+        return self.budgets_met
+    
+    def record_history(self, arguments):
+        """Persist per-test outcomes, wall times and step timings of this run to the history database"""
+        try:
+            run_id = record_run(
+                get_plan(), self.all_results, self.test_durations, self.span_table or SpanTable(),
+                self.logger.start_time, self.logger.end_time, arguments, self.workers
+            )
+            self.logger.add_log(f"Run recorded in history database (run {run_id})", "INFO")
+        except sqlite3.Error as e:
+            self.logger.add_log(f"Could not record run history: {str(e)}", "WARN")
+    
     def run_specific_test(self, test_name):
-        """Run a specific test by name"""
+        """Run a specific test by name (any registered test, or test_legacy_full)"""
         self.logger.add_log(f"Running specific test: {test_name}", "INFO")
         
-        # Map test names to methods
-        test_methods = {
-            # Authentication tests
-            'test_login_valid_admin': lambda: AuthenticationTests(self.logger).test_valid_login_admin(),
-            'test_login_valid_student': lambda: AuthenticationTests(self.logger).test_valid_login_student(),
-            'test_login_invalid': lambda: AuthenticationTests(self.logger).test_invalid_login_wrong_password(),
-            'test_registration_new': lambda: AuthenticationTests(self.logger).test_user_registration_valid(),
-            'test_registration_duplicate': lambda: AuthenticationTests(self.logger).test_user_registration_duplicate_email(),
-            'test_forgot_password': lambda: AuthenticationTests(self.logger).test_forgot_password_request(),
-            'test_logout': lambda: AuthenticationTests(self.logger).test_logout_functionality(),
-            
-            # Module tests
-            'test_module1_workflow': lambda: ModuleTests(self.logger).test_module1_complete_workflow(),
-            'test_module2_workflow': lambda: ModuleTests(self.logger).test_module2_complete_workflow(),
-            'test_lesson_navigation': lambda: ModuleTests(self.logger).test_lesson_navigation_buttons(),
-            'test_assessment_load': lambda: ModuleTests(self.logger).test_assessment_page_load(),
-            
-            # Legacy tests
-            'test_legacy_full': lambda: LegacyIntegrationTest(self.logger).run_all_tests(),
-        }
+        if test_name == 'test_legacy_full':
+            # The whole legacy suite (it leases its own driver)
+            from legacy_test import LegacyIntegrationTest
+            result = LegacyIntegrationTest(self.logger, driver_pool=self.driver_pool).run_all_tests()
+            self.all_results[test_name] = result
+            return result
         
-        if test_name in test_methods:
-            # Setup driver for individual test
-            test_instance = AuthenticationTests(self.logger)  # Use auth tests as base
-            test_instance.setup_driver()
-            
-            try:
-                result = test_methods[test_name]()
-                self.all_results[test_name] = result
-                return result
-            finally:
-                test_instance.teardown_driver()
+        planned = find_planned(test_name)
+        if planned:
+            start_time = time.time()
+            result = run_planned_test(planned, self.driver_pool, self.logger)
+            self.test_durations[test_name] = time.time() - start_time
+            self.all_results[test_name] = result
+            return result
         else:
             self.logger.add_log(f"Unknown test: {test_name}", "FAIL")
-            available_tests = list(test_methods.keys())
+            available_tests = [planned.name for planned in get_plan()] + ['test_legacy_full']
             self.logger.add_log(f"Available tests: {', '.join(available_tests)}", "INFO")
             return False
     
@@ -109,10 +400,16 @@ class RavenCodeTestRunner:
             'authentication': self.run_authentication_tests,
             'modules': self.run_module_tests,
             'legacy': self.run_legacy_integration_test,
+            'visual': self.run_visual_tests,
+            'perf': self.run_performance_tests,
             'all': self.run_all_tests
         }
         
         if suite_name in suite_methods:
+            # Benchmarks run on their own so parallel browsers don't skew the timings
+            if self.workers > 1 and suite_name not in ('all', 'perf'):
+                suite_key = 'legacy_integration' if suite_name == 'legacy' else suite_name
+                return self.run_parallel_tests([suite_key]).get(suite_key, {})
             return suite_methods[suite_name]()
         else:
             self.logger.add_log(f"Unknown test suite: {suite_name}", "FAIL")
@@ -126,9 +423,17 @@ class RavenCodeTestRunner:
         start_time = time.time()
         
         # Run all test suites
-        auth_results = self.run_authentication_tests()
-        module_results = self.run_module_tests()
-        legacy_results = self.run_legacy_integration_test()
+        if self.workers > 1:
+            parallel_results = self.run_parallel_tests()
+            auth_results = parallel_results.get('authentication', {})
+            module_results = parallel_results.get('modules', {})
+            legacy_results = parallel_results.get('legacy_integration', {})
+            visual_results = parallel_results.get('visual', {})
+        else:
+            auth_results = self.run_authentication_tests()
+            module_results = self.run_module_tests()
+            legacy_results = self.run_legacy_integration_test()
+            visual_results = self.run_visual_tests()
         
         # Calculate overall statistics
         total_time = time.time() - start_time
@@ -137,11 +442,13 @@ class RavenCodeTestRunner:
         return {
             'authentication': auth_results,
             'modules': module_results,
-            'legacy': legacy_results
+            'legacy': legacy_results,
+            'visual': visual_results
         }
     
     def generate_final_summary(self, total_time):
         """Generate final test summary"""
+        self.check_performance_budgets()
         self.logger.add_log("=" * 80, "INFO")
         self.logger.add_log("FINAL TEST SUMMARY", "INFO")
         self.logger.add_log("=" * 80, "INFO")
@@ -168,6 +475,13 @@ class RavenCodeTestRunner:
         self.logger.add_log(f"OVERALL RESULTS: {total_passed}/{total_tests} tests passed ({pass_rate:.1f}%)", "INFO")
         self.logger.add_log(f"TOTAL EXECUTION TIME: {total_time:.2f} seconds", "INFO")
         
+        if self.test_durations and self.workers > 1:
+            test_time = sum(self.test_durations.values())
+            speedup = test_time / total_time if total_time > 0 else 0
+            self.logger.add_log(
+                f"PARALLEL WORKERS: {self.workers} ({test_time:.2f}s of test time, {speedup:.1f}x speedup)", "INFO"
+            )
+        
         if pass_rate >= 90:
             self.logger.add_log("🎉 EXCELLENT! Test suite passed with high success rate", "PASS")
         elif pass_rate >= 75:
@@ -180,33 +494,204 @@ class RavenCodeTestRunner:
         self.logger.add_log("=" * 80, "INFO")
 
 
+def print_test_list(suites=None, tags=None):
+    """Print the registered tests by suite with their tags (--list)"""
+    plan = get_plan(suites, tags)
+    for suite in dict.fromkeys(planned.suite for planned in plan):
+        print(f"\n{suite}")
+        for planned in plan:
+            if planned.suite == suite:
+                print(f"  {planned.name:<38} {', '.join(planned.tags)}")
+    print(f"\n{len(plan)} tests (plus test_legacy_full); tags: {', '.join(all_tags())}")
+
+
+def select_plan(args, suites, shard):
+    """The registered tests a run would execute and those dispatched first, or None when the run is not made of them"""
+    if args.merge or args.load or args.auth_load or args.judge_benchmark:
+        return None
+    if args.test:
+        planned = find_planned(args.test)
+        return ([planned] if planned else []), ()
+    if shard:
+        shards, _ = balance_shards(get_plan(suites, args.tag), shard[1], load_split_durations(args.durations)[0])
+        return shards[shard[0] - 1], ()
+    if args.changed_since:
+        return select_tests(get_plan(suites, args.tag), changed_files(args.changed_since)).tests, ()
+    if args.last_failed or args.failed_first:
+        failed = load_failed()
+        plan = get_plan(suites, args.tag)
+        if args.last_failed:
+            return [planned for planned in plan if planned.name in failed], failed
+        return [planned for planned in plan if planned.name in failed] + \
+            [planned for planned in plan if planned.name not in failed], failed
+    if args.suite == 'perf':
+        return None
+    return get_plan(suites, args.tag), ()
+
+
+def print_dry_run(args, suites, shard):
+    """Print what a run would execute, in dispatch order, with recorded duration estimates (--dry-run)"""
+    try:
+        selected = select_plan(args, suites, shard)
+    except ValueError as e:
+        print(f"Cannot plan this run: {e}")
+        return False
+    if selected is None:
+        print("This run is not made of registered tests; nothing to list")
+        return True
+    plan, first = selected
+    if not plan:
+        print("No registered test selected")
+        return True
+
+    durations = load_split_durations(args.durations)[0] if shard else load_durations()
+    estimate = duration_estimator(plan, durations)
+    if args.workers > 1:
+        plan = longest_first(plan, durations, first=first)
+    for planned in plan:
+        print(f"  {planned.name:<38} {planned.suite:<20} ~{estimate(planned):.0f}s")
+    total = sum(estimate(planned) for planned in plan)
+    print(f"\n{len(plan)} tests, ~{total:.0f}s of test time on {max(1, min(args.workers, len(plan)))} browser(s)")
+    return True
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='RavenCode Frontend Test Suite')
-    parser.add_argument('--suite', choices=['authentication', 'modules', 'legacy', 'all'], 
+    parser.add_argument('--suite', choices=['authentication', 'modules', 'legacy', 'visual', 'perf', 'all'], 
                        default='all', help='Test suite to run')
     parser.add_argument('--test', help='Specific test to run')
+    parser.add_argument('--tag', action='append',
+                       help='Run only registered tests carrying this tag (repeatable; combines with --suite)')
+    parser.add_argument('--list', action='store_true', help='List the registered tests and their tags, then exit')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Print the tests the other options select, in dispatch order, without running them')
     parser.add_argument('--headless', action='store_true', help='Run in headless mode')
     parser.add_argument('--timeout', type=int, default=10, help='Default timeout in seconds')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
     parser.add_argument('--debug', action='store_true', help='Debug mode with extra logging')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Number of parallel browser workers (tests are dispatched individually)')
+    parser.add_argument('--iterations', type=int,
+                       help='Visits per route for --suite perf (default: PERF_ITERATIONS)')
+    parser.add_argument('--load', type=int, metavar='N',
+                       help='Run N headless virtual students through the Module 1 journey at once')
+    parser.add_argument('--ramp-up', type=float, help='Seconds over which --load students start (default: LOAD_RAMP_UP)')
+    parser.add_argument('--duration', type=float, help='Seconds the --load run lasts (default: LOAD_DURATION)')
+    parser.add_argument('--auth-load', type=int, metavar='CONCURRENCY',
+                       help='Load /auth/login, register, refresh and recovery/request over HTTP at this concurrency')
+    parser.add_argument('--endpoint', action='append', choices=list(ENDPOINTS),
+                       help='Endpoint for --auth-load (repeatable; default: all)')
+    parser.add_argument('--requests', type=int, help='Requests per endpoint for --auth-load (default: AUTH_LOAD_REQUESTS)')
+    parser.add_argument('--judge-benchmark', metavar='INTERVALS',
+                       help='Benchmark judge submit-to-verdict latency polling at these comma-separated intervals (e.g. 1,0.5)')
+    parser.add_argument('--shard', metavar='I/N',
+                       help='Run only shard I of N (split by recorded durations) and write a partial result file')
+    parser.add_argument('--durations', metavar='FILE',
+                       help='Per-test durations (JSON) --shard splits on; every node must use the same file '
+                            '(default: SHARD_DURATIONS_PATH)')
+    parser.add_argument('--write-durations', metavar='FILE',
+                       help='Write the run history\'s per-test durations to FILE for --durations, then exit')
+    parser.add_argument('--changed-since', metavar='GIT_REF',
+                       help='Run only the tests covering frontend files changed since this git ref')
+    parser.add_argument('--last-failed', action='store_true',
+                       help='Rerun only the tests whose last recorded outcome (run history) is a failure')
+    parser.add_argument('--failed-first', action='store_true',
+                       help='Run the whole plan, starting with the tests that failed on their last recorded run')
+    parser.add_argument('--merge', nargs='+', metavar='RESULT_FILE',
+                       help='Merge shard partial result files into one summary and report')
+    parser.add_argument('--network-capture', action='store_true',
+                       help='Record every request per navigate_to (CDP Network events) into a waterfall and a HAR file')
+    parser.add_argument('--sync-report', action='store_true',
+                       help='Render the PDF report before exiting instead of in a background process')
+    parser.add_argument('--seed-accounts', type=int, nargs='?', const=ACCOUNT_POOL_SIZE, metavar='N',
+                       help=f'Register N accounts through the API in parallel before the run for tests to claim '
+                            f'(default N: {ACCOUNT_POOL_SIZE})')
+    parser.add_argument('--serve-build', action='store_true',
+                       help='Build the app (when sources changed) and serve dist/ on BASE_URL instead of a running dev server')
+    parser.add_argument('--stub-backend', action='store_true',
+                       help='Serve the user, learning and judge APIs from a local stub instead of live services')
     
     args = parser.parse_args()
+    if args.network_capture:
+        # Read when each Chrome session launches, including in worker processes
+        os.environ['NETWORK_CAPTURE'] = 'true'
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    suites = None if args.suite == 'all' else ['legacy_integration' if args.suite == 'legacy' else args.suite]
+    
+    # Answered from the registry alone: no browser, no log stream, no report
+    if args.list:
+        print_test_list(suites, args.tag)
+        sys.exit(0)
+    if args.dry_run:
+        sys.exit(0 if print_dry_run(args, suites, shard) else 1)
+    if args.write_durations:
+        durations = load_durations()
+        write_split_durations(args.write_durations, durations)
+        print(f"Durations of {len(durations)} tests written to {args.write_durations}")
+        sys.exit(0)
     
     # Initialize test runner
     runner = RavenCodeTestRunner(
         verbose=args.verbose or args.debug,
         headless=args.headless,
-        timeout=args.timeout
+        timeout=args.timeout,
+        workers=args.workers,
+        perf_iterations=args.iterations
     )
     
     runner.logger.start_test()
     
     try:
-        if args.test:
+        if args.stub_backend:
+            runner.start_stub_backend()
+        if args.serve_build:
+            runner.start_frontend_server()
+        runner.prepare_accounts(args.seed_accounts)
+        
+        if args.merge:
+            # Combine the partial results written by --shard runs
+            results, problems = runner.merge_shards(args.merge)
+            success = not problems and any(any(suite_results.values()) for suite_results in results.values())
+        elif shard:
+            # One duration-balanced slice of the plan, restricted to --suite unless it is 'all'
+            results = runner.run_shard(*shard, suites=suites, tags=args.tag, durations_path=args.durations)
+            # An empty slice (more shards than tests) has nothing to fail
+            success = not results or any(any(suite_results.values()) for suite_results in results.values())
+        elif args.changed_since:
+            # Tests whose route tags cover the changed pages (everything when a shared module changed)
+            results = runner.run_changed_tests(args.changed_since, suites=suites, tags=args.tag)
+            success = not results or any(any(suite_results.values()) for suite_results in results.values())
+        elif args.last_failed or args.failed_first:
+            # Recorded failures alone (--last-failed) or ahead of the rest of the plan (--failed-first)
+            results = runner.run_failed_tests(failed_first=args.failed_first, suites=suites, tags=args.tag)
+            success = not results or any(any(suite_results.values()) for suite_results in results.values())
+        elif args.judge_benchmark:
+            # Concurrent judge submissions, polled like judgeService.waitForSubmissionResult
+            intervals = [float(interval) for interval in args.judge_benchmark.split(',')]
+            results = runner.run_judge_benchmark(intervals)
+            success = all(results.values())
+        elif args.auth_load:
+            # HTTP load on the auth endpoints; --duration caps each endpoint's run
+            results = runner.run_auth_load_test(args.auth_load, args.endpoint, args.requests, args.duration)
+            success = all(results.values())
+        elif args.load:
+            # Load mode: concurrent virtual students instead of functional tests
+            results = runner.run_load_test(args.load, ramp_up=args.ramp_up, duration=args.duration)
+            success = all(results.values())
+        elif args.test:
             # Run specific test
             result = runner.run_specific_test(args.test)
             success = bool(result)
+        elif args.tag:
+            # Registered tests carrying any of the tags, within --suite unless it is 'all'
+            results = runner.run_tagged_tests(args.tag, suites=suites)
+            success = bool(results) and any(any(suite_results.values()) for suite_results in results.values())
         elif args.suite:
             # Run test suite
             results = runner.run_test_suite(args.suite)
@@ -224,12 +709,24 @@ def main():
         runner.logger.add_log(f"Test execution failed with error: {str(e)}", "FAIL")
         success = False
     finally:
-        runner.logger.end_test()
+        runner.shutdown()
+        if not runner.check_performance_budgets():
+            success = False
+        runner.logger.end_test(runner.merged_end_time)
+        if shard:
+            result_path = write_shard_result(
+                *shard, runner.logger, runner.all_results, runner.test_durations, runner.shard_split
+            )
+            print(f"\n🧩 Shard results written: {result_path}")
+        if not args.merge:
+            # Each shard already recorded its own outcomes; recording the merge would count them twice
+            runner.record_history(' '.join(sys.argv[1:]))
         
         # Generate PDF report
-        report_num = runner.logger.generate_pdf()
+        report_num = runner.logger.generate_pdf(background=not args.sync_report)
         if report_num:
-            print(f"\n📊 Report generated: ravencode_frontend_test_report_{report_num:010d}.pdf")
+            status = "generated" if args.sync_report else "rendering in background"
+            print(f"\n📊 Report {status}: ravencode_frontend_test_report_{report_num:010d}.pdf")
         
         # Print final status
         if success:
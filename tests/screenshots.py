@@ -0,0 +1,149 @@
+"""
+Screenshot Pipeline for RavenCode Frontend Test Suite
+Takes raw PNG captures off the test thread, then compresses them, deduplicates retries
+of the same failure by perceptual hash and records every capture in a shared manifest
+"""
+
+import atexit
+import io
+import json
+import os
+import queue
+import threading
+import uuid
+from datetime import datetime
+
+from config import (
+    SCREENSHOTS_DIR, SCREENSHOT_MANIFEST, SCREENSHOT_FORMAT, SCREENSHOT_QUALITY, SCREENSHOT_DEDUPE_DISTANCE
+)
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def difference_hash(image, size=8):
+    """64-bit dHash: whether each pixel of a size+1 x size greyscale thumbnail is brighter than its right neighbour"""
+    from PIL import Image
+
+    pixels = list(image.convert('L').resize((size + 1, size), Image.LANCZOS).getdata())
+    value = 0
+    for row in range(size):
+        for column in range(size):
+            left = pixels[row * (size + 1) + column]
+            value = (value << 1) | (left > pixels[row * (size + 1) + column + 1])
+    return value
+
+
+def read_manifest(path=None, offset=0):
+    """Manifest entries from a byte offset on, and the offset to continue from"""
+    path = path or SCREENSHOT_MANIFEST
+    if not os.path.exists(path):
+        return [], offset
+    entries = []
+    with open(path, 'rb') as stream:
+        stream.seek(offset)
+        for line in stream:
+            if not line.endswith(b'\n'):
+                # Another process is still writing this line
+                break
+            offset += len(line)
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+    return entries, offset
+
+
+class ScreenshotWriter:
+    """Background thread that encodes, deduplicates and stores queued screenshots"""
+
+    def __init__(self, manifest_path=None):
+        self.manifest_path = manifest_path or SCREENSHOT_MANIFEST
+        self._queue = queue.Queue()
+        self._closed = False
+        # Stored captures by name: [(hash, file)], kept current from the shared manifest
+        self._known = {}
+        self._manifest_offset = 0
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, png, name, test=None):
+        """Queue raw PNG bytes; returns the capture id the manifest entry will carry"""
+        capture_id = uuid.uuid4().hex
+        self._queue.put({
+            'id': capture_id,
+            'name': name,
+            'test': test,
+            'captured_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'png': png
+        })
+        return capture_id
+
+    def close(self):
+        """Store everything queued so far and stop the thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            capture = self._queue.get()
+            if capture is None:
+                return
+            png = capture.pop('png')
+            try:
+                entry = dict(capture, **self._store(capture['name'], png))
+            except Exception as e:
+                entry = dict(capture, error=str(e))
+            entry['raw_bytes'] = len(png)
+            with open(self.manifest_path, 'a', encoding='utf-8') as stream:
+                stream.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def _find_duplicate(self, name, value):
+        """File already stored for a near-identical capture under the same name, if any"""
+        entries, self._manifest_offset = read_manifest(self.manifest_path, self._manifest_offset)
+        for entry in entries:
+            if entry.get('file') and entry.get('hash'):
+                self._known.setdefault(entry['name'], []).append((int(entry['hash'], 16), entry['file']))
+        for known_hash, filename in self._known.get(name, []):
+            if bin(known_hash ^ value).count('1') <= SCREENSHOT_DEDUPE_DISTANCE and \
+                    os.path.exists(os.path.join(SCREENSHOTS_DIR, filename)):
+                return filename
+        return None
+
+    def _store(self, name, png):
+        """Encode one capture (or point it at its duplicate); returns its manifest fields"""
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(png))
+        value = difference_hash(image)
+        duplicate = self._find_duplicate(name, value)
+        if duplicate:
+            return {'file': duplicate, 'hash': f"{value:016x}", 'duplicate': True,
+                    'bytes': os.path.getsize(os.path.join(SCREENSHOTS_DIR, duplicate))}
+
+        filename = f"{name}_{value:016x}.{SCREENSHOT_FORMAT.lower()}"
+        filepath = os.path.join(SCREENSHOTS_DIR, filename)
+        image.convert('RGB').save(filepath, SCREENSHOT_FORMAT, quality=SCREENSHOT_QUALITY, optimize=True)
+        self._known.setdefault(name, []).append((value, filename))
+        return {'file': filename, 'hash': f"{value:016x}", 'duplicate': False, 'bytes': os.path.getsize(filepath)}
+
+
+def screenshot_writer():
+    """This process's screenshot writer, started on first use"""
+    global _writer
+    with _writer_lock:
+        if _writer is None or _writer._closed:
+            _writer = ScreenshotWriter()
+        return _writer
+
+
+def close_screenshot_writer():
+    """Wait for queued screenshots to be stored (before a worker exits or the report renders)"""
+    with _writer_lock:
+        if _writer is not None:
+            _writer.close()
@@ -0,0 +1,200 @@
+"""
+Test Sharding for RavenCode Frontend Test Suite
+Splits the test plan into duration-balanced shards for separate CI nodes, writes
+per-shard partial results and merges them back into one summary
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from collections import Counter
+from datetime import datetime
+
+from history import duration_estimator
+from registry import find_planned
+from test_logger import read_log_stream
+from config import SHARDS_DIR, SHARD_DURATIONS_PATH
+
+
+def parse_shard(value):
+    """Parse 'i/n' (1-based) into (i, n)"""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/n, got '{value}'")
+    if not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and {count}, got {index}")
+    return index, count
+
+
+def load_split_durations(path=None):
+    """Per-test durations every node splits on: ({name: seconds}, source path or None)
+
+    Reads SHARD_DURATIONS_PATH unless a path is given; an explicit path must exist. Without
+    the file the split falls back to SEED_TEST_DURATIONS, which is the same on every node.
+    """
+    source = path or SHARD_DURATIONS_PATH
+    if not os.path.exists(source):
+        if path:
+            raise ValueError(f"Durations file not found: {path}")
+        return {}, None
+    with open(source, encoding='utf-8') as stream:
+        durations = json.load(stream)
+    if not isinstance(durations, dict) or not all(
+        isinstance(value, (int, float)) and not isinstance(value, bool) for value in durations.values()
+    ):
+        raise ValueError(f"Durations file must map test names to seconds: {source}")
+    return {name: float(value) for name, value in durations.items()}, source
+
+
+def write_split_durations(path, durations):
+    """Write per-test durations (e.g. the run history's) as a file for every node to split on"""
+    with open(path, 'w', encoding='utf-8') as stream:
+        json.dump({name: round(durations[name], 2) for name in sorted(durations)}, stream, indent=2)
+        stream.write("\n")
+    return path
+
+
+def split_fingerprint(plan, count, durations):
+    """Short hash of the plan, shard count and per-test estimates a split is computed from"""
+    estimate = duration_estimator(plan, durations)
+    split_input = [count] + [[planned.name, estimate(planned)] for planned in plan]
+    return hashlib.sha256(json.dumps(split_input).encode('utf-8')).hexdigest()[:16]
+
+
+def balance_shards(plan, count, durations):
+    """Split planned tests into `count` groups of similar total duration (longest first, greedy)"""
+    estimate = duration_estimator(plan, durations)
+
+    shards = [[] for _ in range(count)]
+    totals = [0.0] * count
+    # Name as tie-breaker keeps every node computing the same split
+    for planned in sorted(plan, key=lambda planned: (-estimate(planned), planned.name)):
+        target = totals.index(min(totals))
+        shards[target].append(planned)
+        totals[target] += estimate(planned)
+
+    # Keep the original plan order inside each shard
+    order = {planned.name: position for position, planned in enumerate(plan)}
+    return [sorted(shard, key=lambda planned: order[planned.name]) for shard in shards], totals
+
+
+def shard_result_path(index, count):
+    return os.path.join(SHARDS_DIR, f"shard_{index}_of_{count}.json")
+
+
+def write_shard_result(index, count, logger, results, durations, split=None):
+    """Write a shard's partial result file, with a copy of its log stream next to it
+
+    split describes what the shard was cut from: the plan's test names, this shard's test
+    names and the split fingerprint, which --merge checks across shards.
+    """
+    path = shard_result_path(index, count)
+    log_copy = None
+    if logger.log_path:
+        logger.sink.flush()
+        log_copy = os.path.splitext(path)[0] + '.jsonl'
+        shutil.copyfile(logger.log_path, log_copy)
+
+    split = split or {}
+    with open(path, 'w', encoding='utf-8') as stream:
+        json.dump({
+            'shard': index,
+            'count': count,
+            'fingerprint': split.get('fingerprint'),
+            'durations_file': split.get('durations_file'),
+            'plan': split.get('plan'),
+            'planned': split.get('planned'),
+            'start_time': logger.start_time.isoformat() if logger.start_time else None,
+            'end_time': logger.end_time.isoformat() if logger.end_time else None,
+            'results': results,
+            'durations': durations,
+            'log_file': os.path.basename(log_copy) if log_copy else None
+        }, stream, indent=2)
+    return path
+
+
+def read_shard_results(paths):
+    """Load partial result files, checking they come from one complete split"""
+    shards = []
+    for path in paths:
+        with open(path, encoding='utf-8') as stream:
+            shard = json.load(stream)
+        shard['path'] = path
+        shards.append(shard)
+
+    counts = {shard['count'] for shard in shards}
+    if len(counts) != 1:
+        raise ValueError(f"Partial results come from different splits: {sorted(counts)}")
+    missing = set(range(1, counts.pop() + 1)) - {shard['shard'] for shard in shards}
+    return sorted(shards, key=lambda shard: shard['shard']), sorted(missing)
+
+
+def check_shards(shards, missing):
+    """Reasons the shards do not add up to exactly one run of one plan (empty when they do)"""
+    count = shards[0]['count']
+    problems = [f"Shard {index}/{count} result file is missing" for index in missing]
+
+    repeated = sorted(index for index, seen in Counter(shard['shard'] for shard in shards).items() if seen > 1)
+    if repeated:
+        problems.append(f"More than one result file for shard {', '.join(str(index) for index in repeated)}")
+
+    unsplit = [shard['shard'] for shard in shards if not shard.get('fingerprint') or shard.get('plan') is None]
+    if unsplit:
+        problems.append(f"Shard {', '.join(str(index) for index in unsplit)} recorded no split (failed before planning?)")
+        return problems
+    fingerprints = sorted({shard['fingerprint'] for shard in shards})
+    if len(fingerprints) > 1:
+        problems.append(
+            f"Shards were split from different plans or durations (fingerprints {', '.join(fingerprints)}); "
+            f"run every node with the same --durations file and options"
+        )
+        return problems
+
+    plan = shards[0]['plan']
+    assigned = Counter(name for shard in shards for name in shard['planned'])
+    overlapping = sorted(name for name, seen in assigned.items() if seen > 1)
+    if overlapping:
+        problems.append(f"Tests planned in more than one shard: {', '.join(overlapping)}")
+    if not missing:
+        unassigned = [name for name in plan if name not in assigned]
+        if unassigned:
+            problems.append(f"Tests planned in no shard: {', '.join(unassigned)}")
+    unknown = sorted(set(assigned) - set(plan))
+    if unknown:
+        problems.append(f"Shards ran tests outside the plan: {', '.join(unknown)}")
+
+    for shard in shards:
+        unreported = []
+        for name in shard['planned']:
+            planned = find_planned(name)
+            if planned is None or planned.key not in shard['results'].get(planned.suite, {}):
+                unreported.append(name)
+        if unreported:
+            problems.append(f"Shard {shard['shard']}/{count} has no result for: {', '.join(unreported)}")
+    return problems
+
+
+def iter_shard_logs(shard):
+    """Log entries of one shard, read from the copy written next to its result file"""
+    if not shard.get('log_file'):
+        return iter(())
+    log_path = os.path.join(os.path.dirname(shard['path']), shard['log_file'])
+    if not os.path.exists(log_path):
+        return iter(())
+    return read_log_stream(log_path)
+
+
+def merge_shard_results(shards):
+    """Combine shard results, durations and the overall time window"""
+    results = {}
+    durations = {}
+    for shard in shards:
+        for suite, suite_results in shard['results'].items():
+            results.setdefault(suite, {}).update(suite_results)
+        durations.update(shard['durations'])
+
+    starts = [datetime.fromisoformat(shard['start_time']) for shard in shards if shard['start_time']]
+    ends = [datetime.fromisoformat(shard['end_time']) for shard in shards if shard['end_time']]
+    return results, durations, (min(starts) if starts else None), (max(ends) if ends else None)
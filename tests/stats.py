@@ -0,0 +1,63 @@
+"""
+Statistics Helpers for RavenCode Frontend Test Suite
+Percentiles and latency summaries shared by timing, benchmark and load reports
+"""
+
+import bisect
+import math
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile (pct in 0-100) of a list of numbers"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[int(rank)]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(values):
+    """Count, total, p50, p95 and max of a list of durations"""
+    if not values:
+        return {'count': 0, 'total': 0.0, 'p50': None, 'p95': None, 'max': None}
+    return {
+        'count': len(values),
+        'total': sum(values),
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'max': max(values)
+    }
+
+
+class MetricTable:
+    """Accumulates named metric samples per group (e.g. per route) for percentile reporting"""
+    
+    def __init__(self):
+        self.groups = {}
+        
+    def add(self, group, metrics):
+        """Add one sample; metrics that were not measured (None) are skipped"""
+        samples = self.groups.setdefault(group, {})
+        for name, value in metrics.items():
+            if value is not None:
+                samples.setdefault(name, []).append(value)
+                
+    def summary(self, group, metric):
+        """Percentile summary of one metric within a group"""
+        return summarize(self.groups.get(group, {}).get(metric, []))
+        
+    def sample_count(self, group):
+        """Largest number of samples recorded for any metric of the group"""
+        return max((len(values) for values in self.groups.get(group, {}).values()), default=0)
+
+
+def histogram(values, bounds):
+    """Count values per bucket: <= bounds[0], <= bounds[1], ..., and above the last bound"""
+    counts = [0] * (len(bounds) + 1)
+    for value in values:
+        counts[bisect.bisect_left(bounds, value)] += 1
+    return counts
@@ -0,0 +1,691 @@
+#!/usr/bin/env python3
+"""
+Local Stub Backend for RavenCode Frontend Test Suite
+Serves the user, learning/achievements, judge and grades APIs in-process with seeded data
+so runs are fast and deterministic without outside services
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from config import (
+    USER_API_URL, LEARNING_API_URL, JUDGE_API_URL, GRADES_API_URL, STUB_JUDGE_PROCESSING_TIME,
+    STUB_JUDGE_PROCESSING_JITTER, ERROR_MESSAGES
+)
+from test_data.users import STATIC_USERS
+
+
+# Problems the assessment pages look up by title
+SEEDED_PROBLEMS = [
+    {'_id': 'problem-promedio', 'title': 'Cálculo de Promedio', 'difficulty': 'easy'},
+    {'_id': 'problem-cajero', 'title': 'Cajero Automático Personalizado', 'difficulty': 'medium'},
+]
+
+# Lessons served by the learning API (shaped like the Leccion type)
+SEEDED_LESSONS = [
+    {'id': 1, 'titulo': 'Introducción', 'descripcion': 'Qué es programar', 'contenido': '', 'orden': 1, 'moduloId': 1},
+    {'id': 2, 'titulo': 'Variables', 'descripcion': 'Tipos y asignación', 'contenido': '', 'orden': 2, 'moduloId': 1},
+]
+
+# Module grades for the seeded users (admin has passed Module 1 so Module 2 is unlocked)
+SEEDED_GRADES = {
+    (STATIC_USERS['admin']['email'], 'Assessment1'): 100,
+}
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _to_usuario(user):
+    """Shape a stored user like the API's Usuario type"""
+    return {
+        '_id': user['id'],
+        'correo_electronico': user['email'],
+        'nombre': user['name'],
+        'role': user['role'],
+        'foto_de_perfil': None,
+        'fecha_de_nacimiento': user.get('fecha_de_nacimiento', '2000-01-01'),
+        'institucion_educativa': user.get('institucion_educativa', ''),
+        'grado_academico': user.get('grado_academico', ''),
+        'created_at': user['created_at']
+    }
+
+
+class StubState:
+    """Seeded, thread-safe data shared by all stub services"""
+
+    def __init__(self, judge_processing_time=None, judge_processing_jitter=None):
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.judge_processing_time = (
+            STUB_JUDGE_PROCESSING_TIME if judge_processing_time is None else judge_processing_time
+        )
+        self.judge_processing_jitter = (
+            STUB_JUDGE_PROCESSING_JITTER if judge_processing_jitter is None else judge_processing_jitter
+        )
+        self.users = {}
+        self.tokens = {}
+        self.refresh_tokens = {}
+        self.grades = dict(SEEDED_GRADES)
+        self.achievements = {}
+        self.submissions = {}
+        self.responses = {}
+        self.lessons = {lesson['id']: dict(lesson) for lesson in SEEDED_LESSONS}
+        for user in STATIC_USERS.values():
+            self.add_user(user)
+
+    def set_grade(self, email, module, grade):
+        with self.lock:
+            self.grades[(email, module)] = grade
+        return {'email': email, 'module': module, 'grade': grade, 'date_assigned': _now()}
+
+    def add_responses(self, email, responses):
+        with self.lock:
+            self.responses.setdefault(email, []).extend(responses)
+        return {'email': email, 'responses': responses}
+
+    def add_user(self, user):
+        with self.lock:
+            record = dict(user)
+            record['id'] = f"user-{next(self.ids)}"
+            record['created_at'] = _now()
+            self.users[user['email']] = record
+            return record
+
+    def issue_tokens(self, email):
+        with self.lock:
+            serial = next(self.ids)
+            access_token = f"stub-access-{serial}"
+            refresh_token = f"stub-refresh-{serial}"
+            self.tokens[access_token] = email
+            self.refresh_tokens[refresh_token] = email
+        return {'access_token': access_token, 'refresh_token': refresh_token, 'token_type': 'bearer'}
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """JSON request handler with a (method, path regex) routing table and CORS"""
+
+    # Keep-alive so pooled load-test clients can reuse connections; buffer each response
+    # into one write and disable Nagle so small responses don't wait on delayed ACKs
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    state = None
+    ROUTES = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_OPTIONS(self):
+        self._send(204, None)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def _dispatch(self, method):
+        parsed = urlparse(self.path)
+        body = self._read_body()
+        for route_method, pattern, handler_name in self.ROUTES:
+            match = re.fullmatch(pattern, parsed.path)
+            if route_method == method and match:
+                params = {key: unquote(value) for key, value in match.groupdict().items()}
+                query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+                status, payload = getattr(self, handler_name)(params, query, body)
+                self._send(status, payload)
+                return
+        self._send(404, {'detail': 'Not Found'})
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        raw = self.rfile.read(length).decode('utf-8')
+        if 'application/x-www-form-urlencoded' in (self.headers.get('Content-Type') or ''):
+            return {key: values[0] for key, values in parse_qs(raw).items()}
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return {}
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Authorization, Content-Type')
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def current_email(self):
+        """Email behind the request's bearer token, or None"""
+        authorization = self.headers.get('Authorization') or ''
+        token = authorization[len('Bearer '):] if authorization.startswith('Bearer ') else None
+        return self.state.tokens.get(token)
+
+
+def _authenticated(handler):
+    """Reject requests without a token issued by the stub"""
+    def wrapper(self, params, query, body):
+        if not self.current_email():
+            return 401, {'detail': 'Not authenticated'}
+        return handler(self, params, query, body)
+    return wrapper
+
+
+class UserApiHandler(StubRequestHandler):
+    """Stand-in for the user API (auth, users, students)"""
+
+    ROUTES = [
+        ('POST', r'/auth/login', 'auth_login'),
+        ('POST', r'/auth/register', 'auth_register'),
+        ('POST', r'/auth/refresh', 'auth_refresh'),
+        ('POST', r'/auth/recovery/request', 'auth_recovery_request'),
+        ('POST', r'/auth/recovery/verify', 'auth_recovery_verify'),
+        ('POST', r'/auth/logout', 'auth_logout'),
+        ('GET', r'/users/me', 'users_me'),
+        ('GET', r'/users/?', 'users_list'),
+        ('POST', r'/users/?', 'users_create'),
+        ('GET', r'/users/(?P<email>[^/]+)', 'users_get'),
+        ('PUT', r'/users/(?P<email>[^/]+)', 'users_update'),
+        ('DELETE', r'/users/(?P<email>[^/]+)', 'users_delete'),
+        ('POST', r'/students/grade', 'students_grade'),
+        ('GET', r'/students/(?P<email>[^/]+)/grade/(?P<module>[^/]+)', 'students_get_grade'),
+        ('POST', r'/students/responses', 'students_responses'),
+        ('GET', r'/profile/(?P<user>[^/]+)', 'profile'),
+        ('GET', r'/(?:achievements|diplomas)/(?:me|user/[^/]+)', 'empty_list'),
+        ('POST', r'/achievements/(?P<achievement_id>[^/]+)/claim', 'claim_achievement'),
+        ('GET', r'/achievements', 'empty_list'),
+    ]
+
+    def auth_login(self, params, query, body):
+        user = self.state.users.get(body.get('email'))
+        if not user or user['password'] != body.get('password'):
+            return 401, {'detail': ERROR_MESSAGES['invalid_login']}
+        return 200, self.state.issue_tokens(user['email'])
+
+    def auth_register(self, params, query, body):
+        if body.get('email') in self.state.users:
+            return 400, {'detail': ERROR_MESSAGES['email_already_exists']}
+        record = self.state.add_user({
+            'email': body.get('email'),
+            'password': body.get('password'),
+            'name': body.get('nombre', ''),
+            'role': 'student',
+            'fecha_de_nacimiento': body.get('fecha_de_nacimiento'),
+            'institucion_educativa': body.get('institucion_educativa'),
+            'grado_academico': body.get('grado_academico')
+        })
+        return 201, {'message': 'Usuario registrado exitosamente', 'student': _to_usuario(record)}
+
+    def auth_refresh(self, params, query, body):
+        email = self.state.refresh_tokens.get(body.get('refresh_token'))
+        if not email:
+            return 401, {'detail': 'Invalid refresh token'}
+        return 200, self.state.issue_tokens(email)
+
+    def auth_recovery_request(self, params, query, body):
+        return 200, {'message': 'Código de recuperación enviado'}
+
+    def auth_recovery_verify(self, params, query, body):
+        user = self.state.users.get(body.get('email'))
+        if not user:
+            return 404, {'detail': ERROR_MESSAGES['user_not_found']}
+        user['password'] = body.get('new_password', user['password'])
+        return 200, {'message': 'Contraseña actualizada'}
+
+    def auth_logout(self, params, query, body):
+        return 200, {'message': 'Sesión cerrada'}
+
+    @_authenticated
+    def users_me(self, params, query, body):
+        return 200, {'data': _to_usuario(self.state.users[self.current_email()])}
+
+    @_authenticated
+    def users_list(self, params, query, body):
+        return 200, {'data': [_to_usuario(user) for user in self.state.users.values()]}
+
+    @_authenticated
+    def users_create(self, params, query, body):
+        if body.get('correo_electronico') in self.state.users:
+            return 400, {'detail': ERROR_MESSAGES['email_already_exists']}
+        record = self.state.add_user({
+            'email': body.get('correo_electronico'),
+            'password': body.get('contrasena'),
+            'name': body.get('nombre', ''),
+            'role': body.get('role', 'student'),
+            'fecha_de_nacimiento': body.get('fecha_de_nacimiento'),
+            'institucion_educativa': body.get('institucion_educativa'),
+            'grado_academico': body.get('grado_academico')
+        })
+        return 201, {'data': _to_usuario(record)}
+
+    @_authenticated
+    def users_get(self, params, query, body):
+        user = self.state.users.get(params['email'])
+        if not user:
+            return 404, {'detail': ERROR_MESSAGES['user_not_found']}
+        return 200, {'data': _to_usuario(user)}
+
+    @_authenticated
+    def users_update(self, params, query, body):
+        user = self.state.users.get(params['email'])
+        if not user:
+            return 404, {'detail': ERROR_MESSAGES['user_not_found']}
+        with self.state.lock:
+            if body.get('nombre'):
+                user['name'] = body['nombre']
+            for field in ('fecha_de_nacimiento', 'institucion_educativa', 'grado_academico'):
+                if field in body:
+                    user[field] = body[field]
+        return 200, {'data': _to_usuario(user)}
+
+    @_authenticated
+    def users_delete(self, params, query, body):
+        with self.state.lock:
+            removed = self.state.users.pop(params['email'], None)
+        if not removed:
+            return 404, {'detail': ERROR_MESSAGES['user_not_found']}
+        return 200, {'message': 'Usuario eliminado exitosamente'}
+
+    @_authenticated
+    def students_grade(self, params, query, body):
+        return 200, {'data': self.state.set_grade(body.get('email'), body.get('module'), body.get('grade', 0))}
+
+    @_authenticated
+    def students_get_grade(self, params, query, body):
+        grade = self.state.grades.get((params['email'], params['module']), 0)
+        return 200, {'data': {'email': params['email'], 'module': params['module'], 'grade': grade}}
+
+    @_authenticated
+    def students_responses(self, params, query, body):
+        return 200, {'data': self.state.add_responses(body.get('email'), body.get('responses', []))}
+
+    @_authenticated
+    def profile(self, params, query, body):
+        email = self.current_email() if params['user'] == 'me' else params['user']
+        user = self.state.users.get(email) or next(
+            (user for user in self.state.users.values() if user['id'] == params['user']), None
+        )
+        if not user:
+            return 404, {'detail': ERROR_MESSAGES['user_not_found']}
+        return 200, {
+            'id': user['id'], 'name': user['name'], 'email': user['email'], 'avatar': '',
+            'level': 1, 'xp': 0, 'joinDate': user['created_at'], 'achievements': [], 'diplomas': [],
+            'stats': {'coursesCompleted': 0, 'totalXp': 0, 'currentStreak': 0, 'longestStreak': 0,
+                      'problemsSolved': 0, 'rank': 'Novato'}
+        }
+
+    @_authenticated
+    def claim_achievement(self, params, query, body):
+        return 200, {'id': params['achievement_id'], 'unlocked': True, 'unlockedAt': _now()}
+
+    @_authenticated
+    def empty_list(self, params, query, body):
+        return 200, {'data': []}
+
+
+class LearningApiHandler(StubRequestHandler):
+    """Stand-in for the learning and achievements API"""
+
+    ROUTES = [
+        ('GET', r'/lecciones/?', 'lessons'),
+        ('POST', r'/lecciones/?', 'create_lesson'),
+        ('GET', r'/lecciones/(?P<lesson_id>\d+)', 'lesson'),
+        ('PUT', r'/lecciones/(?P<lesson_id>\d+)', 'update_lesson'),
+        ('DELETE', r'/lecciones/(?P<lesson_id>\d+)', 'delete_lesson'),
+        ('GET', r'/grades/(?P<email>[^/]+)/(?P<module>[^/]+)', 'grade'),
+        ('GET', r'/admin/achievements', 'admin_achievements'),
+        ('GET', r'/admin/achievements/user/(?P<email>[^/]+)', 'user_achievements'),
+        ('POST', r'/achievements/update', 'update_achievement'),
+        ('POST', r'/achievements/bulk-update', 'bulk_update'),
+        ('GET', r'/achievements/course/(?P<course>[^/]+)/available', 'available_achievements'),
+        ('GET', r'/achievements/(?P<email>[^/]+)/stats', 'achievement_stats'),
+        ('GET', r'/achievements/(?P<email>[^/]+)', 'user_achievements'),
+        ('DELETE', r'/achievements/(?P<email>[^/]+)/(?P<name>[^/]+)', 'delete_achievement'),
+        ('GET', r'/diplomas/configuracion', 'diploma_config'),
+        ('GET', r'/diplomas/verificar-elegibilidad/(?P<email>[^/]+)', 'diploma_eligibility'),
+        ('GET', r'/diplomas/estudiante/(?P<email>[^/]+)', 'diploma_list'),
+        ('DELETE', r'/diplomas/estudiante/(?P<email>[^/]+)/(?P<diploma_id>[^/]+)', 'diploma_delete'),
+        ('POST', r'/diplomas/generar', 'diploma_generate'),
+        ('GET', r'/diplomas/verificar/(?P<code>[^/]+)', 'diploma_verify'),
+        ('POST', r'/diplomas/plantillas', 'diploma_template'),
+        ('GET', r'/diplomas/estadisticas', 'diploma_stats'),
+        ('GET', r'/diplomas/convertir-nota', 'diploma_convert_grade'),
+    ]
+
+    @_authenticated
+    def lessons(self, params, query, body):
+        with self.state.lock:
+            lessons = sorted(self.state.lessons.values(), key=lambda lesson: lesson['orden'])
+        return 200, {'data': lessons}
+
+    @_authenticated
+    def lesson(self, params, query, body):
+        lesson = self.state.lessons.get(int(params['lesson_id']))
+        if not lesson:
+            return 404, {'detail': 'Lección no encontrada'}
+        return 200, {'data': lesson}
+
+    @_authenticated
+    def create_lesson(self, params, query, body):
+        with self.state.lock:
+            lesson = dict(body, id=max(self.state.lessons, default=0) + 1)
+            self.state.lessons[lesson['id']] = lesson
+        return 201, {'data': lesson}
+
+    @_authenticated
+    def update_lesson(self, params, query, body):
+        with self.state.lock:
+            lesson = self.state.lessons.get(int(params['lesson_id']))
+            if lesson:
+                lesson.update({key: value for key, value in body.items() if key != 'id'})
+        if not lesson:
+            return 404, {'detail': 'Lección no encontrada'}
+        return 200, {'data': lesson}
+
+    @_authenticated
+    def delete_lesson(self, params, query, body):
+        with self.state.lock:
+            removed = self.state.lessons.pop(int(params['lesson_id']), None)
+        if not removed:
+            return 404, {'detail': 'Lección no encontrada'}
+        return 200, {'data': {'message': 'Lección eliminada'}}
+
+    @_authenticated
+    def grade(self, params, query, body):
+        grade = self.state.grades.get((params['email'], params['module']), 0)
+        return 200, {'data': {'email': params['email'], 'module': params['module'], 'grade': grade}}
+
+    @_authenticated
+    def admin_achievements(self, params, query, body):
+        with self.state.lock:
+            records = [record for records in self.state.achievements.values() for record in records.values()]
+        return 200, {'data': records}
+
+    @_authenticated
+    def user_achievements(self, params, query, body):
+        records = list(self.state.achievements.get(params['email'], {}).values())
+        return 200, {'data': {'achievements': records}}
+
+    def _store_achievement(self, update):
+        achievement = update.get('achievement', {})
+        record = dict(achievement)
+        record.update({
+            'email': update.get('email'),
+            'score': update.get('score', 0),
+            'total_points': update.get('total_points', 0),
+            'date_earned': _now(),
+            'achieved': True
+        })
+        with self.state.lock:
+            self.state.achievements.setdefault(record['email'], {})[record.get('achievement_name')] = record
+        return record
+
+    @_authenticated
+    def update_achievement(self, params, query, body):
+        return 200, {'data': self._store_achievement(body)}
+
+    @_authenticated
+    def bulk_update(self, params, query, body):
+        return 200, {'data': [self._store_achievement(update) for update in body.get('updates', [])]}
+
+    @_authenticated
+    def available_achievements(self, params, query, body):
+        return 200, {'achievements': []}
+
+    @_authenticated
+    def achievement_stats(self, params, query, body):
+        records = list(self.state.achievements.get(params['email'], {}).values())
+        return 200, {'data': {
+            'total_achievements': len(records),
+            'total_xp': sum(record['score'] for record in records),
+            'average_score': (sum(record['score'] for record in records) / len(records)) if records else 0,
+            'achievements_by_course': {},
+            'recent_achievements': records[-5:]
+        }}
+
+    @_authenticated
+    def delete_achievement(self, params, query, body):
+        with self.state.lock:
+            self.state.achievements.get(params['email'], {}).pop(params['name'], None)
+        return 200, {'message': 'Logro eliminado'}
+
+    @_authenticated
+    def diploma_config(self, params, query, body):
+        return 200, {'data': {}}
+
+    @_authenticated
+    def diploma_eligibility(self, params, query, body):
+        return 200, {'data': {'elegible': False}}
+
+    @_authenticated
+    def diploma_list(self, params, query, body):
+        return 200, {'data': []}
+
+    @_authenticated
+    def diploma_delete(self, params, query, body):
+        return 200, {'message': 'Diploma eliminado'}
+
+    @_authenticated
+    def diploma_generate(self, params, query, body):
+        return 400, {'detail': 'El estudiante no cumple los requisitos para el diploma'}
+
+    @_authenticated
+    def diploma_verify(self, params, query, body):
+        return 404, {'detail': 'Diploma no encontrado'}
+
+    @_authenticated
+    def diploma_template(self, params, query, body):
+        return 201, {'data': dict(body, id=f"template-{next(self.state.ids)}")}
+
+    @_authenticated
+    def diploma_stats(self, params, query, body):
+        return 200, {'data': {'total_diplomas': 0, 'diplomas_por_curso': {}}}
+
+    @_authenticated
+    def diploma_convert_grade(self, params, query, body):
+        percentage = float(query.get('porcentaje', 0))
+        grade = round(1 + 4 * percentage / 100, 1)
+        return 200, {'nota_colombiana': grade, 'descripcion': 'Aprobado' if grade >= 3 else 'Reprobado'}
+
+
+class JudgeApiHandler(StubRequestHandler):
+    """Stand-in for the judge API with a configurable processing time"""
+
+    ROUTES = [
+        ('POST', r'/api/v1/auth/login', 'judge_login'),
+        ('GET', r'/api/v1/problems/?', 'problems'),
+        ('GET', r'/api/v1/problems/(?P<problem_id>[^/]+)', 'problem'),
+        ('POST', r'/api/v1/submissions/?', 'create_submission'),
+        ('GET', r'/api/v1/submissions/?', 'list_submissions'),
+        ('GET', r'/api/v1/submissions/(?P<submission_id>[^/]+)', 'get_submission'),
+        ('DELETE', r'/api/v1/submissions/(?P<submission_id>[^/]+)', 'delete_submission'),
+    ]
+
+    def current_email(self):
+        # The judge issues its own tokens; any bearer token it handed out is accepted
+        authorization = self.headers.get('Authorization') or ''
+        return 'judge' if authorization.startswith('Bearer stub-judge-') else None
+
+    def judge_login(self, params, query, body):
+        return 200, {'access_token': f"stub-judge-{next(self.state.ids)}", 'token_type': 'bearer'}
+
+    @_authenticated
+    def problems(self, params, query, body):
+        return 200, [dict(problem, created_at=_now(), test_cases=[]) for problem in SEEDED_PROBLEMS]
+
+    @_authenticated
+    def problem(self, params, query, body):
+        for problem in SEEDED_PROBLEMS:
+            if problem['_id'] == params['problem_id']:
+                return 200, dict(problem, created_at=_now(), test_cases=[])
+        return 404, {'detail': 'Problem not found'}
+
+    @_authenticated
+    def create_submission(self, params, query, body):
+        submission = {
+            '_id': f"submission-{next(self.state.ids)}",
+            'problem_id': body.get('problem_id'),
+            'user_id': body.get('email'),
+            'code': body.get('code', ''),
+            'language': body.get('language', 'python'),
+            'status': 'pending',
+            'created_at': _now(),
+            'submitted_at': time.time(),
+            'processing_time': self.state.judge_processing_time + random.uniform(0, self.state.judge_processing_jitter)
+        }
+        with self.state.lock:
+            self.state.submissions[submission['_id']] = submission
+        return 201, self._public(submission)
+
+    def _public(self, submission):
+        """Submission as the judge reports it right now (verdict once processing time elapsed)"""
+        public = {key: value for key, value in submission.items() if key not in ('submitted_at', 'processing_time')}
+        completed_at = submission['submitted_at'] + submission['processing_time']
+        if time.time() < completed_at:
+            public['status'] = 'running'
+            return public
+        public.update({
+            'status': 'accepted' if submission['code'].strip() else 'wrong_answer',
+            'execution_time': 0.01,
+            'memory_used': 1024,
+            'score': 100 if submission['code'].strip() else 0,
+            'completed_at': completed_at,
+            'test_case_results': []
+        })
+        return public
+
+    @_authenticated
+    def list_submissions(self, params, query, body):
+        email = query.get('email')
+        with self.state.lock:
+            submissions = [s for s in self.state.submissions.values() if not email or s['user_id'] == email]
+        return 200, [self._public(submission) for submission in submissions]
+
+    @_authenticated
+    def get_submission(self, params, query, body):
+        submission = self.state.submissions.get(params['submission_id'])
+        if not submission:
+            return 404, {'detail': 'Submission not found'}
+        return 200, self._public(submission)
+
+    @_authenticated
+    def delete_submission(self, params, query, body):
+        with self.state.lock:
+            removed = self.state.submissions.pop(params['submission_id'], None)
+        if not removed:
+            return 404, {'detail': 'Submission not found'}
+        return 200, {'message': 'Submission deleted'}
+
+
+class GradesApiHandler(StubRequestHandler):
+    """Stand-in for the grades service the assessment pages post to directly (no auth header)"""
+
+    ROUTES = [
+        ('POST', r'/grades(?:/grades)?/?', 'submit_grade'),
+        ('POST', r'/responses/responses/?', 'submit_responses'),
+    ]
+
+    def submit_grade(self, params, query, body):
+        return 201, self.state.set_grade(body.get('email'), body.get('module'), body.get('grade', 0))
+
+    def submit_responses(self, params, query, body):
+        return 201, self.state.add_responses(body.get('email'), body.get('responses', []))
+
+
+class StubHTTPServer(ThreadingHTTPServer):
+    """Threaded server with a listen backlog deep enough for load-test bursts"""
+
+    request_queue_size = 128
+
+
+class StubBackend:
+    """Runs the stub services on the ports the frontend expects, in background threads"""
+
+    SERVICES = [
+        ('user', USER_API_URL, UserApiHandler),
+        ('learning', LEARNING_API_URL, LearningApiHandler),
+        ('judge', JUDGE_API_URL, JudgeApiHandler),
+        ('grades', GRADES_API_URL, GradesApiHandler),
+    ]
+
+    def __init__(self, logger=None, judge_processing_time=None, judge_processing_jitter=None):
+        self.logger = logger
+        self.state = StubState(judge_processing_time, judge_processing_jitter)
+        self.servers = []
+
+    def start(self):
+        """Bind every service and serve it from a daemon thread (none stay up if one cannot bind)"""
+        try:
+            for name, url, handler_class in self.SERVICES:
+                parsed = urlparse(url)
+                handler = type(handler_class.__name__, (handler_class,), {'state': self.state})
+                server = StubHTTPServer((parsed.hostname, parsed.port), handler)
+                server.daemon_threads = True
+                threading.Thread(target=server.serve_forever, daemon=True).start()
+                self.servers.append(server)
+                if self.logger:
+                    self.logger.add_log(f"Stub {name} API listening on {url}", "INFO")
+        except Exception:
+            self.stop()
+            raise
+        return self
+
+    def stop(self):
+        """Shut every service down"""
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        self.servers = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    """Serve the stub backend until interrupted"""
+    parser = argparse.ArgumentParser(description='RavenCode stub backend')
+    parser.add_argument('--judge-processing-time', type=float, help='Seconds the stub judge takes per submission')
+    parser.add_argument('--judge-processing-jitter', type=float, help='Extra random seconds per submission')
+    args = parser.parse_args()
+
+    backend = StubBackend(
+        judge_processing_time=args.judge_processing_time, judge_processing_jitter=args.judge_processing_jitter
+    ).start()
+    for name, url, _ in StubBackend.SERVICES:
+        print(f"Stub {name} API listening on {url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        backend.stop()
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,12 @@
 Test user data for RavenCode frontend tests
 """
 
-import time
+import itertools
+import os
 import random
+import secrets
+import threading
+import time
 
 # Static test users (should exist in the database)
 STATIC_USERS = {
@@ -91,11 +95,24 @@ PROFILE_UPDATES = {
     }
 }
 
+_id_counter = itertools.count(1)
+_id_lock = threading.Lock()
+# (pid, tag) of the process the tag was drawn in: forked workers inherit this module's state
+_process_tag = (None, None)
+
+def unique_id():
+    """Identifier unique across threads, worker processes and CI nodes: timestamp, process tag, per-process counter"""
+    global _process_tag
+    pid = os.getpid()
+    with _id_lock:
+        if _process_tag[0] != pid:
+            _process_tag = (pid, f"{pid:x}{secrets.token_hex(3)}")
+        serial = next(_id_counter)
+    return f"{int(time.time())}_{_process_tag[1]}_{serial}"
+
 def generate_unique_email():
     """Generate a unique email for testing"""
-    timestamp = int(time.time())
-    random_num = random.randint(1000, 9999)
-    return f"testuser_{timestamp}_{random_num}@example.com"
+    return f"testuser_{unique_id()}@example.com"
 
 def generate_test_user(role='student'):
     """Generate a complete test user"""
@@ -1,29 +1,505 @@
 """
 Test Logger for RavenCode Frontend Test Suite
-Handles logging and PDF report generation
+Handles logging (streamed to a JSONL file) and PDF report generation
 """
 
+import atexit
+import json
 import os
+import queue
+import subprocess
+import sys
+import textwrap
+import threading
 import time
+from collections import deque
 from datetime import datetime
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from stats import MetricTable
+from timing import SpanTable
 try:
-    from config import REPORTS_DIR
+    from config import REPORTS_DIR, LOGS_DIR, LOG_HISTORY_LIMIT, LOG_FLUSH_INTERVAL, SCREENSHOTS_DIR, SCREENSHOT_MANIFEST
 except ImportError:
     import os
     REPORTS_DIR = os.path.join(os.path.dirname(__file__), 'reports')
-    os.makedirs(REPORTS_DIR, exist_ok=True)
+    LOGS_DIR = os.path.join(REPORTS_DIR, 'logs')
+    LOG_HISTORY_LIMIT = 2000
+    LOG_FLUSH_INTERVAL = 0.5
+    SCREENSHOTS_DIR = os.path.join(os.path.dirname(__file__), 'screenshots')
+    SCREENSHOT_MANIFEST = os.path.join(SCREENSHOTS_DIR, 'manifest.jsonl')
+    os.makedirs(LOGS_DIR, exist_ok=True)
+
+# Report detail: log types in display order, rows per detail table, wrap width of messages
+REPORT_LOG_TYPES = ['FAIL', 'PASS', 'WARN', 'INFO']
+REPORT_TABLE_CHUNK = 250
+REPORT_WRAP_WIDTH = 90
+# Network waterfall: URL characters shown per request and width of the timeline bar
+REPORT_URL_WIDTH = 48
+REPORT_WATERFALL_WIDTH = 24
+# Page-load benchmark columns: (metric, heading), shown as p50 / p95
+REPORT_PERF_COLUMNS = [('ttfb', 'TTFB (ms)'), ('fcp', 'FCP (ms)'), ('lcp', 'LCP (ms)'), ('load', 'Load (ms)')]
+
+
+class JsonlLogSink:
+    """Buffered background writer that streams log entries to a JSONL file"""
+    
+    def __init__(self, path, flush_interval=LOG_FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="log-sink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        
+    def write(self, entry):
+        """Queue an entry for the writer thread"""
+        if not self._closed:
+            self._queue.put(entry)
+        
+    def flush(self):
+        """Block until everything queued so far is on disk"""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        
+    def close(self):
+        """Flush remaining entries and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        
+    def _run(self):
+        with open(self.path, 'a', encoding='utf-8') as stream:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    stream.flush()
+                    continue
+                
+                # Drain whatever else is queued, then flush the batch in one go
+                batch = [item]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                stop = False
+                for item in batch:
+                    if item is None:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        stream.flush()
+                        item.set()
+                    else:
+                        stream.write(json.dumps(item, ensure_ascii=False) + "\n")
+                stream.flush()
+                if stop:
+                    return
+
+
+def read_log_stream(path):
+    """Yield the entries of a JSONL log stream (skipping a torn final line)"""
+    with open(path, encoding='utf-8') as stream:
+        for line in stream:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def _report_styles():
+    """Paragraph and table styles shared by the report sections"""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    
+    styles = getSampleStyleSheet()
+    return {
+        'sheet': styles,
+        'title': ParagraphStyle(
+            'CustomTitle', parent=styles['Heading1'], fontSize=24, spaceAfter=30,
+            alignment=TA_CENTER, textColor=colors.darkblue
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading', parent=styles['Heading2'], fontSize=16, spaceAfter=12,
+            spaceBefore=12, textColor=colors.darkblue
+        ),
+        'link': ParagraphStyle('Link', parent=styles['Normal'], fontSize=8),
+        'table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black)
+        ]),
+        'type_colors': {
+            'FAIL': colors.darkred,
+            'PASS': colors.darkgreen,
+            'WARN': colors.darkorange,
+            'INFO': colors.darkblue
+        }
+    }
+
+
+def _add_table(story, rows, col_widths, style=None, space_after=12, repeat_rows=1):
+    """Append a styled table (header row repeated across pages) and the space after it"""
+    from reportlab.platypus import Spacer, Table
+    
+    table = Table(rows, colWidths=col_widths, repeatRows=repeat_rows)
+    table.setStyle(style or _report_styles()['table'])
+    story.append(table)
+    if space_after:
+        story.append(Spacer(1, space_after))
+
+
+def _render_summary(story, summary):
+    """Title, the run summary table and the pass rate"""
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    
+    styles = _report_styles()
+    story.append(Paragraph("RavenCode Frontend Test Report", styles['title']))
+    story.append(Spacer(1, 12))
+    story.append(Paragraph("Test Summary", styles['heading']))
+    
+    summary_table = Table(summary['rows'], colWidths=[2*inch, 3*inch])
+    summary_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    story.append(summary_table)
+    story.append(Spacer(1, 12))
+    
+    if summary['pass_rate'] is not None:
+        story.append(Paragraph(f"Pass Rate: {summary['pass_rate']:.1f}%", styles['heading']))
+        story.append(Spacer(1, 12))
+
+
+def _render_spans(story, records):
+    """Step Timings and Test Timings tables from 'span' records"""
+    from reportlab.platypus import Paragraph
+    from reportlab.lib.units import inch
+    
+    spans = SpanTable()
+    for record in records:
+        spans.add(record)
+    for per_test, title in ((False, "Step Timings"), (True, "Test Timings")):
+        if not (spans.by_test if per_test else spans.by_step):
+            continue
+        story.append(Paragraph(title, _report_styles()['heading']))
+        _add_table(story, spans.table(per_test), [2.5*inch] + [0.8*inch] * 5)
+
+
+def _render_load(story, records):
+    """One summary and journey-step table per virtual-student load run ('load' records)"""
+    from reportlab.platypus import Paragraph
+    from reportlab.lib.units import inch
+    
+    for load in records:
+        story.append(Paragraph(f"Load Test ({load['students']} virtual students)", _report_styles()['heading']))
+        _add_table(story, [
+            ['Metric', 'Value'],
+            ['Duration', f"{load['elapsed']:.0f}s (ramp-up {load['ramp_up']:.0f}s)"],
+            ['Journeys', f"{load['journeys'] - load['failures']} completed / {load['journeys']} started"],
+            ['Journeys per Minute', f"{load['journeys_per_minute']:.2f}"],
+            ['Error Rate', f"{load['error_rate'] * 100:.1f}%"]
+        ], [2*inch, 3*inch], space_after=6, repeat_rows=0)
+        step_rows = [['Journey Step', 'Count', 'p50 (s)', 'p95 (s)', 'Max (s)']] + [
+            [name, str(count), f"{p50:.2f}", f"{p95:.2f}", f"{maximum:.2f}"]
+            for name, count, p50, p95, maximum in load['steps']
+        ]
+        _add_table(story, step_rows, [2.7*inch] + [0.8*inch] * 4)
+
+
+def _render_http_load(story, records):
+    """Throughput and latency per auth endpoint, then the latency histograms ('http_load' records)"""
+    from reportlab.platypus import Paragraph
+    from reportlab.lib.units import inch
+    
+    story.append(Paragraph("Auth Endpoint Load (latency in ms)", _report_styles()['heading']))
+    http_rows = [['Endpoint', 'Clients', 'Requests', 'Req/s', 'Errors', 'p50', 'p95', 'p99', 'Max']]
+    for result in records:
+        latency = result['latency']
+        http_rows.append([result['endpoint'], str(result['concurrency']), str(result['requests']),
+                          f"{result['throughput']:.1f}", str(result['errors'])] + [
+            f"{latency[key]:.1f}" if latency['count'] else "-" for key in ('p50', 'p95', 'p99', 'max')
+        ])
+    _add_table(story, http_rows, [0.9*inch] + [0.65*inch] * 8, space_after=6)
+    
+    buckets = records[0]['buckets']
+    labels = [f"<= {bound}ms" for bound in buckets] + [f"> {buckets[-1]}ms"]
+    histogram_rows = [['Latency'] + [result['endpoint'] for result in records]] + [
+        [label] + [str(result['histogram'][index]) for result in records]
+        for index, label in enumerate(labels)
+    ]
+    _add_table(story, histogram_rows, [1.2*inch] + [0.9*inch] * len(records), repeat_rows=0)
+
+
+def _render_judge_benchmark(story, records):
+    """Submit-to-verdict latency and poll delay per polling interval ('judge_benchmark' records)"""
+    from reportlab.platypus import Paragraph, Spacer
+    from reportlab.lib.units import inch
+    
+    styles = _report_styles()
+    story.append(Paragraph("Judge Submission Latency (seconds)", styles['heading']))
+    judge_rows = [['Poll Every', 'Verdicts', 'Latency p50', 'Latency p95', 'Poll Delay p50', 'Delay Share', 'Polls']]
+    for result in records:
+        latency, poll_delay = result['latency'], result['poll_delay']
+        measured = bool(latency['count'])
+        judge_rows.append([
+            f"{result['poll_interval']}s",
+            f"{result['verdicts']}/{result['submissions']}",
+            f"{latency['p50']:.2f}" if measured else "-",
+            f"{latency['p95']:.2f}" if measured else "-",
+            f"{poll_delay['p50']:.2f}" if measured else "-",
+            f"{result['poll_delay_share'] * 100:.0f}%{'' if result['exact'] else '*'}" if measured else "-",
+            f"{result['polls_per_submission']:.1f}"
+        ])
+    _add_table(story, judge_rows, [0.8*inch, 0.8*inch] + [0.95*inch] * 4 + [0.6*inch], space_after=0)
+    if not all(result['exact'] for result in records if result['latency']['count']):
+        story.append(Paragraph("* judge reported no completion time; poll delay estimated as half the last poll gap",
+                               styles['sheet']['Normal']))
+    story.append(Spacer(1, 12))
+
+
+def _render_perf(story, records):
+    """Page-load percentiles per route ('perf' records)"""
+    from reportlab.platypus import Paragraph
+    from reportlab.lib.units import inch
+    
+    page_loads = MetricTable()
+    for record in records:
+        page_loads.add(record['group'], record['metrics'])
+    story.append(Paragraph("Page-Load Performance (p50 / p95)", _report_styles()['heading']))
+    perf_rows = [['Route', 'Samples'] + [heading for _, heading in REPORT_PERF_COLUMNS] + ['CLS (p50 / max)']]
+    for group in page_loads.groups:
+        row = [group, str(page_loads.sample_count(group))]
+        for metric, _ in REPORT_PERF_COLUMNS:
+            summary = page_loads.summary(group, metric)
+            row.append(f"{summary['p50']:.0f} / {summary['p95']:.0f}" if summary['count'] else "-")
+        cls = page_loads.summary(group, 'cls')
+        row.append(f"{cls['p50']:.3f} / {cls['max']:.3f}" if cls['count'] else "-")
+        perf_rows.append(row)
+    _add_table(story, perf_rows, [1.7*inch, 0.5*inch] + [0.75*inch] * 4 + [0.95*inch])
+
+
+def _render_network(story, records):
+    """Per-page request counts and sizes, then the latest navigation's waterfall per page ('network' records)"""
+    from reportlab.platypus import Paragraph, Spacer, TableStyle
+    from reportlab.lib.units import inch
+    from network import waterfall
+    
+    styles = _report_styles()
+    page_networks = MetricTable()
+    latest_waterfalls = {}
+    for record in records:
+        page_networks.add(record['page'], {
+            metric: value for metric, value in record['summary'].items() if isinstance(value, (int, float))
+        })
+        # Earlier navigations had their entries dropped while collecting; pages keep first-seen order
+        latest_waterfalls.setdefault(record['page'], None)
+        if record['entries'] is not None:
+            latest_waterfalls[record['page']] = record['entries']
+    
+    story.append(Paragraph("Network by Page (p50 per navigation)", styles['heading']))
+    network_rows = [['Page', 'Loads', 'Requests', 'API', 'Failed', 'JS (KB)', 'Total (KB)', 'Elapsed (ms)']]
+    for page in page_networks.groups:
+        p50 = {metric: page_networks.summary(page, metric)['p50']
+               for metric in ('requests', 'api_requests', 'failed', 'js_bytes', 'bytes', 'elapsed_ms')}
+        network_rows.append([
+            page, str(page_networks.sample_count(page)), f"{p50['requests']:.0f}", f"{p50['api_requests']:.0f}",
+            f"{p50['failed']:.0f}", f"{p50['js_bytes'] / 1024:.0f}", f"{p50['bytes'] / 1024:.0f}",
+            f"{p50['elapsed_ms']:.0f}"
+        ])
+    _add_table(story, network_rows, [1.7*inch] + [0.6*inch] * 5 + [0.75*inch, 0.85*inch])
+    
+    waterfall_style = TableStyle(styles['table'].getCommands() + [('FONTNAME', (-1, 1), (-1, -1), 'Courier')])
+    for page, entries in latest_waterfalls.items():
+        shown = waterfall(entries)
+        if not shown:
+            continue
+        span = max(entry['start_ms'] + (entry['duration_ms'] or 0) for entry in entries) or 1
+        story.append(Paragraph(f"Waterfall: {page} (slowest {len(shown)} of {len(entries)} requests)",
+                               styles['sheet']['Heading4']))
+        waterfall_rows = [['Request', 'Type', 'Status', 'Start', 'Time', 'KB', 'Timeline']]
+        for entry in shown:
+            offset = int(entry['start_ms'] / span * REPORT_WATERFALL_WIDTH)
+            length = max(1, int((entry['duration_ms'] or 0) / span * REPORT_WATERFALL_WIDTH))
+            url = f"{entry['method']} {entry['url']}"
+            waterfall_rows.append([
+                url if len(url) <= REPORT_URL_WIDTH else url[:REPORT_URL_WIDTH - 3] + "...",
+                entry['type'], str(entry['status'] or entry['error'] or '-'), f"{entry['start_ms']:.0f}",
+                f"{entry['duration_ms']:.0f}" if entry['duration_ms'] is not None else "-",
+                f"{entry['bytes'] / 1024:.1f}",
+                ("." * offset + "#" * length)[:REPORT_WATERFALL_WIDTH].ljust(REPORT_WATERFALL_WIDTH, ".")
+            ])
+        _add_table(story, waterfall_rows, [2.6*inch, 0.55*inch, 0.45*inch, 0.45*inch, 0.45*inch, 0.45*inch, 1.6*inch],
+                   style=waterfall_style, space_after=8)
+    story.append(Spacer(1, 4))
+
+
+def _render_visual(story, records):
+    """Result, changed pixels and a diff link per visual regression check ('visual' records)"""
+    from reportlab.platypus import Paragraph
+    from reportlab.lib.units import inch
+    
+    styles = _report_styles()
+    story.append(Paragraph("Visual Regression", styles['heading']))
+    visual_rows = [['Page', 'Result', 'Changed Pixels', 'Failed Tiles', 'Diff']]
+    for check in records:
+        if check['baseline_recorded']:
+            visual_rows.append([check['page'], 'baseline recorded', '-', '-', '-'])
+            continue
+        if check['size_mismatch']:
+            visual_rows.append([check['page'], 'FAIL', 'size differs', '-', check['size_mismatch']])
+            continue
+        diff_cell = Paragraph(
+            f'<a href="file://{check["diff"]}" color="blue">{os.path.basename(check["diff"])}</a>', styles['link']
+        ) if check['diff'] else '-'
+        visual_rows.append([check['page'], 'PASS' if check['passed'] else 'FAIL',
+                            f"{check['changed_ratio'] * 100:.2f}%", f"{check['failed_tiles']}/{check['tiles']}",
+                            diff_cell])
+    _add_table(story, visual_rows, [1.2*inch, 1.1*inch, 1.1*inch, 1*inch, 2.1*inch])
+
+
+def _render_screenshot(story, records):
+    """Captures linked to the stored files and the shared manifest ('screenshot' records)"""
+    from reportlab.platypus import Paragraph, Spacer
+    from reportlab.lib.units import inch
+    from screenshots import read_manifest
+    
+    styles = _report_styles()
+    stored = {entry['id']: entry for entry in read_manifest(SCREENSHOT_MANIFEST)[0]}
+    story.append(Paragraph(f"Screenshots ({len(records)})", styles['heading']))
+    story.append(Paragraph(
+        f'Manifest: <a href="file://{SCREENSHOT_MANIFEST}" color="blue">{SCREENSHOT_MANIFEST}</a>', styles['link']
+    ))
+    story.append(Spacer(1, 6))
+    screenshot_rows = [['Test', 'Capture', 'File', 'Size (KB)']]
+    for capture in records:
+        entry = stored.get(capture['id'], {})
+        if entry.get('file'):
+            filepath = os.path.join(SCREENSHOTS_DIR, entry['file'])
+            file_cell = Paragraph(f'<a href="file://{filepath}" color="blue">{entry["file"]}</a>', styles['link'])
+            size = f"{entry['bytes'] / 1024:.0f} of {entry['raw_bytes'] / 1024:.0f}"
+            size += " (duplicate)" if entry['duplicate'] else ""
+        else:
+            file_cell, size = entry.get('error', 'not stored'), "-"
+        screenshot_rows.append([capture['test'] or "-", capture['name'], file_cell, size])
+    _add_table(story, screenshot_rows, [1.6*inch, 1.5*inch, 2.2*inch, 1.2*inch])
+
+
+def _render_logs(story, grouped):
+    """Detailed logs by type, as tables of REPORT_TABLE_CHUNK rows so layout work stays bounded"""
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import inch
+    
+    styles = _report_styles()
+    story.append(Paragraph("Detailed Test Logs", styles['heading']))
+    detail_style = TableStyle([
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('TOPPADDING', (0, 0), (-1, -1), 1),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 1)
+    ])
+    for log_type in REPORT_LOG_TYPES:
+        rows = grouped[log_type]
+        if not rows:
+            continue
+        story.append(Paragraph(f"{log_type} Messages ({len(rows)})", 
+                             ParagraphStyle('SubHeading', parent=styles['sheet']['Heading3'], 
+                                          fontSize=14, textColor=styles['type_colors'][log_type])))
+        for start in range(0, len(rows), REPORT_TABLE_CHUNK):
+            detail_table = Table(rows[start:start + REPORT_TABLE_CHUNK], colWidths=[1.4*inch, 5.1*inch])
+            detail_table.setStyle(detail_style)
+            story.append(detail_table)
+        story.append(Spacer(1, 12))
+
+
+# Report sections in page order: the record kind each one renders and its renderer
+REPORT_SECTIONS = [
+    ('span', _render_spans),
+    ('load', _render_load),
+    ('http_load', _render_http_load),
+    ('judge_benchmark', _render_judge_benchmark),
+    ('perf', _render_perf),
+    ('network', _render_network),
+    ('visual', _render_visual),
+    ('screenshot', _render_screenshot),
+]
+
+
+def _collect_report_records(log_path):
+    """One pass over a log stream: structured records by kind, and log messages by type
+
+    Only the latest navigation of each page keeps its network entries (the only
+    waterfall drawn), so a long capture does not hold every request in memory.
+    """
+    records = {kind: [] for kind, _ in REPORT_SECTIONS}
+    grouped = {log_type: [] for log_type in REPORT_LOG_TYPES}
+    latest_network = {}
+    for log_entry in read_log_stream(log_path):
+        kind = log_entry.get('kind')
+        if kind in records:
+            if kind == 'network':
+                previous = latest_network.get(log_entry['page'])
+                if previous is not None:
+                    previous['entries'] = None
+                latest_network[log_entry['page']] = log_entry
+            records[kind].append(log_entry)
+        elif log_entry.get('type') in grouped:
+            grouped[log_entry['type']].append(
+                (log_entry['timestamp'], textwrap.fill(str(log_entry['message']), REPORT_WRAP_WIDTH))
+            )
+    return records, grouped
+
+
+def render_pdf_report(log_path, filepath, summary):
+    """Render the PDF report from a JSONL log stream in a single pass"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate
+    
+    doc = SimpleDocTemplate(filepath, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
+    records, grouped = _collect_report_records(log_path)
+    
+    story = []
+    _render_summary(story, summary)
+    for kind, render in REPORT_SECTIONS:
+        if records[kind]:
+            render(story, records[kind])
+    _render_logs(story, grouped)
+    
+    doc.build(story)
+    return filepath
 
 
 class TestLogger:
-    def __init__(self, test_suite_name="RavenCode Frontend Tests"):
+    def __init__(self, test_suite_name="RavenCode Frontend Tests", stream=True, history_limit=LOG_HISTORY_LIMIT):
         self.test_suite_name = test_suite_name
-        self.logs = []
+        # Recent entries only; the full history lives in the JSONL stream
+        self.logs = deque(maxlen=history_limit)
+        self.sink = None
+        self.log_path = None
+        if stream:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.log_path = os.path.join(LOGS_DIR, f"ravencode_test_log_{timestamp}_{os.getpid()}.jsonl")
+            self.sink = JsonlLogSink(self.log_path)
         self.start_time = None
         self.end_time = None
         self.test_results = {
@@ -38,9 +514,9 @@ class TestLogger:
         self.start_time = datetime.now()
         self.add_log(f"Starting {self.test_suite_name}", "INFO")
         
-    def end_test(self):
-        """End the test session"""
-        self.end_time = datetime.now()
+    def end_test(self, end_time=None):
+        """End the test session (at end_time when replaying a finished run, e.g. merged shards)"""
+        self.end_time = end_time or datetime.now()
         if self.start_time:
             duration = self.end_time - self.start_time
             self.add_log(f"Test session completed in {duration}", "INFO")
@@ -56,6 +532,8 @@ class TestLogger:
             'type': log_type
         }
         self.logs.append(log_entry)
+        if self.sink:
+            self.sink.write(log_entry)
         self.test_results[log_type] = self.test_results.get(log_type, 0) + 1
         
         # Print to console with color coding
@@ -70,8 +548,50 @@ class TestLogger:
         color = color_codes.get(log_type, '')
         print(f"{color}[{timestamp}] {log_type}: {message}{reset_code}")
         
-    def generate_pdf(self):
-        """Generate PDF report"""
+    def add_record(self, record):
+        """Add a structured, non-message record (e.g. a timing span) to the stream"""
+        self.logs.append(record)
+        if self.sink:
+            self.sink.write(record)
+        
+    def merge_logs(self, entries):
+        """Merge log entries produced by another logger (e.g. a worker process)"""
+        for log_entry in entries:
+            self.logs.append(log_entry)
+            if self.sink:
+                self.sink.write(log_entry)
+            if 'kind' in log_entry:
+                continue
+            log_type = log_entry['type']
+            self.test_results[log_type] = self.test_results.get(log_type, 0) + 1
+        
+    def iter_logs(self):
+        """Iterate over every entry of the run, read back from the on-disk stream"""
+        if not self.sink:
+            return iter(list(self.logs))
+        self.sink.flush()
+        return read_log_stream(self.log_path)
+        
+    def report_summary(self):
+        """Summary rows and pass rate shown at the top of the report"""
+        total_tests = self.test_results['PASS'] + self.test_results['FAIL']
+        return {
+            'rows': [
+                ['Test Suite', self.test_suite_name],
+                ['Start Time', self.start_time.strftime("%Y-%m-%d %H:%M:%S")],
+                ['End Time', self.end_time.strftime("%Y-%m-%d %H:%M:%S") if self.end_time else "In Progress"],
+                ['Duration', str(self.end_time - self.start_time) if self.end_time else "N/A"],
+                ['Total Tests', str(total_tests)],
+                ['Passed', str(self.test_results['PASS'])],
+                ['Failed', str(self.test_results['FAIL'])],
+                ['Warnings', str(self.test_results['WARN'])],
+                ['Info Messages', str(self.test_results['INFO'])]
+            ],
+            'pass_rate': (self.test_results['PASS'] / total_tests * 100) if total_tests > 0 else None
+        }
+        
+    def generate_pdf(self, background=True):
+        """Generate PDF report (in a detached process unless background=False)"""
         if not self.start_time:
             self.add_log("Cannot generate report: Test session not started", "FAIL")
             return None
@@ -81,107 +601,32 @@ class TestLogger:
         filename = f"ravencode_frontend_test_report_{timestamp:010d}.pdf"
         filepath = os.path.join(REPORTS_DIR, filename)
         
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            filepath,
-            pagesize=A4,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18
-        )
-        
-        # Styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceAfter=12,
-            spaceBefore=12,
-            textColor=colors.darkblue
-        )
-        
-        # Story elements
-        story = []
-        
-        # Title
-        story.append(Paragraph("RavenCode Frontend Test Report", title_style))
-        story.append(Spacer(1, 12))
-        
-        # Test Summary
-        story.append(Paragraph("Test Summary", heading_style))
-        
-        summary_data = [
-            ['Test Suite', self.test_suite_name],
-            ['Start Time', self.start_time.strftime("%Y-%m-%d %H:%M:%S")],
-            ['End Time', self.end_time.strftime("%Y-%m-%d %H:%M:%S") if self.end_time else "In Progress"],
-            ['Duration', str(self.end_time - self.start_time) if self.end_time else "N/A"],
-            ['Total Tests', str(self.test_results['PASS'] + self.test_results['FAIL'])],
-            ['Passed', str(self.test_results['PASS'])],
-            ['Failed', str(self.test_results['FAIL'])],
-            ['Warnings', str(self.test_results['WARN'])],
-            ['Info Messages', str(self.test_results['INFO'])]
-        ]
-        
-        summary_table = Table(summary_data, colWidths=[2*inch, 3*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        
-        story.append(summary_table)
-        story.append(Spacer(1, 12))
-        
-        # Test Results Overview
-        if self.test_results['PASS'] + self.test_results['FAIL'] > 0:
-            pass_rate = (self.test_results['PASS'] / (self.test_results['PASS'] + self.test_results['FAIL'])) * 100
-            story.append(Paragraph(f"Pass Rate: {pass_rate:.1f}%", heading_style))
-            story.append(Spacer(1, 12))
-        
-        # Detailed Logs
-        story.append(Paragraph("Detailed Test Logs", heading_style))
+        # The renderer reads the run from disk; make sure everything logged so far is there
+        if self.sink:
+            self.sink.flush()
+            log_path = self.log_path
+        else:
+            log_path = os.path.join(LOGS_DIR, f"ravencode_test_log_{timestamp}_{os.getpid()}.jsonl")
+            with open(log_path, 'w', encoding='utf-8') as stream:
+                for log_entry in self.logs:
+                    stream.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+        summary = self.report_summary()
         
-        # Group logs by type for better organization
-        log_types = ['FAIL', 'PASS', 'WARN', 'INFO']
+        if background:
+            try:
+                subprocess.Popen(
+                    [sys.executable, os.path.abspath(__file__), '--render', log_path, filepath, json.dumps(summary)],
+                    cwd=os.path.dirname(os.path.abspath(__file__)),
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+                self.add_log(f"PDF report generation started in background: {filename}", "INFO")
+                return timestamp
+            except OSError as e:
+                self.add_log(f"Could not start background report generation, rendering inline: {str(e)}", "WARN")
         
-        for log_type in log_types:
-            type_logs = [log for log in self.logs if log['type'] == log_type]
-            if not type_logs:
-                continue
-                
-            story.append(Paragraph(f"{log_type} Messages ({len(type_logs)})", 
-                                 ParagraphStyle('SubHeading', parent=styles['Heading3'], 
-                                              fontSize=14, textColor=colors.darkred if log_type == 'FAIL' 
-                                              else colors.darkgreen if log_type == 'PASS'
-                                              else colors.darkorange if log_type == 'WARN'
-                                              else colors.darkblue)))
-            
-            for log in type_logs:
-                log_text = f"[{log['timestamp']}] {log['message']}"
-                story.append(Paragraph(log_text, styles['Normal']))
-                story.append(Spacer(1, 6))
-            
-            story.append(Spacer(1, 12))
-        
-        # Build PDF
         try:
-            doc.build(story)
+            render_pdf_report(log_path, filepath, summary)
             self.add_log(f"PDF report generated: {filename}", "INFO")
             return timestamp
         except Exception as e:
@@ -199,4 +644,10 @@ class TestLogger:
             'failed': self.test_results['FAIL'],
             'pass_rate': pass_rate,
             'duration': str(self.end_time - self.start_time) if self.end_time and self.start_time else "N/A"
-        } 
\ No newline at end of file
+        }
+
+
+if __name__ == "__main__":
+    # Background report rendering: test_logger.py --render <log.jsonl> <report.pdf> <summary json>
+    if len(sys.argv) == 5 and sys.argv[1] == '--render':
+        render_pdf_report(sys.argv[2], sys.argv[3], json.loads(sys.argv[4]))
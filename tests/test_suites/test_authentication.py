@@ -3,14 +3,19 @@ Authentication Test Suite for RavenCode Frontend
 Tests login, registration, password recovery, and logout functionality
 """
 
-import time
 from base_test import BaseTest
+from registry import register_suite, register_test
 from test_data.users import STATIC_USERS, INVALID_USERS, generate_test_user
 
 
+@register_suite('authentication')
 class AuthenticationTests(BaseTest):
     """Test suite for authentication functionality"""
     
+    # This suite exercises the real /login form
+    use_fast_login = False
+    
+    @register_test('test_login_valid_admin', 'admin_login', routes=('login', 'dashboard', 'admin'), tags=('smoke', 'login', 'admin'))
     def test_valid_login_admin(self):
         """Test login with valid admin credentials"""
         self.logger.add_log("Testing valid admin login", "INFO")
@@ -39,6 +44,7 @@ class AuthenticationTests(BaseTest):
         
         return success
     
+    @register_test('test_login_valid_student', 'student_login', routes=('login', 'dashboard'), tags=('smoke', 'login', 'student'))
     def test_valid_login_student(self):
         """Test login with valid student credentials"""
         self.logger.add_log("Testing valid student login", "INFO")
@@ -67,6 +73,7 @@ class AuthenticationTests(BaseTest):
         
         return success
     
+    @register_test('test_login_invalid', 'invalid_password', routes=('login',), tags=('login', 'negative'))
     def test_invalid_login_wrong_password(self):
         """Test login with wrong password"""
         self.logger.add_log("Testing login with wrong password", "INFO")
@@ -76,6 +83,7 @@ class AuthenticationTests(BaseTest):
         
         return success
     
+    @register_test('test_login_nonexistent', 'nonexistent_user', routes=('login',), tags=('login', 'negative'))
     def test_invalid_login_nonexistent_user(self):
         """Test login with nonexistent user"""
         self.logger.add_log("Testing login with nonexistent user", "INFO")
@@ -85,6 +93,7 @@ class AuthenticationTests(BaseTest):
         
         return success
     
+    @register_test('test_registration_new', 'new_user_registration', routes=('register',), tags=('registration', 'form'))
     def test_user_registration_valid(self):
         """Test user registration with valid data"""
         self.logger.add_log("Testing valid user registration", "INFO")
@@ -127,8 +136,7 @@ class AuthenticationTests(BaseTest):
             # Submit registration
             register_button = self.wait_for_clickable("xpath", "//button[contains(., 'Crear cuenta')]")
             if register_button:
-                register_button.click()
-                time.sleep(3)
+                self.click_and_wait(register_button)
                 
                 # Check for success (redirect to login or success message)
                 if "login" in self.driver.current_url.lower():
@@ -153,12 +161,16 @@ class AuthenticationTests(BaseTest):
             self.take_screenshot("registration_error")
             return False
     
+    @register_test('test_registration_duplicate', 'duplicate_email_registration', routes=('register',), tags=('registration', 'negative'))
     def test_user_registration_duplicate_email(self, existing_email=None):
         """Test user registration with existing email"""
         self.logger.add_log("Testing registration with duplicate email", "INFO")
         
         if not existing_email:
-            existing_email = STATIC_USERS['student1']['email']
+            account = self.get_test_account("duplicate-email registration", STATIC_USERS['student1'])
+            if not account:
+                return False
+            existing_email = account['email']
         
         self.navigate_to("/register")
         
@@ -195,8 +207,7 @@ class AuthenticationTests(BaseTest):
             # Submit registration
             register_button = self.wait_for_clickable("xpath", "//button[contains(., 'Crear cuenta')]")
             if register_button:
-                register_button.click()
-                time.sleep(3)
+                self.click_and_wait(register_button)
                 
                 # Should show error message
                 error_toast = self.wait_for_toast_message("Email already registered", timeout=5)
@@ -219,6 +230,7 @@ class AuthenticationTests(BaseTest):
             self.logger.add_log(f"Duplicate email test failed: {str(e)}", "FAIL")
             return False
     
+    @register_test('test_forgot_password', 'forgot_password', routes=('forgot_password',), tags=('form',))
     def test_forgot_password_request(self):
         """Test password recovery request"""
         self.logger.add_log("Testing forgot password request", "INFO")
@@ -241,8 +253,7 @@ class AuthenticationTests(BaseTest):
                 # Click send button
                 send_button = self.wait_for_clickable("xpath", "//button[contains(., 'Enviar código') or contains(., 'Enviar')]")
                 if send_button:
-                    send_button.click()
-                    time.sleep(2)
+                    self.click_and_wait(send_button)
                     
                     # Check for success message
                     success_toast = self.wait_for_toast_message("Código de recuperación enviado", timeout=10)
@@ -263,6 +274,7 @@ class AuthenticationTests(BaseTest):
             self.logger.add_log(f"Forgot password test failed: {str(e)}", "FAIL")
             return False
     
+    @register_test('test_logout', 'logout', routes=('login', 'dashboard'), tags=('smoke', 'session'))
     def test_logout_functionality(self):
         """Test user logout"""
         self.logger.add_log("Testing logout functionality", "INFO")
@@ -276,6 +288,7 @@ class AuthenticationTests(BaseTest):
         # Now test logout
         return self.logout_user()
     
+    @register_test('test_session_persistence', 'session_persistence', routes=('login', 'dashboard'), tags=('session',))
     def test_session_persistence(self):
         """Test session persistence across page refreshes"""
         self.logger.add_log("Testing session persistence", "INFO")
@@ -287,7 +300,7 @@ class AuthenticationTests(BaseTest):
         
         # Refresh page
         self.driver.refresh()
-        time.sleep(2)
+        self.wait_until_ready()
         
         # Should still be logged in
         try:
@@ -312,29 +325,32 @@ class AuthenticationTests(BaseTest):
             
             # Test valid logins
             results['admin_login'] = self.test_valid_login_admin()
-            self.logout_user()  # Logout between tests
+            self.reset_context()  # Fresh browser context between tests
             
             results['student_login'] = self.test_valid_login_student()
-            self.logout_user()
+            self.reset_context()
             
             # Test invalid logins
             results['invalid_password'] = self.test_invalid_login_wrong_password()
+            self.reset_context()
             results['nonexistent_user'] = self.test_invalid_login_nonexistent_user()
+            self.reset_context()
             
             # Test registration
-            new_email = self.test_user_registration_valid()
-            results['new_user_registration'] = bool(new_email)
+            results['new_user_registration'] = bool(self.test_user_registration_valid())
+            self.reset_context()
+            # Against a pooled (or static) account, so it holds even when the registration above failed
+            results['duplicate_email_registration'] = self.test_user_registration_duplicate_email()
             
-            if new_email:
-                results['duplicate_email_registration'] = self.test_user_registration_duplicate_email(new_email)
-            else:
-                results['duplicate_email_registration'] = self.test_user_registration_duplicate_email()
+            self.reset_context()
             
             # Test password recovery
             results['forgot_password'] = self.test_forgot_password_request()
+            self.reset_context()
             
             # Test logout and session
             results['logout'] = self.test_logout_functionality()
+            self.reset_context()
             results['session_persistence'] = self.test_session_persistence()
             
         except Exception as e:
@@ -3,20 +3,22 @@ Module Workflow Test Suite for RavenCode Frontend
 Tests complete module workflows, lesson navigation, and assessment completion
 """
 
-import time
 from base_test import BaseTest
+from registry import register_suite, register_test
 from test_data.users import get_admin_user, get_student_user
 
 
+@register_suite('modules')
 class ModuleTests(BaseTest):
     """Test suite for module functionality"""
     
-    def test_module1_complete_workflow(self):
+    @register_test('test_module1_workflow', 'module1_workflow', routes=('dashboard', 'courses', 'module1'), tags=('workflow', 'slow', 'admin'))
+    def test_module1_complete_workflow(self, user=None):
         """Test complete Module 1 workflow from courses to assessment"""
         self.logger.add_log("Testing Module 1 complete workflow", "INFO")
         
-        # Use admin user for comprehensive access
-        admin_user = get_admin_user()
+        # Use admin user for comprehensive access (load runs pass their own students)
+        admin_user = user or get_admin_user()
         
         try:
             # 1. Login
@@ -45,9 +47,8 @@ class ModuleTests(BaseTest):
                 return False
             
             self.scroll_to_element(ver_contenidos_btn)
-            ver_contenidos_btn.click()
+            self.click_and_wait(ver_contenidos_btn, label="Ver contenidos")
             self.logger.add_log("Clicked 'Ver contenidos'", "INFO")
-            time.sleep(2)
             
             # 5. Click "Ver lección" for Introduction
             ver_leccion_intro_btn = self.wait_for_clickable("xpath", "//button[contains(., 'Ver lección')][ancestor::*[contains(., 'Introducción')]]")
@@ -56,9 +57,8 @@ class ModuleTests(BaseTest):
                 return False
             
             self.scroll_to_element(ver_leccion_intro_btn)
-            ver_leccion_intro_btn.click()
+            self.click_and_wait(ver_leccion_intro_btn, label="Introducción")
             self.logger.add_log("Clicked 'Ver lección' for Introduction", "INFO")
-            time.sleep(2)
             
             # 6. Click "Inicia tu aprendizaje"
             inicia_btn = self.wait_for_clickable("xpath", "//button[contains(., 'Inicia tu aprendizaje')]")
@@ -67,9 +67,8 @@ class ModuleTests(BaseTest):
                 return False
             
             self.scroll_to_element(inicia_btn)
-            inicia_btn.click()
+            self.click_and_wait(inicia_btn, label="Inicia tu aprendizaje")
             self.logger.add_log("Clicked 'Inicia tu aprendizaje'", "INFO")
-            time.sleep(2)
             
             # 7. Navigate through lessons 1-5
             for lesson_num in range(1, 6):
@@ -84,9 +83,8 @@ class ModuleTests(BaseTest):
                 siguiente_btn = self.wait_for_clickable("xpath", "//button[contains(., 'Siguiente')]")
                 if siguiente_btn:
                     self.scroll_to_element(siguiente_btn)
-                    siguiente_btn.click()
+                    self.click_and_wait(siguiente_btn, label="Siguiente")
                     self.logger.add_log(f"Clicked 'Siguiente' on Lección {lesson_num}", "INFO")
-                    time.sleep(2)
                 else:
                     self.logger.add_log(f"'Siguiente' button not found on Lección {lesson_num}", "FAIL")
                     return False
@@ -98,9 +96,8 @@ class ModuleTests(BaseTest):
                 return False
             
             self.scroll_to_element(reto_btn)
-            reto_btn.click()
+            self.click_and_wait(reto_btn, label="Reto")
             self.logger.add_log("Clicked 'Reto' on final lesson", "INFO")
-            time.sleep(2)
             
             # 9. Verify we reached the assessment
             assessment_indicator = self.wait_for_element("xpath", "//*[contains(text(), 'Evaluación Juez Módulo 1')]", timeout=10)
@@ -116,6 +113,7 @@ class ModuleTests(BaseTest):
             self.take_screenshot("module1_workflow_error")
             return False
     
+    @register_test('test_module2_workflow', 'module2_workflow', routes=('dashboard', 'courses', 'module2'), tags=('workflow', 'slow', 'student'))
     def test_module2_complete_workflow(self):
         """Test complete Module 2 workflow"""
         self.logger.add_log("Testing Module 2 complete workflow", "INFO")
@@ -147,9 +145,8 @@ class ModuleTests(BaseTest):
             if len(ver_contenidos_btns) >= 2:
                 module2_btn = ver_contenidos_btns[1]  # Assuming Module 2 is second
                 self.scroll_to_element(module2_btn)
-                module2_btn.click()
+                self.click_and_wait(module2_btn)
                 self.logger.add_log("Clicked 'Ver contenidos' for Module 2", "INFO")
-                time.sleep(2)
             else:
                 self.logger.add_log("Module 2 'Ver contenidos' button not found", "FAIL")
                 return False
@@ -167,15 +164,13 @@ class ModuleTests(BaseTest):
                     siguiente_btn = self.wait_for_clickable("xpath", "//button[contains(., 'Siguiente')]")
                     if siguiente_btn:
                         self.scroll_to_element(siguiente_btn)
-                        siguiente_btn.click()
-                        time.sleep(2)
+                        self.click_and_wait(siguiente_btn)
                 else:
                     # On last lesson, look for assessment button
                     reto_btn = self.wait_for_clickable("xpath", "//button[contains(., 'Reto') or contains(., 'Evaluación')]")
                     if reto_btn:
                         self.scroll_to_element(reto_btn)
-                        reto_btn.click()
-                        time.sleep(2)
+                        self.click_and_wait(reto_btn)
             
             # Verify we reached Module 2 assessment
             assessment_indicator = self.wait_for_element("xpath", "//*[contains(text(), 'Evaluación Juez Módulo 2') or contains(text(), 'Módulo 2')]", timeout=10)
@@ -191,6 +186,7 @@ class ModuleTests(BaseTest):
             self.take_screenshot("module2_workflow_error")
             return False
     
+    @register_test('test_lesson_navigation', 'lesson_navigation', routes=('dashboard', 'module1'), tags=('navigation',))
     def test_lesson_navigation_buttons(self):
         """Test lesson navigation button functionality"""
         self.logger.add_log("Testing lesson navigation buttons", "INFO")
@@ -203,7 +199,6 @@ class ModuleTests(BaseTest):
             
             # Navigate directly to a module lesson
             self.navigate_to("/module1/lesson1")
-            time.sleep(2)
             
             # Test "Siguiente" button
             siguiente_btn = self.find_element_safely("xpath", "//button[contains(., 'Siguiente')]")
@@ -211,8 +206,7 @@ class ModuleTests(BaseTest):
                 self.logger.add_log("'Siguiente' button found", "PASS")
                 
                 # Click and verify navigation
-                siguiente_btn.click()
-                time.sleep(2)
+                self.click_and_wait(siguiente_btn)
                 
                 # Check if URL changed or content changed
                 if "lesson2" in self.driver.current_url or self.find_element_safely("xpath", "//*[contains(text(), 'Lección 2')]"):
@@ -227,8 +221,7 @@ class ModuleTests(BaseTest):
             anterior_btn = self.find_element_safely("xpath", "//button[contains(., 'Anterior') or contains(., 'Atrás')]")
             if anterior_btn:
                 self.logger.add_log("'Anterior' button found", "PASS")
-                anterior_btn.click()
-                time.sleep(2)
+                self.click_and_wait(anterior_btn)
             
             return True
             
@@ -236,6 +229,7 @@ class ModuleTests(BaseTest):
             self.logger.add_log(f"Lesson navigation test failed: {str(e)}", "FAIL")
             return False
     
+    @register_test('test_assessment_load', 'assessment_load', routes=('dashboard', 'module1'), tags=('assessment',))
     def test_assessment_page_load(self):
         """Test that assessment pages load correctly"""
         self.logger.add_log("Testing assessment page load", "INFO")
@@ -248,21 +242,17 @@ class ModuleTests(BaseTest):
             
             # Test Module 1 assessment direct access
             self.navigate_to("/module1/assessment")
-            time.sleep(2)
             
-            # Look for assessment elements
+            # Look for assessment elements (one batched browser round trip)
             assessment_elements = [
-                "//*[contains(text(), 'Evaluación')]",
-                "//*[contains(text(), 'Juez')]",
-                "//*[contains(text(), 'Pregunta')]",
-                "//textarea",
-                "//button[contains(., 'Enviar') or contains(., 'Submit')]"
+                ("xpath", "//*[contains(text(), 'Evaluación')]"),
+                ("xpath", "//*[contains(text(), 'Juez')]"),
+                ("xpath", "//*[contains(text(), 'Pregunta')]"),
+                ("xpath", "//textarea"),
+                ("xpath", "//button[contains(., 'Enviar') or contains(., 'Submit')]")
             ]
             
-            found_elements = 0
-            for element_xpath in assessment_elements:
-                if self.find_element_safely("xpath", element_xpath):
-                    found_elements += 1
+            found_elements = sum(self.check_elements_present(assessment_elements).values())
             
             if found_elements >= 2:
                 self.logger.add_log("Assessment page loaded with expected elements", "PASS")
@@ -275,6 +265,7 @@ class ModuleTests(BaseTest):
             self.logger.add_log(f"Assessment page load test failed: {str(e)}", "FAIL")
             return False
     
+    @register_test('test_progress_tracking', 'progress_tracking', routes=('dashboard', 'courses'), tags=('progress', 'student'))
     def test_module_progress_tracking(self):
         """Test module progress tracking"""
         self.logger.add_log("Testing module progress tracking", "INFO")
@@ -293,17 +284,13 @@ class ModuleTests(BaseTest):
             
             # Look for progress indicators
             progress_elements = [
-                "//*[contains(text(), 'Progreso')]",
-                "//*[contains(text(), '%')]",
-                "//*[contains(@class, 'progress')]",
-                "//div[contains(@style, 'width')]"  # Progress bars often use width styling
+                ("xpath", "//*[contains(text(), 'Progreso')]"),
+                ("xpath", "//*[contains(text(), '%')]"),
+                ("xpath", "//*[contains(@class, 'progress')]"),
+                ("xpath", "//div[contains(@style, 'width')]")  # Progress bars often use width styling
             ]
             
-            found_progress = False
-            for element_xpath in progress_elements:
-                if self.find_element_safely("xpath", element_xpath):
-                    found_progress = True
-                    break
+            found_progress = any(self.check_elements_present(progress_elements).values())
             
             if found_progress:
                 self.logger.add_log("Progress tracking elements found", "PASS")
@@ -316,6 +303,7 @@ class ModuleTests(BaseTest):
             self.logger.add_log(f"Progress tracking test failed: {str(e)}", "FAIL")
             return False
     
+    @register_test('test_module_accessibility', 'module_accessibility', routes=('dashboard', 'courses', 'module1'), tags=('accessibility',))
     def test_module_accessibility(self):
         """Test module accessibility for different user roles"""
         self.logger.add_log("Testing module accessibility", "INFO")
@@ -333,7 +321,6 @@ class ModuleTests(BaseTest):
             accessible_count = 0
             for path in module_paths:
                 self.navigate_to(path)
-                time.sleep(2)
                 
                 # Check if page loads without error
                 if not ("404" in self.driver.page_source or "403" in self.driver.page_source or "Error" in self.driver.title):
@@ -363,12 +350,17 @@ class ModuleTests(BaseTest):
             
             # Test complete workflows
             results['module1_workflow'] = self.test_module1_complete_workflow()
+            self.reset_context()
             results['module2_workflow'] = self.test_module2_complete_workflow()
+            self.reset_context()
             
             # Test navigation and functionality
             results['lesson_navigation'] = self.test_lesson_navigation_buttons()
+            self.reset_context()
             results['assessment_load'] = self.test_assessment_page_load()
+            self.reset_context()
             results['progress_tracking'] = self.test_module_progress_tracking()
+            self.reset_context()
             results['module_accessibility'] = self.test_module_accessibility()
             
         except Exception as e:
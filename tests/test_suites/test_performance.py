@@ -0,0 +1,199 @@
+"""
+Page-Load Benchmark Suite for RavenCode Frontend
+Visits every route in NAVIGATION_PATHS, anonymous and logged in, and records
+Navigation Timing, paint, layout-shift, script-weight and API-call metrics from the
+Performance API, plus when each route's budget marker first rendered
+"""
+
+import json
+
+from selenium.common.exceptions import WebDriverException
+
+from base_test import BaseTest
+from stats import MetricTable
+from test_data.users import get_admin_user
+from config import NAVIGATION_PATHS, PERF_ITERATIONS, PERF_OBSERVER_SETTLE_MS, PERFORMANCE_BUDGETS
+
+
+# Injected before any app script runs: records when each budget marker XPath first
+# matches, checked on every DOM mutation and once per frame until all have rendered
+MARKER_WATCH_SCRIPT = """
+(function (xpaths) {
+    if (window.__ravencodeMarkers) { return; }
+    var seen = window.__ravencodeMarkers = {};
+    var check = function () {
+        xpaths.forEach(function (xpath) {
+            if (seen[xpath] === undefined && document.evaluate(
+                    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue) {
+                seen[xpath] = performance.now();
+            }
+        });
+        return Object.keys(seen).length < xpaths.length;
+    };
+    var frame = function () { if (check()) { requestAnimationFrame(frame); } };
+    new MutationObserver(check).observe(document, {childList: true, subtree: true});
+    requestAnimationFrame(frame);
+})(%s);
+"""
+
+
+# Collects the metrics of the current document; buffered observers replay LCP and
+# layout-shift entries recorded before the script ran
+PAGE_METRICS_SCRIPT = """
+var settleMs = arguments[0], marker = arguments[1], done = arguments[arguments.length - 1];
+var lcp = null, cls = 0, observers = [];
+var watch = function (type, handler) {
+    try {
+        var observer = new PerformanceObserver(function (list) { list.getEntries().forEach(handler); });
+        observer.observe({type: type, buffered: true});
+        observers.push(observer);
+    } catch (error) {}
+};
+watch('largest-contentful-paint', function (entry) { lcp = entry.renderTime || entry.loadTime || entry.startTime; });
+watch('layout-shift', function (entry) { if (!entry.hadRecentInput) { cls += entry.value; } });
+
+setTimeout(function () {
+    observers.forEach(function (observer) { observer.disconnect(); });
+    var nav = performance.getEntriesByType('navigation')[0];
+    var fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    var resources = performance.getEntriesByType('resource'), jsBytes = 0, apiRequests = 0;
+    resources.forEach(function (entry) {
+        if (entry.initiatorType === 'script') { jsBytes += entry.transferSize || entry.encodedBodySize || 0; }
+        if (entry.initiatorType === 'fetch' || entry.initiatorType === 'xmlhttprequest') { apiRequests++; }
+    });
+    var markers = window.__ravencodeMarkers || {};
+    done({
+        ttfb: nav ? nav.responseStart : null,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+        load: nav ? nav.loadEventEnd : null,
+        fcp: fcp ? fcp.startTime : null,
+        lcp: lcp,
+        cls: cls,
+        js_bytes: jsBytes,
+        api_requests: apiRequests,
+        marker_ms: marker && markers[marker] !== undefined ? markers[marker] : null,
+        final_path: window.location.pathname
+    });
+}, settleMs);
+"""
+
+# Metrics reported per route, in milliseconds except the unitless layout-shift score,
+# script bytes and API request count
+PAGE_METRICS = ['ttfb', 'dom_content_loaded', 'load', 'fcp', 'lcp', 'cls', 'js_bytes', 'api_requests', 'marker_ms']
+
+
+class PerformanceTests(BaseTest):
+    """Benchmark suite for page-load performance"""
+
+    def __init__(self, logger=None, driver_pool=None, iterations=None, routes=None):
+        super().__init__(logger, driver_pool=driver_pool)
+        self.iterations = iterations or PERF_ITERATIONS
+        self.routes = routes or NAVIGATION_PATHS
+        self.metrics = MetricTable()
+
+    def install_marker_watch(self):
+        """Register the budget-marker watcher to run on every new document (once per session)"""
+        if getattr(self.driver, '_ravencode_markers_installed', False):
+            return
+        markers = sorted({budget['marker'] for budget in PERFORMANCE_BUDGETS.values() if budget['marker']})
+        try:
+            self.driver.execute_cdp_cmd(
+                'Page.addScriptToEvaluateOnNewDocument', {'source': MARKER_WATCH_SCRIPT % json.dumps(markers)}
+            )
+            self.driver._ravencode_markers_installed = True
+        except (AttributeError, WebDriverException):
+            # Not a Chromium session: marker_ms stays unmeasured
+            pass
+
+    def measure_page(self, path, marker=None):
+        """Load a route and read its Performance API metrics (and when marker first rendered)"""
+        self.install_marker_watch()
+        self.navigate_to(path)
+        self.driver.set_script_timeout(max(5, PERF_OBSERVER_SETTLE_MS / 1000 * 10))
+        return self.driver.execute_async_script(PAGE_METRICS_SCRIPT, PERF_OBSERVER_SETTLE_MS, marker)
+
+    def benchmark_routes(self, session):
+        """Visit every route self.iterations times, recording one sample per visit"""
+        results = {}
+        for route_name, path in self.routes.items():
+            group = f"{route_name} ({session})"
+            collected = 0
+            marker = PERFORMANCE_BUDGETS.get(route_name, {}).get('marker')
+            for _ in range(self.iterations):
+                try:
+                    sample = self.measure_page(path, marker)
+                except Exception as e:
+                    self.logger.add_log(f"Could not measure {path} ({session}): {str(e)}", "WARN")
+                    continue
+
+                metrics = {name: sample.get(name) for name in PAGE_METRICS}
+                self.metrics.add(group, metrics)
+                self.logger.add_record({
+                    'kind': 'perf',
+                    'group': group,
+                    'route': route_name,
+                    'path': path,
+                    'session': session,
+                    'final_path': sample.get('final_path'),
+                    'metrics': metrics
+                })
+                collected += 1
+
+            results[f"{route_name}_{session}"] = collected == self.iterations
+            self.log_route_summary(group, collected)
+        return results
+
+    def log_route_summary(self, group, collected):
+        """Log median and p95 of the main metrics for one route"""
+        if not collected:
+            self.logger.add_log(f"{group}: no samples collected", "FAIL")
+            return
+
+        parts = []
+        for name in ('fcp', 'lcp', 'load'):
+            summary = self.metrics.summary(group, name)
+            if summary['count']:
+                parts.append(f"{name.upper()} p50 {summary['p50']:.0f}ms / p95 {summary['p95']:.0f}ms")
+        cls = self.metrics.summary(group, 'cls')
+        if cls['count']:
+            parts.append(f"CLS p50 {cls['p50']:.3f}")
+        self.logger.add_log(f"{group} [{collected} samples]: {', '.join(parts)}", "PASS")
+
+    def test_page_load_anonymous(self):
+        """Benchmark every route without a session (protected routes redirect to /login)"""
+        self.logger.add_log(f"Benchmarking {len(self.routes)} routes anonymously, {self.iterations} visits each", "INFO")
+        return self.benchmark_routes('anonymous')
+
+    def test_page_load_logged_in(self):
+        """Benchmark every route logged in as the admin user (so admin routes are reachable)"""
+        admin_user = get_admin_user()
+        if not self.login_user(admin_user['email'], admin_user['password']):
+            self.logger.add_log("Logged-in benchmark skipped: login failed", "FAIL")
+            return {f"{route_name}_logged_in": False for route_name in self.routes}
+
+        self.logger.add_log(f"Benchmarking {len(self.routes)} routes logged in, {self.iterations} visits each", "INFO")
+        return self.benchmark_routes('logged_in')
+
+    def run_all_tests(self):
+        """Run the page-load benchmark"""
+        self.logger.add_log("Starting Page-Load Benchmark Suite", "INFO")
+        results = {}
+
+        try:
+            self.setup_driver()
+
+            # Anonymous first, while the session is still clean
+            results.update(self.test_page_load_anonymous())
+            results.update(self.test_page_load_logged_in())
+
+        except Exception as e:
+            self.logger.add_log(f"Page-load benchmark failed: {str(e)}", "FAIL")
+        finally:
+            self.teardown_driver()
+
+        # Summary
+        passed = sum(1 for result in results.values() if result)
+        total = len(results)
+        self.logger.add_log(f"Page-load benchmark completed: {passed}/{total} route benchmarks complete", "INFO")
+
+        return results
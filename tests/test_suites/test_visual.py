@@ -0,0 +1,162 @@
+"""
+Visual Regression Test Suite for RavenCode Frontend
+Screenshots the key pages and compares them with stored baselines, so layout and
+styling regressions fail even when every UI_ELEMENTS locator still matches
+"""
+
+import os
+
+from base_test import BaseTest
+from registry import register_suite, register_test
+from test_data.users import get_admin_user
+from config import (
+    NAVIGATION_PATHS, VISUAL_PAGES, VISUAL_BASELINES_DIR, VISUAL_DIFF_DIR, VISUAL_UPDATE_BASELINES
+)
+
+
+# Stops animations, transitions and the caret so two captures of a settled page match
+FREEZE_PAGE_SCRIPT = """
+var style = document.createElement('style');
+style.textContent = '*, *::before, *::after { animation: none !important; transition: none !important; ' +
+    'caret-color: transparent !important; }';
+document.head.appendChild(style);
+if (document.activeElement) { document.activeElement.blur(); }
+"""
+
+# Screenshot-pixel boxes of every element matching each XPath
+ELEMENT_BOXES_SCRIPT = """
+var ratio = window.devicePixelRatio || 1, boxes = [];
+arguments[0].forEach(function (xpath) {
+    var found = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < found.snapshotLength; i++) {
+        var rect = found.snapshotItem(i).getBoundingClientRect();
+        boxes.push([rect.left * ratio, rect.top * ratio, rect.width * ratio, rect.height * ratio]);
+    }
+});
+return boxes;
+"""
+
+
+@register_suite('visual')
+class VisualTests(BaseTest):
+    """Visual regression checks for the key pages"""
+
+    def capture_page(self, page):
+        """Load a page, wait for its marker and freeze it; returns (png bytes, ignore regions)"""
+        settings = VISUAL_PAGES[page]
+        self.navigate_to(NAVIGATION_PATHS[page])
+        if not self.wait_for_element("xpath", settings['marker']):
+            return None, []
+
+        self.driver.execute_script(FREEZE_PAGE_SCRIPT)
+        locators = [region for region in settings['ignore'] if isinstance(region, str)]
+        regions = [region for region in settings['ignore'] if not isinstance(region, str)]
+        if locators:
+            regions += self.driver.execute_script(ELEMENT_BOXES_SCRIPT, locators)
+        return self.driver.get_screenshot_as_png(), regions
+
+    def check_page(self, page):
+        """Compare one page with its baseline (recording the baseline when there is none)"""
+        from visual import load_image, compare_images, write_diff_image
+
+        png, regions = self.capture_page(page)
+        if png is None:
+            self.logger.add_log(f"Visual check {page}: page marker never appeared", "FAIL")
+            self.take_screenshot(f"visual_{page}_not_loaded")
+            return False
+
+        baseline_path = os.path.join(VISUAL_BASELINES_DIR, f"{page}.png")
+        if VISUAL_UPDATE_BASELINES or not os.path.exists(baseline_path):
+            with open(baseline_path, 'wb') as stream:
+                stream.write(png)
+            self.logger.add_log(f"Visual check {page}: baseline recorded ({os.path.basename(baseline_path)})", "WARN")
+            self.logger.add_record({'kind': 'visual', 'page': page, 'passed': True, 'baseline_recorded': True})
+            return True
+
+        result = compare_images(load_image(baseline_path), load_image(png), regions)
+        diff_path = None
+        if result['size_mismatch']:
+            self.logger.add_log(
+                f"Visual check {page}: size differs ({result['size_mismatch']}); "
+                f"re-record with VISUAL_UPDATE_BASELINES=true",
+                "FAIL"
+            )
+        elif not result['passed']:
+            diff_path = write_diff_image(load_image(png), result, os.path.join(VISUAL_DIFF_DIR, f"{page}_diff.png"))
+            self.logger.add_log(
+                f"Visual check {page}: {len(result['failed_tiles'])}/{result['tiles']} tiles differ "
+                f"({result['changed_ratio'] * 100:.2f}% of pixels), diff: {os.path.basename(diff_path)}",
+                "FAIL"
+            )
+        else:
+            self.logger.add_log(
+                f"Visual check {page}: matches baseline ({result['changed_ratio'] * 100:.2f}% of pixels differ)", "PASS"
+            )
+
+        self.logger.add_record({
+            'kind': 'visual',
+            'page': page,
+            'passed': result['passed'],
+            'baseline_recorded': False,
+            'size_mismatch': result['size_mismatch'],
+            'changed_ratio': result['changed_ratio'],
+            'failed_tiles': len(result['failed_tiles']),
+            'tiles': result['tiles'],
+            'diff': diff_path
+        })
+        return result['passed']
+
+    def check_logged_in(self, page):
+        """Log in as the admin user (who can reach every key page) and check one page"""
+        admin_user = get_admin_user()
+        if not self.login_user(admin_user['email'], admin_user['password']):
+            return False
+        return self.check_page(page)
+
+    @register_test('test_visual_dashboard', 'dashboard', routes=('dashboard',), tags=('smoke', 'admin'))
+    def test_visual_dashboard(self):
+        """Dashboard matches its baseline"""
+        return self.check_logged_in('dashboard')
+
+    @register_test('test_visual_courses', 'courses', routes=('dashboard', 'courses'), tags=('admin',))
+    def test_visual_courses(self):
+        """Courses page matches its baseline"""
+        return self.check_logged_in('courses')
+
+    @register_test('test_visual_settings', 'settings', routes=('dashboard', 'settings'), tags=('admin',))
+    def test_visual_settings(self):
+        """Settings page matches its baseline"""
+        return self.check_logged_in('settings')
+
+    @register_test('test_visual_admin_dashboard', 'admin_dashboard', routes=('dashboard', 'admin'), tags=('admin',))
+    def test_visual_admin_dashboard(self):
+        """Admin dashboard matches its baseline"""
+        return self.check_logged_in('admin')
+
+    def run_all_tests(self):
+        """Run all visual regression checks"""
+        self.logger.add_log("Starting Visual Regression Test Suite", "INFO")
+        results = {}
+
+        try:
+            self.setup_driver()
+
+            results['dashboard'] = self.test_visual_dashboard()
+            self.reset_context()
+            results['courses'] = self.test_visual_courses()
+            self.reset_context()
+            results['settings'] = self.test_visual_settings()
+            self.reset_context()
+            results['admin_dashboard'] = self.test_visual_admin_dashboard()
+
+        except Exception as e:
+            self.logger.add_log(f"Visual regression suite failed: {str(e)}", "FAIL")
+        finally:
+            self.teardown_driver()
+
+        # Summary
+        passed = sum(1 for result in results.values() if result)
+        total = len(results)
+        self.logger.add_log(f"Visual regression tests completed: {passed}/{total} passed", "INFO")
+
+        return results
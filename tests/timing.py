@@ -0,0 +1,116 @@
+"""
+Step Timing for RavenCode Frontend Test Suite
+Nested timing spans (navigation, waits, clicks, login) tagged with the running test
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+from stats import summarize
+
+
+# Spans open on the current thread, innermost last
+_local = threading.local()
+
+SPAN_TABLE_HEADER = ['Step', 'Count', 'Total (s)', 'p50 (s)', 'p95 (s)', 'Max (s)']
+
+
+def _open_spans():
+    if not hasattr(_local, 'spans'):
+        _local.spans = []
+    return _local.spans
+
+
+def current_test():
+    """Name of the innermost test running on this thread"""
+    for record in reversed(_open_spans()):
+        if record['step'] == 'test':
+            return record['test']
+    return None
+
+
+@contextmanager
+def step_span(logger, step, **tags):
+    """Time a block as a span nested under whatever span is already open on this thread"""
+    spans = _open_spans()
+    record = {
+        'kind': 'span',
+        'step': step,
+        'test': tags.pop('test', None) or current_test(),
+        'parent': spans[-1]['step'] if spans else None,
+        'depth': len(spans),
+        'tags': tags
+    }
+    start_time = time.perf_counter()
+    spans.append(record)
+    try:
+        yield record
+    finally:
+        spans.pop()
+        record['duration'] = time.perf_counter() - start_time
+        logger.add_record(record)
+
+
+def timed_test(test_name, method):
+    """Wrap a test method in a top-level 'test' span carrying its name"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with step_span(self.logger, 'test', test=test_name):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class SpanTable:
+    """Accumulates span durations per step, per test and per step within each test"""
+    
+    def __init__(self):
+        self.by_step = {}
+        self.by_test = {}
+        self.by_test_step = {}
+        
+    def add(self, record):
+        """Add a record from the log stream (non-span entries are ignored)"""
+        if record.get('kind') != 'span':
+            return
+        if record['step'] == 'test':
+            self.by_test.setdefault(record['test'], []).append(record['duration'])
+        else:
+            self.by_step.setdefault(record['step'], []).append(record['duration'])
+            if record['test']:
+                steps = self.by_test_step.setdefault(record['test'], {})
+                steps.setdefault(record['step'], []).append(record['duration'])
+            
+    def rows(self, per_test=False):
+        """(name, summary) pairs, slowest total first"""
+        durations = self.by_test if per_test else self.by_step
+        rows = [(name, summarize(values)) for name, values in durations.items()]
+        return sorted(rows, key=lambda row: row[1]['total'], reverse=True)
+        
+    def table(self, per_test=False):
+        """Rows formatted for the report, header first"""
+        header = ['Test'] + SPAN_TABLE_HEADER[1:] if per_test else list(SPAN_TABLE_HEADER)
+        return [header] + [
+            [name or '-', str(summary['count']), f"{summary['total']:.2f}",
+             f"{summary['p50']:.3f}", f"{summary['p95']:.3f}", f"{summary['max']:.3f}"]
+            for name, summary in self.rows(per_test)
+        ]
+
+
+def log_step_timings(logger):
+    """Log the per-step timing table read back from the run's log stream"""
+    spans = SpanTable()
+    for record in logger.iter_logs():
+        spans.add(record)
+    if not spans.by_step:
+        return spans
+        
+    logger.add_log("STEP TIMINGS (count / total / p50 / p95 / max):", "INFO")
+    for name, summary in spans.rows():
+        logger.add_log(
+            f"  {name}: {summary['count']} / {summary['total']:.2f}s / {summary['p50']:.3f}s / "
+            f"{summary['p95']:.3f}s / {summary['max']:.3f}s",
+            "INFO"
+        )
+    return spans
@@ -0,0 +1,96 @@
+"""
+Visual Diff Engine for RavenCode Frontend Test Suite
+Tiled, vectorized comparison of page screenshots against stored baselines, with
+ignore regions and a diff image for failed checks
+"""
+
+import io
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from config import VISUAL_PIXEL_THRESHOLD, VISUAL_TILE_SIZE, VISUAL_TILE_TOLERANCE
+
+
+def load_image(source):
+    """RGB pixels (height x width x 3, uint8) from PNG bytes or a file path"""
+    image = Image.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+    return np.asarray(image.convert('RGB'))
+
+
+def ignore_mask(shape, regions):
+    """Boolean mask of the (x, y, width, height) regions to leave out of the comparison"""
+    mask = np.zeros(shape[:2], dtype=bool)
+    for x, y, width, height in regions:
+        mask[max(0, int(y)):max(0, int(y + height)), max(0, int(x)):max(0, int(x + width))] = True
+    return mask
+
+
+def _tile_sums(values, tile_size):
+    """Count of set pixels of a boolean mask in each tile_size x tile_size tile (edges zero-padded)"""
+    height, width = values.shape
+    rows, columns = -(-height // tile_size), -(-width // tile_size)
+    padded = np.zeros((rows * tile_size, columns * tile_size), dtype=np.uint8)
+    padded[:height, :width] = values
+    return padded.reshape(rows, tile_size, columns, tile_size).sum(axis=(1, 3), dtype=np.int64)
+
+
+def compare_images(baseline, candidate, ignore=(), pixel_threshold=None, tile_size=None, tile_tolerance=None):
+    """Compare two screenshots tile by tile
+
+    A pixel differs when any channel moves more than pixel_threshold; a tile fails when
+    more than tile_tolerance of its compared (not ignored) pixels differ.
+    """
+    pixel_threshold = VISUAL_PIXEL_THRESHOLD if pixel_threshold is None else pixel_threshold
+    tile_size = tile_size or VISUAL_TILE_SIZE
+    tile_tolerance = VISUAL_TILE_TOLERANCE if tile_tolerance is None else tile_tolerance
+
+    if baseline.shape != candidate.shape:
+        return {
+            'passed': False,
+            'size_mismatch': f"{baseline.shape[1]}x{baseline.shape[0]} baseline, "
+                             f"{candidate.shape[1]}x{candidate.shape[0]} screenshot",
+            'changed_ratio': 1.0,
+            'failed_tiles': [],
+            'tiles': 0
+        }
+
+    ignored = ignore_mask(baseline.shape, ignore)
+    # |a - b| in uint8 without widening, then the largest channel per pixel; reducing over a
+    # length-3 last axis with .max(axis=2) is an order of magnitude slower than this
+    delta = np.maximum(baseline, candidate)
+    delta -= np.minimum(baseline, candidate)
+    delta = np.maximum(np.maximum(delta[..., 0], delta[..., 1]), delta[..., 2])
+    changed = (delta > pixel_threshold) & ~ignored
+
+    changed_per_tile = _tile_sums(changed, tile_size)
+    compared_per_tile = _tile_sums(~ignored, tile_size)
+    ratio_per_tile = changed_per_tile / np.maximum(compared_per_tile, 1)
+    failed = np.argwhere(ratio_per_tile > tile_tolerance)
+
+    compared = int(compared_per_tile.sum())
+    return {
+        'passed': not len(failed),
+        'size_mismatch': None,
+        'changed_pixels': int(changed_per_tile.sum()),
+        'changed_ratio': changed_per_tile.sum() / compared if compared else 0.0,
+        'failed_tiles': [(int(column) * tile_size, int(row) * tile_size, tile_size, tile_size) for row, column in failed],
+        'tiles': int(ratio_per_tile.size),
+        'changed': changed,
+        'ignored': ignored
+    }
+
+
+def write_diff_image(candidate, result, path):
+    """Save the screenshot faded, with differing pixels in red, ignored regions in blue and failed tiles boxed"""
+    faded = (candidate.astype(np.uint16) + 255 * 2) // 3
+    overlay = faded.astype(np.uint8)
+    overlay[result['ignored']] = (overlay[result['ignored']] // 2 + np.array([0, 0, 120], dtype=np.uint8))
+    overlay[result['changed']] = (255, 0, 0)
+
+    image = Image.fromarray(overlay)
+    draw = ImageDraw.Draw(image)
+    for x, y, width, height in result['failed_tiles']:
+        draw.rectangle([x, y, x + width - 1, y + height - 1], outline=(255, 0, 255), width=2)
+    image.save(path, 'PNG', optimize=True)
+    return path
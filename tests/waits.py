@@ -0,0 +1,180 @@
+"""
+Wait Engine for RavenCode Frontend Test Suite
+Waits on real page readiness signals (route change, document ready, network idle,
+React idle) instead of fixed sleeps, always bounded by a timeout
+"""
+
+import time
+
+from config import READY_TIMEOUT, READY_QUIET_PERIOD_MS, READY_POLL_INTERVAL
+
+
+# Injected before any app script runs: counts in-flight fetch/XHR requests and
+# remembers when the network and the DOM were last active. Only nodes being added or
+# removed count as DOM activity: attribute and style churn from CSS/JS animations,
+# spinners and ticking text never stops, so it would keep a page from ever looking idle
+TRACKER_SCRIPT = """
+(function () {
+    if (window.__ravencodeWait) { return; }
+    var state = window.__ravencodeWait = {
+        pending: 0,
+        lastNetwork: performance.now(),
+        lastMutation: performance.now()
+    };
+    var started = function () { state.pending++; state.lastNetwork = performance.now(); };
+    var finished = function () { state.pending = Math.max(0, state.pending - 1); state.lastNetwork = performance.now(); };
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            started();
+            try {
+                return originalFetch.apply(this, arguments).finally(finished);
+            } catch (error) {
+                finished();
+                throw error;
+            }
+        };
+    }
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        started();
+        this.addEventListener('loadend', finished);
+        return originalSend.apply(this, arguments);
+    };
+
+    new MutationObserver(function () { state.lastMutation = performance.now(); })
+        .observe(document, {childList: true, subtree: true});
+})();
+"""
+
+STATUS_SCRIPT = """
+var state = window.__ravencodeWait;
+if (!state) { return null; }
+var now = performance.now();
+return {
+    pending: state.pending,
+    sinceNetwork: now - state.lastNetwork,
+    sinceMutation: now - state.lastMutation
+};
+"""
+
+# Resolves once the element's position stops changing between animation frames
+SCROLL_SETTLED_SCRIPT = """
+var element = arguments[0], done = arguments[arguments.length - 1];
+var last = null, stableFrames = 0;
+var check = function () {
+    var top = element.getBoundingClientRect().top;
+    stableFrames = (last !== null && Math.abs(top - last) < 1) ? stableFrames + 1 : 0;
+    last = top;
+    if (stableFrames >= 2) { done(true); } else { requestAnimationFrame(check); }
+};
+requestAnimationFrame(check);
+"""
+
+
+class PageWaiter:
+    """Readiness waits for one WebDriver session"""
+
+    def __init__(self, driver, timeout=None):
+        self.driver = driver
+        self.timeout = timeout or READY_TIMEOUT
+        self.quiet_period = READY_QUIET_PERIOD_MS
+        self.install_tracker()
+
+    def install_tracker(self):
+        """Register the tracker to run on every new document (once per session)"""
+        from selenium.common.exceptions import WebDriverException
+
+        if getattr(self.driver, '_ravencode_tracker_installed', False):
+            return
+        try:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': TRACKER_SCRIPT})
+            self.driver._ravencode_tracker_installed = True
+        except (AttributeError, WebDriverException):
+            # Not a Chromium session; the tracker is injected on demand instead
+            pass
+
+    def _until(self, condition, timeout):
+        """Poll a condition until it holds or the (bounded) timeout expires"""
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            WebDriverWait(
+                self.driver, max(timeout, 0), poll_frequency=READY_POLL_INTERVAL,
+                ignored_exceptions=(WebDriverException,)
+            ).until(
+                lambda driver: condition()
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _status(self):
+        status = self.driver.execute_script(STATUS_SCRIPT)
+        if status is None:
+            # Page loaded without the tracker; requests already in flight are invisible
+            self.driver.execute_script(TRACKER_SCRIPT)
+            status = self.driver.execute_script(STATUS_SCRIPT)
+        return status
+
+    def wait_for_document_ready(self, timeout=None):
+        """Wait for document.readyState to reach 'complete'"""
+        return self._until(
+            lambda: self.driver.execute_script("return document.readyState") == "complete", timeout
+        )
+
+    def wait_for_route_change(self, previous_url, timeout=None):
+        """Wait for the SPA router to move away from previous_url"""
+        return self._until(lambda: self.driver.current_url != previous_url, timeout)
+
+    def wait_for_network_idle(self, timeout=None):
+        """Wait until no fetch/XHR is in flight and none started during the quiet period"""
+        def idle():
+            status = self._status()
+            return status['pending'] == 0 and status['sinceNetwork'] >= self.quiet_period
+        return self._until(idle, timeout)
+
+    def wait_for_react_idle(self, timeout=None):
+        """Wait until React has stopped adding or removing DOM nodes for the quiet period
+
+        A page that re-renders its node tree forever (a list fed by polling, a
+        ticker that swaps elements) never gets there; pass react_idle=False to
+        wait_until_ready for those.
+        """
+        return self._until(lambda: self._status()['sinceMutation'] >= self.quiet_period, timeout)
+
+    def wait_for_scroll_settled(self, element, timeout=None):
+        """Wait until a scrolled-to element stops moving"""
+        from selenium.common.exceptions import WebDriverException
+
+        timeout = self.timeout if timeout is None else timeout
+        # The script timeout is session-wide: put the caller's back for later async scripts
+        previous_timeout = self.driver.timeouts.script
+        try:
+            self.driver.set_script_timeout(timeout)
+            return bool(self.driver.execute_async_script(SCROLL_SETTLED_SCRIPT, element))
+        except WebDriverException:
+            return False
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+    def wait_until_ready(self, previous_url=None, timeout=None, react_idle=True):
+        """Wait for every readiness signal, sharing one bounded time budget
+
+        react_idle=False skips the DOM quiet period, for pages that never stop re-rendering.
+        """
+        deadline = time.time() + (self.timeout if timeout is None else timeout)
+        remaining = lambda: max(0, deadline - time.time())
+
+        ready = True
+        if previous_url is not None:
+            ready = self.wait_for_route_change(previous_url, remaining()) and ready
+        ready = self.wait_for_document_ready(remaining()) and ready
+        ready = self.wait_for_network_idle(remaining()) and ready
+        if react_idle:
+            ready = self.wait_for_react_idle(remaining()) and ready
+        return ready